@@ -125,6 +125,13 @@ export type StructuredOutput =
     | { type: 'detailed_notes'; data: DetailedNotesData }
     | { type: 'multilingual'; data: MultilingualData }
 
+/** Partial LLM output streamed via UIDirective until the final answer arrives. */
+export const StreamingPreviewSchema = z.object({
+    component: z.string(),
+    text: z.string(),
+})
+export type StreamingPreview = z.infer<typeof StreamingPreviewSchema>
+
 export const ChatMessageSchema = z.object({
     id: z.string(),
     role: MessageRoleSchema,
@@ -135,6 +142,7 @@ export const ChatMessageSchema = z.object({
     interrupt: z.unknown().nullable().optional(),
     compliance: ComplianceDataSchema.optional(),
     refreshMeta: RefreshMetaSchema.optional(),
+    preview: StreamingPreviewSchema.optional(),
 })
 export type ChatMessage = z.infer<typeof ChatMessageSchema>
 
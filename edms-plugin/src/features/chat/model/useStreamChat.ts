@@ -21,6 +21,12 @@ interface StreamHandle {
     abort: () => void
 }
 
+/** UIDirective components that stream partial LLM text into the pending message. */
+const PREVIEW_COMPONENTS: ReadonlySet<string> = new Set([
+    'SummarizationPreview',
+    'ComparisonPreview',
+])
+
 function makeId(): string {
     return `${Date.now()}-${Math.random().toString(36).slice(2, 8)}`
 }
@@ -149,6 +155,24 @@ export function useStreamChat() {
                 if (event.data.thread_id) {
                     setThreadId(event.data.thread_id)
                 }
+                updateLastMessage((m) =>
+                    m.id === assistantMsgId && m.preview
+                        ? {...m, preview: undefined}
+                        : m,
+                )
+                break
+            }
+
+            case 'ui_update': {
+                const {component, props} = event.data.directive
+                const text = props.text
+                if (PREVIEW_COMPONENTS.has(component) && typeof text === 'string') {
+                    updateLastMessage((m) =>
+                        m.id === assistantMsgId
+                            ? {...m, preview: {component, text}}
+                            : m,
+                    )
+                }
                 break
             }
 
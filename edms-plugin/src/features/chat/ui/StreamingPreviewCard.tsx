@@ -0,0 +1,22 @@
+import { Loader2 } from 'lucide-react'
+import type { StreamingPreview } from '@/entities/message/model/types'
+
+const PREVIEW_TITLES: Record<string, string> = {
+    SummarizationPreview: 'Формирую анализ документа…',
+    ComparisonPreview: 'Формирую отчёт о различиях…',
+}
+
+/** Partial LLM text shown while the tool is still generating the final answer. */
+export function StreamingPreviewCard({preview}: { preview: StreamingPreview }) {
+    return (
+        <div className="bg-white text-zinc-900 border border-zinc-100/80 rounded-[20px] rounded-tl-[4px] shadow-sm px-5 py-4 animate-edms-fade-in">
+            <div className="flex items-center gap-2 mb-2 text-[11px] font-bold text-indigo-500 uppercase tracking-wider">
+                <Loader2 size={12} className="animate-spin"/>
+                {PREVIEW_TITLES[preview.component] ?? 'Генерация ответа…'}
+            </div>
+            <p className="text-[14px] text-zinc-600 leading-relaxed whitespace-pre-wrap m-0">
+                {preview.text}
+            </p>
+        </div>
+    )
+}
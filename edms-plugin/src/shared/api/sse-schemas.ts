@@ -59,6 +59,20 @@ const SseUiComponentEventSchema = z.object({
     }).passthrough(),
 })
 
+/** ``event: ui_update`` — non-blocking UIDirective (progress, streaming previews). */
+const SseUiUpdateEventSchema = z.object({
+    kind: z.literal('ui_update'),
+    data: z.object({
+        directive_id: z.string().nullable().optional(),
+        thread_id: z.string().optional(),
+        directive: z.object({
+            directive_id: z.string(),
+            component: z.string(),
+            props: z.record(z.unknown()).default({}),
+        }).passthrough(),
+    }),
+})
+
 const SseDoneEventSchema = z.object({
     kind: z.literal('done'),
     data: DoneEventSchema,
@@ -73,6 +87,7 @@ export const SseEventSchema = z.discriminatedUnion('kind', [
     SseMessageEventSchema,
     SseInterruptEventSchema,
     SseUiComponentEventSchema,
+    SseUiUpdateEventSchema,
     SseDoneEventSchema,
     SseErrorEventSchema,
 ])
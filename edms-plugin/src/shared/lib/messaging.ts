@@ -55,12 +55,24 @@ export interface UiComponentEvent {
     new_tab?: boolean
 }
 
+/** Payload carried by ``event: ui_update`` SSE frames (UIDirective). */
+export interface UiUpdateEvent {
+    directive_id?: string | null
+    thread_id?: string
+    directive: {
+        directive_id: string
+        component: string
+        props: Record<string, unknown>
+    }
+}
+
 // ── SSE streaming ───────────────────────────────────────────────────────
 
 export type SseEvent =
     | { kind: 'message'; data: MessageEvent }
     | { kind: 'interrupt'; data: InterruptEvent }
     | { kind: 'ui_component'; data: UiComponentEvent }
+    | { kind: 'ui_update'; data: UiUpdateEvent }
     | { kind: 'done'; data: DoneEvent }
     | { kind: 'error'; data: ErrorEvent }
 
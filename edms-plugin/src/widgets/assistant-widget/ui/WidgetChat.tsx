@@ -18,6 +18,7 @@ import {toast} from '@/shared/lib/toast'
 import {ChatMessage} from '@/shared/ui/ChatMessage'
 import {InterruptRenderer} from '@/shared/ui/InterruptRenderer'
 import {ComplianceCheckResult} from '@/features/chat/ui/structured/ComplianceCheckResult'
+import {StreamingPreviewCard} from '@/features/chat/ui/StreamingPreviewCard'
 import {cn} from '@shared/lib/cn'
 import type {ChatMessage as ChatMessageType} from '@entities/message/model/types'
 import type {InterruptPayload, ResumeValue} from '@entities/interrupt/model/types'
@@ -444,7 +445,8 @@ export function WidgetChat() {
                         loading &&
                         idx === messages.length - 1 &&
                         msg.role === 'assistant' &&
-                        msg.content === ''
+                        msg.content === '' &&
+                        !msg.preview
                     )
                         return null
 
@@ -462,7 +464,7 @@ export function WidgetChat() {
                     )
                 })}
 
-                {loading && messages[messages.length - 1]?.content === '' && (
+                {loading && messages[messages.length - 1]?.content === '' && !messages[messages.length - 1]?.preview && (
                     <div className="flex justify-start pl-2">
                         <TypingDots/>
                     </div>
@@ -687,6 +689,10 @@ function MessageRow({
                     />
                 )}
 
+                {!msg.content && msg.preview && msg.role === 'assistant' && (
+                    <StreamingPreviewCard preview={msg.preview}/>
+                )}
+
 
                 {msg.refreshMeta != null && msg.compliance == null && msg.role === 'assistant' && refreshLabel && (
                     <div style={{marginTop: msg.content ? 6 : 0}}>
@@ -6,6 +6,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from edms_ai_assistant.utils.regex_utils import UUID_RE
+
 if TYPE_CHECKING:
     from langchain_core.runnables import RunnableConfig
 
@@ -44,6 +46,8 @@ def get_document_id_from_config(config: RunnableConfig) -> str:
     """Извлекает document_id из LangGraph RunnableConfig.
 
     ID документа прокидывается из UI (context_ui_id) через _make_config().
+    Формат проверяется здесь, чтобы тулы отклоняли некорректный ID
+    до любых обращений к EDMS API.
     """
     if not config or not isinstance(config, dict):
         raise RuntimeError(
@@ -56,4 +60,7 @@ def get_document_id_from_config(config: RunnableConfig) -> str:
             "document_id not found in RunnableConfig. "
             "User must have an active document open in EDMS UI to use this tool."
         )
+    doc_id = str(doc_id).strip()
+    if not UUID_RE.match(doc_id):
+        raise RuntimeError(f"document_id '{doc_id[:64]}' is not a valid UUID.")
     return doc_id
@@ -21,10 +21,14 @@ Unlike ``InterruptPayload``, a ``UIDirective``:
 from __future__ import annotations
 
 import logging
-from typing import Any
+import uuid
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+
 logger = logging.getLogger(__name__)
 
 UI_DIRECTIVE_SCHEMA_VERSION: int = 1
@@ -93,6 +97,44 @@ def emit_ui(directive: UIDirective) -> None:
         logger.exception("emit_ui: failed to write UIDirective to stream")
 
 
+async def astream_with_preview(
+    stream: AsyncIterable[str],
+    component: str,
+    *,
+    emit_every: int = 400,
+) -> str:
+    """Drain a text stream, emitting the partial text as a UI preview.
+
+    Every ``emit_every`` new characters the accumulated text is sent as
+    ``UIDirective(component=component, props={"text": ...})`` with a stable
+    ``directive_id``, so the frontend replaces one preview in place.
+
+    Args:
+        stream: Async iterable of text pieces (e.g. LLM chunk contents).
+        component: Frontend preview component name.
+        emit_every: Minimum number of new characters between previews.
+
+    Returns:
+        The full concatenated text.
+    """
+    directive_id = f"{component}-{uuid.uuid4().hex[:12]}"
+    parts: list[str] = []
+    unsent = 0
+    async for piece in stream:
+        parts.append(piece)
+        unsent += len(piece)
+        if unsent >= emit_every:
+            unsent = 0
+            emit_ui(
+                UIDirective(
+                    directive_id=directive_id,
+                    component=component,
+                    props={"text": "".join(parts)},
+                )
+            )
+    return "".join(parts)
+
+
 # ── State helper ───────────────────────────────────────────────────────────
 
 
@@ -110,5 +152,6 @@ __all__ = [
     "UI_DIRECTIVE_SCHEMA_VERSION",
     "UIDirective",
     "UIDirectiveAdapter",
+    "astream_with_preview",
     "emit_ui",
 ]
@@ -5,11 +5,13 @@ Shared helper functions used across multiple API route modules.
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
+
 from edms_ai_assistant.utils.regex_utils import UUID_RE
 
 if TYPE_CHECKING:
@@ -61,16 +63,20 @@ async def resolve_user_context(
     return {"firstName": "Коллега"}
 
 
+_JSON_OBJECT_START_RE = re.compile(r"\s*\{")
+
+
 def unwrap_text_from_agent_result(content: str) -> str:
     """Extract plain text from agent result that may be a JSON envelope."""
-    if not content or not content.strip().startswith("{"):
+    # match() смотрит только на ведущие пробелы и «{» — без копии strip().
+    if not content or not _JSON_OBJECT_START_RE.match(content):
         return content
     try:
-        payload = json.loads(content)
+        payload = orjson.loads(content)
         for key in ("content", "text", "document_info"):
             val = payload.get(key)
             if val and isinstance(val, str) and len(val) > 50:
                 return val
-    except (json.JSONDecodeError, AttributeError):
+    except (orjson.JSONDecodeError, AttributeError):
         pass
     return content
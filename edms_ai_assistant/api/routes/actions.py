@@ -36,11 +36,14 @@ from edms_ai_assistant.summarizer.service import (
 from edms_ai_assistant.summarizer.structured.models import SummaryMode
 from edms_ai_assistant.tools.attachment import create_attachment_fetch_tool
 from edms_ai_assistant.utils.hash_utils import get_file_hash
+from edms_ai_assistant.utils.json_encoder import dumps_json_str
 from langchain_core.runnables import RunnableConfig
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from langchain_core.tools import StructuredTool
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Actions"])
@@ -52,6 +55,18 @@ _MODE_MAP: dict[str, SummaryMode] = {
 }
 
 
+# Инструмент строится один раз на контейнер зависимостей, а не на каждый запрос.
+_attachment_tool: tuple[AppDeps, StructuredTool] | None = None
+
+
+def _get_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
+    """Return the ``doc_get_file_content`` tool bound to ``deps`` (built once)."""
+    global _attachment_tool
+    if _attachment_tool is None or _attachment_tool[0] is not deps:
+        _attachment_tool = (deps, create_attachment_fetch_tool(deps))
+    return _attachment_tool[1]
+
+
 # ── Helper: build RunnableConfig for direct tool invocation ────────────────
 
 
@@ -164,7 +179,7 @@ async def _resolve_file_bytes(
                 thread_id="action_resolve",
                 user_id=uid,
             )
-            doc_get_file_content = create_attachment_fetch_tool(deps)
+            doc_get_file_content = _get_attachment_fetch_tool(deps)
             raw_result = await doc_get_file_content.ainvoke(
                 {"attachment_id": current_path},
                 config=tool_config,
@@ -314,7 +329,7 @@ async def api_direct_summarize(
 
             elif is_uuid and user_input.context_ui_id:
                 try:
-                    doc_get_file_content = create_attachment_fetch_tool(deps)
+                    doc_get_file_content = _get_attachment_fetch_tool(deps)
                     raw_result = await doc_get_file_content.ainvoke(
                         {"attachment_id": current_path},
                         config=tool_config,
@@ -393,7 +408,7 @@ async def api_direct_summarize(
     raw_text = ""
     try:
         if is_uuid and user_input.context_ui_id:
-            doc_get_file_content = create_attachment_fetch_tool(deps)
+            doc_get_file_content = _get_attachment_fetch_tool(deps)
             result = await doc_get_file_content.ainvoke(
                 {"attachment_id": current_path},
                 config=tool_config,
@@ -535,7 +550,7 @@ async def api_direct_summarize(
 
 def _sse(payload: dict) -> str:
     """Формирует одну SSE data-строку."""
-    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+    return f"data: {dumps_json_str(payload)}\n\n"
 
 
 @router.post(
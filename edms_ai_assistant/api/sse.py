@@ -21,9 +21,10 @@ Recognised event kinds:
 
 from __future__ import annotations
 
-import json
 from typing import Any, Final
 
+from edms_ai_assistant.utils.json_encoder import dumps_json_str
+
 SSE_KEEPALIVE: Final[bytes] = b": keepalive\n\n"
 
 
@@ -33,7 +34,7 @@ def format_sse(event: str, data: dict[str, Any]) -> str:
     ``data`` is serialised as a single JSON line — multi-line ``data:``
     fields are allowed by the spec but break a lot of naive clients.
     """
-    payload = json.dumps(data, ensure_ascii=False, default=str)
+    payload = dumps_json_str(data)
     return f"event: {event}\ndata: {payload}\n\n"
 
 
@@ -14,6 +14,8 @@ import json
 import re
 from typing import TYPE_CHECKING, Any
 
+from edms_ai_assistant.utils.json_encoder import dumps_json_str
+
 if TYPE_CHECKING:
     from langchain_core.messages import ToolMessage
 
@@ -103,12 +105,12 @@ def build_compliance_sse_event(data: dict) -> str:
         "stats": data.get("stats"),
         "fix_hint": data.get("fix_hint"),
     }
-    payload = json.dumps(event_data, ensure_ascii=False, default=str)
+    payload = dumps_json_str(event_data)
     return f"event: ui_component\ndata: {payload}\n\n"
 
 
 def build_navigate_sse_event(url: str) -> str:
     """Build an ``event: ui_component`` SSE frame for a navigate directive."""
     event_data = {"type": "navigate", "url": url}
-    payload = json.dumps(event_data, ensure_ascii=False)
+    payload = dumps_json_str(event_data)
     return f"event: ui_component\ndata: {payload}\n\n"
@@ -1,5 +1,6 @@
 # edms_ai_assistant/clients/attachment_client.py
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
 
@@ -79,6 +80,30 @@ class AttachmentClient(EdmsBaseClient):
         )
         return result
 
+    def stream_attachment_content(
+        self,
+        token: str,
+        document_id: UUID,
+        attachment_id: UUID,
+        is_additional: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """
+        Потоково скачать содержимое вложения (чанки байтов).
+        GET api/document/{documentId}/attachment/{id}
+        """
+        path = "additional-attachment" if is_additional else "attachment"
+        logger.info(
+            "Streaming content of attachment %s for document %s",
+            attachment_id,
+            document_id,
+        )
+        return self._stream_request(
+            "GET",
+            f"api/document/{document_id}/{path}/{attachment_id}",
+            token,
+            long_timeout=True,
+        )
+
     async def get_source_content(
         self, token: str, document_id: UUID, attachment_id: UUID
     ) -> bytes:
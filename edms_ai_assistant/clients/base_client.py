@@ -3,14 +3,18 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uuid import UUID
 
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from edms_ai_assistant.core.exceptions import EdmsError
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from edms_ai_assistant.clients.transport import IAsyncTransport
     from edms_ai_assistant.config import EdmsSettings
 
@@ -19,6 +23,16 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", bound=BaseModel)
 
 
+@lru_cache(maxsize=128)
+def _list_adapter(item_model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """TypeAdapter для ``list[item_model]``: строится один раз на модель."""
+    return TypeAdapter(list[item_model])
+
+
+def _is_json_syntax_error(exc: ValidationError) -> bool:
+    return any(err["type"] == "json_invalid" for err in exc.errors())
+
+
 class EdmsBaseClient:
     """Базовый клиент для EDMS API, использующий композицию транспорта."""
 
@@ -34,12 +48,16 @@ class EdmsBaseClient:
         *,
         params: dict[str, Any] | None = None,
         json_data: Any = None,
+        content: bytes | None = None,
         is_json_response: bool = True,
         long_timeout: bool = False,
         **kwargs: Any,
     ) -> Any:
         """
         Выполняет запрос через транспорт и извлекает полезную нагрузку.
+
+        ``content`` — уже сериализованное JSON-тело; передаётся как есть,
+        без повторного прохода ``_ensure_json_serializable``.
         """
         timeout = (
             self._settings.long_timeout if long_timeout else self._settings.timeout
@@ -55,6 +73,7 @@ class EdmsBaseClient:
             token=token,
             params=params,
             json=json_data,
+            content=content,
             timeout=timeout,
             **kwargs,
         )
@@ -71,6 +90,24 @@ class EdmsBaseClient:
             logger.error("Failed to decode JSON from %s %s", method, response.url)
             raise EdmsError(f"Invalid JSON response from EDMS, status: {response.status_code}")
 
+    async def _stream_request(
+        self,
+        method: str,
+        endpoint: str,
+        token: str,
+        *,
+        params: dict[str, Any] | None = None,
+        long_timeout: bool = False,
+    ) -> AsyncIterator[bytes]:
+        """Отдаёт тело ответа чанками, не буферизуя его целиком."""
+        timeout = (
+            self._settings.long_timeout if long_timeout else self._settings.timeout
+        )
+        async for chunk in self._transport.stream(
+            method, endpoint, token=token, params=params, timeout=timeout
+        ):
+            yield chunk
+
     async def _request_dto(
         self,
         method: str,
@@ -83,17 +120,30 @@ class EdmsBaseClient:
         long_timeout: bool = False,
         **kwargs: Any,
     ) -> T:
-        """Выполняет запрос и валидирует ответ в Pydantic модель."""
-        data = await self.make_request(
+        """Выполняет запрос и валидирует ответ в Pydantic модель.
+
+        Тело валидируется прямо из bytes (``model_validate_json``), без
+        промежуточного dict из ``response.json()``.
+        """
+        raw = await self.make_request(
             method,
             endpoint,
             token,
             params=params,
             json_data=json_data,
+            is_json_response=False,
             long_timeout=long_timeout,
             **kwargs,
         )
-        return response_model.model_validate(data)
+        if not raw:
+            return response_model.model_validate({})
+        try:
+            return response_model.model_validate_json(raw)
+        except ValidationError as exc:
+            if _is_json_syntax_error(exc):
+                logger.error("Failed to decode JSON from %s %s", method, endpoint)
+                raise EdmsError("Invalid JSON response from EDMS") from exc
+            raise
 
     async def _request_list(
         self,
@@ -107,25 +157,44 @@ class EdmsBaseClient:
         long_timeout: bool = False,
         **kwargs: Any,
     ) -> list[T]:
-        """Выполняет запрос и валидирует ответ в список Pydantic моделей."""
-        data = await self.make_request(
+        """Выполняет запрос и валидирует ответ в список Pydantic моделей.
+
+        JSON-массив валидируется из bytes одним вызовом pydantic-core;
+        Spring Page/Slice (``{"content": [...]}``) разбирается через orjson.
+        """
+        raw = await self.make_request(
             method,
             endpoint,
             token,
             params=params,
             json_data=json_data,
+            is_json_response=False,
             long_timeout=long_timeout,
             **kwargs,
         )
-        if not isinstance(data, list):
-            # Обработка Spring Page/Slice если нужно, или просто падение валидации
-            if isinstance(data, dict) and "content" in data:
-                data = data["content"]
-            else:
-                logger.warning("Expected list but got %s", type(data))
-                return []
-
-        return [item_model.model_validate(item) for item in data]
+        if not raw:
+            logger.warning("Expected list but got empty response")
+            return []
+
+        adapter = _list_adapter(item_model)
+        if raw.lstrip()[:1] == b"[":
+            try:
+                return cast("list[T]", adapter.validate_json(raw))
+            except ValidationError as exc:
+                if not _is_json_syntax_error(exc):
+                    raise
+                logger.error("Failed to decode JSON from %s %s", method, endpoint)
+                raise EdmsError("Invalid JSON response from EDMS") from exc
+
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError as exc:
+            logger.error("Failed to decode JSON from %s %s", method, endpoint)
+            raise EdmsError("Invalid JSON response from EDMS") from exc
+        if isinstance(data, dict) and "content" in data:
+            return cast("list[T]", adapter.validate_python(data["content"]))
+        logger.warning("Expected list but got %s", type(data))
+        return []
 
     def _ensure_json_serializable(self, data: Any) -> Any:
         """Рекурсивно преобразует UUID в строки."""
@@ -41,12 +41,13 @@ class DepartmentClient(EdmsBaseClient):
         """GET api/department/extended"""
         params = filter.model_dump(exclude_none=True) if filter else {}
         params.update({"page": page, "size": size})
-        result = await self.make_request(
-            "GET", "api/department/extended", token=token, params=params
+        return await self._request_list(
+            "GET",
+            "api/department/extended",
+            token,
+            DepartmentDto,
+            params=params,
         )
-        if isinstance(result, dict) and "content" in result:
-            return [DepartmentDto.model_validate(item) for item in result["content"]]
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_roots(
         self,
@@ -58,12 +59,13 @@ class DepartmentClient(EdmsBaseClient):
         """GET api/department/roots"""
         params = filter.model_dump(exclude_none=True) if filter else {}
         params.update({"page": page, "size": size})
-        result = await self.make_request(
-            "GET", "api/department/roots", token=token, params=params
+        return await self._request_list(
+            "GET",
+            "api/department/roots",
+            token,
+            DepartmentDto,
+            params=params,
         )
-        if isinstance(result, dict) and "content" in result:
-            return [DepartmentDto.model_validate(item) for item in result["content"]]
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_children(
         self,
@@ -76,15 +78,13 @@ class DepartmentClient(EdmsBaseClient):
         """GET api/department/child-departments/{id}"""
         params = filter.model_dump(exclude_none=True) if filter else {}
         params.update({"page": page, "size": size})
-        result = await self.make_request(
+        return await self._request_list(
             "GET",
             f"api/department/child-departments/{department_id}",
-            token=token,
+            token,
+            DepartmentDto,
             params=params,
         )
-        if isinstance(result, dict) and "content" in result:
-            return [DepartmentDto.model_validate(item) for item in result["content"]]
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_departments(
         self,
@@ -96,22 +96,26 @@ class DepartmentClient(EdmsBaseClient):
         """GET api/department"""
         params = search.model_dump(exclude_none=True) if search else {}
         params.update({"page": page, "size": size})
-        result = await self.make_request(
-            "GET", "api/department", token=token, params=params
+        return await self._request_list(
+            "GET",
+            "api/department",
+            token,
+            DepartmentDto,
+            params=params,
         )
-        if isinstance(result, dict) and "content" in result:
-            return [DepartmentDto.model_validate(item) for item in result["content"]]
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_department(
         self, token: str, department_id: UUID, filter: DepartmentFilter | None = None
     ) -> DepartmentDto:
         """GET api/department/{id}"""
         params = filter.model_dump(exclude_none=True) if filter else {}
-        result = await self.make_request(
-            "GET", f"api/department/{department_id}", token=token, params=params
+        return await self._request_dto(
+            "GET",
+            f"api/department/{department_id}",
+            token,
+            DepartmentDto,
+            params=params,
         )
-        return DepartmentDto.model_validate(result)
 
     async def get_employees(
         self,
@@ -124,58 +128,58 @@ class DepartmentClient(EdmsBaseClient):
         """GET api/department/{id}/employees"""
         params = search.model_dump(exclude_none=True) if search else {}
         params.update({"page": page, "size": size})
-        result = await self.make_request(
+        return await self._request_list(
             "GET",
             f"api/department/{department_id}/employees",
-            token=token,
+            token,
+            EmployeeDto,
             params=params,
         )
-        if isinstance(result, dict) and "content" in result:
-            return [EmployeeDto.model_validate(item) for item in result["content"]]
-        return [EmployeeDto.model_validate(item) for item in result]
 
     async def get_employees_all(
         self, token: str, department_id: UUID, filter: Any | None = None
     ) -> list[EmployeeDto]:
         """GET api/department/{id}/employees/all"""
         params = filter.model_dump(exclude_none=True) if filter else {}
-        result = await self.make_request(
+        return await self._request_list(
             "GET",
             f"api/department/{department_id}/employees/all",
-            token=token,
+            token,
+            EmployeeDto,
             params=params,
         )
-        return [EmployeeDto.model_validate(item) for item in result]
 
     async def get_path(self, token: str, department_id: UUID) -> list[DepartmentDto]:
         """GET api/department/getPath/{id}"""
-        result = await self.make_request(
-            "GET", f"api/department/getPath/{department_id}", token=token
+        return await self._request_list(
+            "GET",
+            f"api/department/getPath/{department_id}",
+            token,
+            DepartmentDto,
         )
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_without_children(
         self, token: str, department_id: UUID, page: int = 0, size: int = 20
     ) -> list[DepartmentDto]:
         """GET api/department/getAllWithoutChild/{id}"""
-        result = await self.make_request(
+        return await self._request_list(
             "GET",
             f"api/department/getAllWithoutChild/{department_id}",
-            token=token,
+            token,
+            DepartmentDto,
             params={"page": page, "size": size},
         )
-        if isinstance(result, dict) and "content" in result:
-            return [DepartmentDto.model_validate(item) for item in result["content"]]
-        return [DepartmentDto.model_validate(item) for item in result]
 
     async def get_deputy_leaders(
         self, token: str, department_id: UUID
     ) -> list[DeputyLeaderDepartmentDto]:
         """GET api/department/{id}/deputy-leader"""
-        result = await self.make_request(
-            "GET", f"api/department/{department_id}/deputy-leader", token=token
+        return await self._request_list(
+            "GET",
+            f"api/department/{department_id}/deputy-leader",
+            token,
+            DeputyLeaderDepartmentDto,
         )
-        return [DeputyLeaderDepartmentDto.model_validate(item) for item in result]
 
     async def create_department(
         self, token: str, department: DepartmentDto
@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from edms_ai_assistant.clients.base_client import EdmsBaseClient
 from edms_ai_assistant.core.exceptions import EdmsNotFoundError
 from edms_ai_assistant.domain.document import (
+    AttachmentDocumentDto,
     BpmnProcessActivityDto,
     ContractControlPointAttachmentDto,
     ContractControlPointDto,
@@ -41,6 +43,8 @@ from edms_ai_assistant.domain.document import (
     TasksAndProjectsDto,
     UserSmdoStat,
 )
+from edms_ai_assistant.utils.cache_utils import TTLCache
+from edms_ai_assistant.utils.hash_utils import get_token_fingerprint
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -68,6 +72,13 @@ FULL_DOC_INCLUDES: list[str] = [
     "ATTACHMENT",
 ]
 
+# Полные метаданные кэшируются на короткое время: агент обычно вызывает
+# несколько тулов подряд по одному документу.
+_METADATA_CACHE_SIZE: int = 256
+_METADATA_CACHE_TTL: float = 30.0
+_VERSIONS_CACHE_TTL: float = 120.0
+_DOCUMENT_ID_IN_PATH = re.compile(r"^/?api/document/([0-9a-fA-F-]{36})(?:/|$)")
+
 SEARCH_DOC_INCLUDES: list[str] = [
     "DOCUMENT_TYPE",
     "CORRESPONDENT",
@@ -80,6 +91,37 @@ class DocumentClient(EdmsBaseClient):
 
     def __init__(self, transport: IAsyncTransport, settings: EdmsSettings):
         super().__init__(transport, settings)
+        # document_id -> (token fingerprint, DocumentDto); DTO frozen, безопасно делить
+        self._metadata_cache: TTLCache[str, tuple[str, DocumentDto]] = TTLCache(
+            maxsize=_METADATA_CACHE_SIZE, ttl=_METADATA_CACHE_TTL
+        )
+        self._versions_cache: TTLCache[
+            str, tuple[str, tuple[DocumentVersionDto, ...]]
+        ] = TTLCache(maxsize=_METADATA_CACHE_SIZE, ttl=_VERSIONS_CACHE_TTL)
+
+    async def make_request(
+        self, method: str, endpoint: str, token: str, **kwargs: Any
+    ) -> Any:
+        """Любая мутация документа сбрасывает его закэшированные метаданные."""
+        if method != "GET":
+            match = _DOCUMENT_ID_IN_PATH.match(endpoint)
+            if match:
+                self.invalidate_document_cache(match.group(1))
+        return await super().make_request(method, endpoint, token, **kwargs)
+
+    def invalidate_document_cache(self, document_id: UUID | str) -> None:
+        """Drops cached full metadata and versions of ``document_id``."""
+        key = str(document_id).lower()
+        self._metadata_cache.pop(key)
+        self._versions_cache.pop(key)
+
+    def _cached_metadata(
+        self, token: str, document_id: UUID | str
+    ) -> DocumentDto | None:
+        entry = self._metadata_cache.get(str(document_id).lower())
+        if entry is None or entry[0] != get_token_fingerprint(token):
+            return None
+        return entry[1]
 
     async def search_documents(
         self,
@@ -110,18 +152,63 @@ class DocumentClient(EdmsBaseClient):
         document_id: UUID | str,
         includes: list[str] | None = None,
     ) -> DocumentDto | None:
-        """Fetches full document metadata by UUID."""
+        """Fetches full document metadata by UUID.
+
+        Full-include results are cached per document and token for
+        ``_METADATA_CACHE_TTL`` seconds; writes through this client invalidate.
+        """
+        if includes is None:
+            cached = self._cached_metadata(token, document_id)
+            if cached is not None:
+                logger.debug("Document metadata cache hit: %s", document_id)
+                return cached
+
         logger.info("Fetching document metadata for: %s", document_id)
         params = {"includes": includes or FULL_DOC_INCLUDES}
 
         try:
-            return await self._request_dto(
+            doc = await self._request_dto(
                 "GET", f"api/document/{document_id}", token, DocumentDto, params=params
             )
         except EdmsNotFoundError:
             logger.info("Document not found: %s", document_id)
             return None
 
+        if includes is None:
+            self._metadata_cache.set(
+                str(document_id).lower(), (get_token_fingerprint(token), doc)
+            )
+        return doc
+
+    async def get_document_attachments(
+        self, token: str, document_id: UUID | str
+    ) -> list[AttachmentDocumentDto] | None:
+        """Fetches only the attachment list of a document (None if not found).
+
+        Requests just the ATTACHMENT include and validates only the
+        ``attachmentDocument`` items instead of the full DocumentDto.
+        """
+        cached = self._cached_metadata(token, document_id)
+        if cached is not None:
+            return list(cached.attachment_document or [])
+
+        try:
+            raw = await self.make_request(
+                "GET",
+                f"api/document/{document_id}",
+                token,
+                params={"includes": ["ATTACHMENT"]},
+            )
+        except EdmsNotFoundError:
+            logger.info("Document not found: %s", document_id)
+            return None
+        if not isinstance(raw, dict) or not raw:
+            return None
+        return [
+            AttachmentDocumentDto.model_validate(item)
+            for item in raw.get("attachmentDocument") or []
+        ]
+
     async def get_document_with_permissions(
         self,
         token: str,
@@ -364,6 +451,21 @@ class DocumentClient(EdmsBaseClient):
             is_json_response=False,
         )
 
+    async def execute_document_operations_raw(
+        self,
+        token: str,
+        document_id: UUID | str,
+        operations_json: bytes,
+    ) -> None:
+        """Same as execute_document_operations, but takes a pre-serialized JSON body."""
+        await self.make_request(
+            "POST",
+            f"api/document/{document_id}/execute",
+            token,
+            content=operations_json,
+            is_json_response=False,
+        )
+
     async def complete_control_point(
         self, token: str, document_id: UUID, point_id: UUID
     ) -> ContractControlPointDto:
@@ -1061,14 +1163,29 @@ class DocumentClient(EdmsBaseClient):
     async def get_document_versions(
         self, token: str, document_id: UUID | str
     ) -> list[DocumentVersionDto]:
-        """Fetches all versions of a document."""
+        """Fetches all versions of a document, sorted by version number.
+
+        The sorted list is cached per document and token for
+        ``_VERSIONS_CACHE_TTL`` seconds; writes through this client invalidate.
+        """
+        key = str(document_id).lower()
+        fingerprint = get_token_fingerprint(token)
+        entry = self._versions_cache.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            logger.debug("Document versions cache hit: %s", document_id)
+            return list(entry[1])
+
         try:
-            return await self._request_list(
+            versions = await self._request_list(
                 "GET", f"api/document/{document_id}/version", token, DocumentVersionDto
             )
         except EdmsNotFoundError:
             return []
 
+        ordered = tuple(sorted(versions, key=lambda v: v.version or 0))
+        self._versions_cache.set(key, (fingerprint, ordered))
+        return list(ordered)
+
     async def start_document(self, token: str, document_id: UUID | str) -> None:
         """Starts the document routing process. Raises on failure."""
         await self.make_request(
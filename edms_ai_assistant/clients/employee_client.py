@@ -4,6 +4,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
+import orjson
+
 from edms_ai_assistant.clients.base_client import EdmsBaseClient
 from edms_ai_assistant.core.exceptions import EdmsNotFoundError
 from edms_ai_assistant.domain.employee import (
@@ -17,6 +19,8 @@ from edms_ai_assistant.domain.employee import (
     SliceDto,
     UserLoginHistoryEntryDto,
 )
+from edms_ai_assistant.utils.cache_utils import TTLCache
+from edms_ai_assistant.utils.hash_utils import get_token_fingerprint
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -32,12 +36,34 @@ _DEFAULT_PAGE: int = 0
 _DEFAULT_SIZE: int = 20
 _DEFAULT_INCLUDES: list[str] = ["POST", "DEPARTMENT"]
 
+# Повторные одинаковые поиски (карточки, уточнения) в пределах минуты
+# отдаются из кэша; ключ — отпечаток токена + канонический JSON запроса.
+_SEARCH_CACHE_SIZE: int = 512
+_SEARCH_CACHE_TTL: float = 60.0
+_SEARCH_ENDPOINT: str = "api/employee/search"
+
 
 class EmployeeClient(EdmsBaseClient):
     """Client for EDMS Employee API."""
 
     def __init__(self, transport: IAsyncTransport, settings: EdmsSettings):
         super().__init__(transport, settings)
+        # EmployeeDto frozen — кортежи результатов безопасно делить между вызовами
+        self._search_cache: TTLCache[tuple[str, bytes], tuple[EmployeeDto, ...]] = (
+            TTLCache(maxsize=_SEARCH_CACHE_SIZE, ttl=_SEARCH_CACHE_TTL)
+        )
+
+    async def make_request(
+        self, method: str, endpoint: str, token: str, **kwargs: Any
+    ) -> Any:
+        """Любая запись по сотрудникам сбрасывает кэш поиска."""
+        if method != "GET" and endpoint != _SEARCH_ENDPOINT:
+            self.clear_search_cache()
+        return await super().make_request(method, endpoint, token, **kwargs)
+
+    def clear_search_cache(self) -> None:
+        """Drops all cached ``search_employees_post`` results."""
+        self._search_cache.clear()
 
     async def search_employees(
         self,
@@ -86,26 +112,39 @@ class EmployeeClient(EdmsBaseClient):
         if "includes" not in eff_filter:
             eff_filter["includes"] = _DEFAULT_INCLUDES
 
-        return await self._request_list(
+        cache_key = (
+            get_token_fingerprint(token),
+            orjson.dumps(
+                (params, eff_filter), option=orjson.OPT_SORT_KEYS, default=str
+            ),
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Employee search cache hit")
+            return list(cached)
+
+        results = await self._request_list(
             "POST",
-            "api/employee/search",
+            _SEARCH_ENDPOINT,
             token,
             EmployeeDto,
             params=params,
             json_data=eff_filter,
         )
+        self._search_cache.set(cache_key, tuple(results))
+        return results
 
     async def get_employee(
         self, token: str, employee_id: str | UUID
     ) -> EmployeeDto | None:
         """Fetches a single employee by ID."""
-        logger.info(f"Fetching employee {employee_id}")
+        logger.info("Fetching employee %s", employee_id)
         try:
             return await self._request_dto(
                 "GET", f"api/employee/{employee_id}", token, EmployeeDto
             )
         except EdmsNotFoundError:
-            logger.error(f"Employee {employee_id} not found")
+            logger.error("Employee %s not found", employee_id)
             return None
 
     async def create_employee(
@@ -125,7 +164,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, request: EmployeeUpdateRequest
     ) -> EmployeeDto:
         """Updates an existing employee."""
-        logger.info(f"Updating employee {request.employee.id}")
+        logger.info("Updating employee %s", request.employee.id)
         return await self._request_dto(
             "PUT",
             "api/employee",
@@ -136,7 +175,7 @@ class EmployeeClient(EdmsBaseClient):
 
     async def delete_employees(self, token: str, employee_ids: list[UUID]) -> None:
         """Deletes employees by IDs."""
-        logger.info(f"Deleting employees: {employee_ids}")
+        logger.info("Deleting employees: %s", employee_ids)
         await self.make_request(
             "DELETE",
             "api/employee",
@@ -160,7 +199,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, last_name: str
     ) -> EmployeeDto | None:
         """Full-text search for employee by last name."""
-        logger.info(f"Searching employee by last name (FTS): {last_name}")
+        logger.info("Searching employee by last name (FTS): %s", last_name)
         try:
             return await self._request_dto(
                 "GET",
@@ -176,7 +215,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, employee_id: str | UUID
     ) -> list[RoleDto]:
         """Fetches roles for an employee."""
-        logger.info(f"Fetching roles for employee {employee_id}")
+        logger.info("Fetching roles for employee %s", employee_id)
         try:
             return await self._request_list(
                 "GET", f"api/employee/{employee_id}/role", token, RoleDto
@@ -188,7 +227,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, employee_id: str | UUID
     ) -> list[EmployeeAccessGriefDto]:
         """Fetches access griefs for an employee."""
-        logger.info(f"Fetching access griefs for employee {employee_id}")
+        logger.info("Fetching access griefs for employee %s", employee_id)
         try:
             return await self._request_list(
                 "GET",
@@ -216,7 +255,7 @@ class EmployeeClient(EdmsBaseClient):
 
     async def recover_employee(self, token: str, employee_id: str | UUID) -> None:
         """Recovers a dismissed employee."""
-        logger.info(f"Recovering employee {employee_id}")
+        logger.info("Recovering employee %s", employee_id)
         await self.make_request(
             "POST",
             "api/employee/recover",
@@ -254,7 +293,7 @@ class EmployeeClient(EdmsBaseClient):
 
     async def find_by_post_fts(self, token: str, post_name: str) -> list[EmployeeDto]:
         """GET api/employee/fts-post"""
-        logger.info(f"Searching employee by post (FTS): {post_name}")
+        logger.info("Searching employee by post (FTS): %s", post_name)
         return await self._request_list(
             "GET",
             "api/employee/fts-post",
@@ -267,7 +306,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, full_post_name: str
     ) -> list[EmployeeDto]:
         """GET api/employee/fts-full-post-name"""
-        logger.info(f"Searching employee by full post name (FTS): {full_post_name}")
+        logger.info("Searching employee by full post name (FTS): %s", full_post_name)
         return await self._request_list(
             "GET",
             "api/employee/fts-full-post-name",
@@ -280,14 +319,14 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, employee_id: UUID | str
     ) -> list[Any]:
         """GET api/employee/{id}/group"""
-        logger.info(f"Fetching groups for employee {employee_id}")
+        logger.info("Fetching groups for employee %s", employee_id)
         return await self.make_request(
             "GET", f"api/employee/{employee_id}/group", token=token
         )
 
     async def get_avatar(self, token: str, employee_id: UUID | str) -> bytes | None:
         """GET api/employee/{id}/avatar"""
-        logger.info(f"Fetching avatar for employee {employee_id}")
+        logger.info("Fetching avatar for employee %s", employee_id)
         try:
             return await self.make_request(
                 "GET",
@@ -302,7 +341,7 @@ class EmployeeClient(EdmsBaseClient):
         self, token: str, employee_id: UUID | str, file_name: str, file_content: bytes
     ) -> None:
         """POST api/employee/{id}/avatar"""
-        logger.info(f"Uploading avatar for employee {employee_id}")
+        logger.info("Uploading avatar for employee %s", employee_id)
         await self._upload_file(
             f"api/employee/{employee_id}/avatar",
             token,
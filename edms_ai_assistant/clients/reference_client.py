@@ -1,6 +1,7 @@
 # edms_ai_assistant/clients/reference_client.py
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
@@ -16,6 +17,7 @@ from edms_ai_assistant.domain.reference import (
     ReferenceItemDto,
     SubjectDto,
 )
+from edms_ai_assistant.utils.cache_utils import TTLCache
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -41,8 +43,19 @@ class ReferenceClient(EdmsBaseClient):
         "group": ("name", "shortName"),
     }
 
+    # Справочники почти статичны и общие для всех пользователей: кэшируем
+    # успешные поиски по нормализованному имени (без токена), только по TTL.
+    _LOOKUP_CACHE_SIZE: ClassVar[int] = 1024
+    _LOOKUP_CACHE_TTL: ClassVar[float] = 86400.0
+
     def __init__(self, transport: IAsyncTransport, settings: EdmsSettings):
         super().__init__(transport, settings)
+        self._entity_cache: TTLCache[tuple[str, str], ReferenceItemDto] = TTLCache(
+            maxsize=self._LOOKUP_CACHE_SIZE, ttl=self._LOOKUP_CACHE_TTL
+        )
+        self._city_cache: TTLCache[str, CityHierarchyDto] = TTLCache(
+            maxsize=self._LOOKUP_CACHE_SIZE, ttl=self._LOOKUP_CACHE_TTL
+        )
 
     async def find_entity_with_name(
         self,
@@ -55,6 +68,12 @@ class ReferenceClient(EdmsBaseClient):
             return None
 
         search_query = search_name.strip()
+        cache_key = (endpoint, search_query.casefold())
+        cached = self._entity_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Reference cache hit: %s '%s'", endpoint, search_query)
+            return cached
+
         logger.info(
             "Searching %s with name: %s", entity_label or endpoint, search_query
         )
@@ -92,12 +111,16 @@ class ReferenceClient(EdmsBaseClient):
             )
             if isinstance(record, dict) and record:
                 name = self._extract_canonical_name(record, endpoint) or search_query
-                return ReferenceItemDto(id=entity_id, name=name)
+                item = ReferenceItemDto(id=entity_id, name=name)
+                self._entity_cache.set(cache_key, item)
+                return item
         except EdmsNotFoundError:
             pass
 
         name = self._extract_canonical_name(fts_data, endpoint) or search_query
-        return ReferenceItemDto(id=entity_id, name=name)
+        item = ReferenceItemDto(id=entity_id, name=name)
+        self._entity_cache.set(cache_key, item)
+        return item
 
     def _extract_canonical_name(
         self, record: dict[str, Any], endpoint: str
@@ -127,6 +150,11 @@ class ReferenceClient(EdmsBaseClient):
         if not city_name or not city_name.strip():
             return None
 
+        cache_key = city_name.strip().casefold()
+        cached = self._city_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             fts_result = await self.make_request(
                 "GET",
@@ -155,7 +183,7 @@ class ReferenceClient(EdmsBaseClient):
             district = city_dto_raw.get("district") or {}
             region = district.get("region") or {}
 
-            return CityHierarchyDto(
+            hierarchy = CityHierarchyDto(
                 id=city_id,
                 name=city_dto_raw.get("nameCity") or city_name,
                 district_id=district.get("id"),
@@ -163,6 +191,8 @@ class ReferenceClient(EdmsBaseClient):
                 region_id=region.get("id"),
                 region_name=region.get("nameRegion"),
             )
+            self._city_cache.set(cache_key, hierarchy)
+            return hierarchy
         except EdmsNotFoundError:
             return None
 
@@ -334,15 +364,31 @@ class ReferenceClient(EdmsBaseClient):
         return str(result.id) if result and result.id else None
 
     async def find_delivery_method(self, token: str, name: str) -> str | None:
-        """Legacy helper: возвращает только id."""
-        result = await self.find_entity_with_name(
-            token, "delivery-method", name, "Способ доставки"
-        )
-        if not result and name != "Курьер":
-            result = await self.find_entity_with_name(
-                token, "delivery-method", "Курьер", "Способ доставки"
+        """Legacy helper: возвращает только id (с fallback на «Курьер»)."""
+        return await self.find_delivery_method_any(token, [name, "Курьер"])
+
+    async def find_delivery_method_any(
+        self, token: str, candidates: list[str | None]
+    ) -> str | None:
+        """Возвращает id первого найденного способа доставки из ``candidates``.
+
+        Кандидаты ищутся параллельно, приоритет определяется порядком в списке.
+        """
+        names = list(dict.fromkeys(c.strip() for c in candidates if c and c.strip()))
+        if not names:
+            return None
+        results = await asyncio.gather(
+            *(
+                self.find_entity_with_name(
+                    token, "delivery-method", name, "Способ доставки"
+                )
+                for name in names
             )
-        return str(result.id) if result and result.id else None
+        )
+        for result in results:
+            if result and result.id:
+                return str(result.id)
+        return None
 
     async def find_best_subject(self, token: str, text: str) -> str | None:
         """Ищет тематику обращения через FTS по тексту."""
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import httpx
 from tenacity import (
@@ -21,8 +21,22 @@ from edms_ai_assistant.core.exceptions import (
     EdmsValidationError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from edms_ai_assistant.config import EdmsSettings
+
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Пул соединений живёт весь процесс. Дефолтный keepalive httpx (5 с) короче
+# паузы между tool-вызовами агента (ожидание LLM), поэтому соединения
+# закрывались бы и TCP/TLS-рукопожатие повторялось бы на каждом шаге.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0
+)
+
 
 @runtime_checkable
 class IAsyncTransport(Protocol):
@@ -36,18 +50,48 @@ class IAsyncTransport(Protocol):
         token: str,
         params: dict[str, Any] | None = None,
         json: Any = None,
+        content: bytes | None = None,
         files: dict[str, Any] | None = None,
         timeout: int | None = None,
     ) -> httpx.Response: ...
 
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        token: str,
+        params: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> AsyncIterator[bytes]: ...
+
 
 class HttpxTransport(IAsyncTransport):
     """Реализация транспорта на базе httpx с ретраями только для серверных ошибок."""
 
-    def __init__(self, base_url: str, default_timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        default_timeout: int = 30,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+    ):
         self._client = httpx.AsyncClient(
             base_url=base_url.rstrip("/"),
             timeout=default_timeout,
+            limits=limits,
+        )
+
+    @classmethod
+    def from_settings(cls, edms_settings: EdmsSettings) -> HttpxTransport:
+        """Создаёт транспорт с таймаутом и пулом соединений из настроек EDMS."""
+        return cls(
+            base_url=str(edms_settings.base_url),
+            default_timeout=edms_settings.timeout,
+            limits=httpx.Limits(
+                max_connections=edms_settings.max_connections,
+                max_keepalive_connections=edms_settings.max_keepalive_connections,
+                keepalive_expiry=edms_settings.keepalive_expiry,
+            ),
         )
 
     @staticmethod
@@ -64,6 +108,7 @@ class HttpxTransport(IAsyncTransport):
         token: str,
         params: dict[str, Any] | None = None,
         json: Any = None,
+        content: bytes | None = None,
         files: dict[str, Any] | None = None,
         timeout: int | None = None,
     ) -> httpx.Response:
@@ -74,6 +119,7 @@ class HttpxTransport(IAsyncTransport):
             token=token,
             params=params,
             json=json,
+            content=content,
             files=files,
             timeout=timeout,
         )
@@ -93,6 +139,7 @@ class HttpxTransport(IAsyncTransport):
         token: str,
         params: dict[str, Any] | None = None,
         json: Any = None,
+        content: bytes | None = None,
         files: dict[str, Any] | None = None,
         timeout: int | None = None,
     ) -> httpx.Response:
@@ -101,6 +148,9 @@ class HttpxTransport(IAsyncTransport):
 
         if files:
             headers.pop("Content-Type", None)
+        elif content is not None:
+            # Тело уже сериализовано в JSON вызывающей стороной
+            headers["Content-Type"] = "application/json"
 
         try:
             response = await self._client.request(
@@ -109,6 +159,7 @@ class HttpxTransport(IAsyncTransport):
                 headers=headers,
                 params=params,
                 json=json,
+                content=content,
                 files=files,
                 timeout=timeout,
             )
@@ -119,6 +170,30 @@ class HttpxTransport(IAsyncTransport):
         await self._handle_status(response)
         return response
 
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        token: str,
+        params: dict[str, Any] | None = None,
+        timeout: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Потоковое чтение тела ответа чанками (без ретраев: тело одноразовое)."""
+        headers = self._get_headers(token)
+        try:
+            async with self._client.stream(
+                method, url, headers=headers, params=params, timeout=timeout
+            ) as response:
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    await self._handle_status(response)
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    yield chunk
+        except httpx.RequestError as exc:
+            logger.error("Network error during stream from %s: %s", url, exc)
+            raise EdmsConnectionError(str(exc), context={"url": url}) from exc
+
     @staticmethod
     async def _handle_status(response: httpx.Response) -> None:
         """Маппинг HTTP статус-кодов в доменные исключения."""
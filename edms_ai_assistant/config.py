@@ -30,6 +30,11 @@ class EdmsSettings(BaseSettings):
     long_timeout: int = Field(default=120, ge=10, le=600)
     api_version: str = "v1"
 
+    # Пул HTTP-соединений к EDMS (общий для всех клиентов процесса)
+    max_connections: int = Field(default=100, ge=1)
+    max_keepalive_connections: int = Field(default=50, ge=0)
+    keepalive_expiry: float = Field(default=60.0, ge=0)
+
     # Реквизиты для авторизации (если токен получается по client_credentials)
     client_id: SecretStr | None = None
     client_secret: SecretStr | None = None
@@ -151,6 +156,8 @@ class Settings(BaseSettings):
     LLM_MAX_RETRIES: int = Field(default=3, ge=0, le=10)
     LLM_REQUEST_TIMEOUT: int = Field(default=120, ge=10, le=600)
     LLM_STREAM_USAGE: bool = False
+    # prompt_cache_key для OpenAI-совместимых бэкендов (маршрутизация на тёплый кэш)
+    LLM_PROMPT_CACHE_KEY: bool = False
 
     # Ollama local-backend specific
     LLM_OLLAMA_NUM_CTX: int = Field(default=4096, ge=512, le=131072)
@@ -231,6 +238,13 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "./uploads"
     MAX_FILE_SIZE_MB: int = Field(default=50, ge=1, le=500)
     ALLOWED_FILE_EXTENSIONS: str = ".docx,.doc,.pdf,.txt,.rtf,.xlsx,.xls,.pptx"
+    FILE_PARSE_PROCESSES: int = Field(
+        default_factory=lambda: min(4, os.cpu_count() or 1),
+        ge=0,
+        le=64,
+        description="Процессов для парсинга файлов (0 — парсинг в потоках)",
+    )
+    FILE_PARSE_TIMEOUT: float = Field(default=120.0, ge=5.0, le=1800.0)
 
     # ── Agent Configuration ──────────────────────────────────────────────────
     AGENT_MAX_ITERATIONS: int = Field(default=15, ge=1, le=50)
@@ -271,8 +285,21 @@ class Settings(BaseSettings):
     SUMMARIZER_CONTEXT_WINDOW: int = Field(default=4096)
     SUMMARIZER_QUALITY_MODEL: str | None = Field(default=None)
     SUMMARIZER_MAX_CONCURRENT_MAP: int = Field(default=6, ge=1, le=50)
+    SUMMARIZER_MAX_CONCURRENT_LLM: int = Field(
+        default=8,
+        ge=1,
+        le=100,
+        description="Global cap on in-flight summarizer LLM requests (all tools)",
+    )
     SUMMARIZER_L1_TTL_SECONDS: int = Field(default=3600)
     SUMMARIZER_L2_TTL_SECONDS: int = Field(default=2_592_000)
+    SUMMARIZER_LOCAL_EXTRACTIVE: bool = Field(
+        default=False,
+        description=(
+            "Короткие документы в формате extractive отбирать локально "
+            "(TextRank), без вызова LLM"
+        ),
+    )
 
     # ── Validators ───────────────────────────────────────────────────────────
 
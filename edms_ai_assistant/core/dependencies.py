@@ -47,8 +47,7 @@ def get_edms_settings() -> EdmsSettings:
 
 @lru_cache
 def get_transport() -> HttpxTransport:
-    s = get_edms_settings()
-    return HttpxTransport(base_url=str(s.base_url), default_timeout=s.timeout)
+    return HttpxTransport.from_settings(get_edms_settings())
 
 
 @lru_cache
@@ -141,20 +140,21 @@ def get_chat_model() -> Any:
 # ── Сервисы ──────────────────────────────────────────────────────────────
 
 
+# Stateless NLP-сервисы создаются один раз на процесс, а не на каждый запрос.
+@lru_cache
 def get_entity_extractor() -> EntityExtractor:
     return EntityExtractor()
 
 
+@lru_cache
 def get_query_refiner() -> QueryRefiner:
     return QueryRefiner()
 
 
-def get_nlp_service(
-    entity_extractor: Annotated[EntityExtractor, Depends(get_entity_extractor)],
-    query_refiner: Annotated[QueryRefiner, Depends(get_query_refiner)],
-) -> EDMSNaturalLanguageService:
+@lru_cache
+def get_nlp_service() -> EDMSNaturalLanguageService:
     return EDMSNaturalLanguageService(
-        entity_extractor=entity_extractor, query_refiner=query_refiner
+        entity_extractor=get_entity_extractor(), query_refiner=get_query_refiner()
     )
 
 
@@ -207,10 +207,21 @@ def get_introduction_service(
     )
 
 
+# Сервис stateless, но в __init__ делает llm.bind() и собирает цепочку —
+# держим один экземпляр на инстанс LLM. После reset_chat_model() get_chat_model
+# вернёт новый объект, и сервис пересоберётся сам.
+_appeal_extraction_service: tuple[Any, AppealExtractionService] | None = None
+
+
 def get_appeal_extraction_service(
     llm: Annotated[Any, Depends(get_chat_model)],
 ) -> AppealExtractionService:
-    return AppealExtractionService(llm=llm)
+    global _appeal_extraction_service
+    cached = _appeal_extraction_service
+    if cached is None or cached[0] is not llm:
+        cached = (llm, AppealExtractionService(llm=llm))
+        _appeal_extraction_service = cached
+    return cached[1]
 
 
 def get_appeal_autofill_service(
@@ -232,7 +243,8 @@ def get_appeal_autofill_service(
 
 
 def get_file_processor_service() -> FileProcessorService:
-    return FileProcessorService()
+    # Общий экземпляр: новый на каждый запрос порождал бы свой пул потоков
+    return FileProcessorService._get_default_instance()
 
 
 def get_subject_service(
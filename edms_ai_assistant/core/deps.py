@@ -165,7 +165,11 @@ def init_deps(
     introduction_service = IntroductionService(
         resolution_service=resolution_service, document_client=document_client
     )
-    file_processor_service = FileProcessorService()
+    file_processor_service = FileProcessorService(
+        process_workers=settings.FILE_PARSE_PROCESSES,
+        parse_timeout=settings.FILE_PARSE_TIMEOUT,
+    )
+    FileProcessorService.set_default_instance(file_processor_service)
 
     return AppDeps(
         transport=transport,
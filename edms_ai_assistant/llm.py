@@ -6,13 +6,14 @@ LLM and Embedding model initialization.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from edms_ai_assistant.config import settings
 
 if TYPE_CHECKING:
     from langchain_core.embeddings import Embeddings
     from langchain_core.language_models import BaseChatModel
+    from langchain_core.messages import BaseMessage
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +202,51 @@ def get_chat_model() -> BaseChatModel:
         raise RuntimeError(f"Failed to initialize ChatOpenAI: {exc}") from exc
 
 
+def log_prompt_cache_usage(response: BaseMessage, *, operation: str) -> None:
+    """Log provider-side prompt cache hits for cost tracking.
+
+    OpenAI-compatible backends cache the longest invariant prompt prefix
+    automatically (≥1024 tokens), so callers must keep static instructions
+    first and variable document text last. Reported fields:
+    ``cache_read`` / ``cache_creation`` from LangChain ``usage_metadata``.
+
+    Args:
+        response: LLM response message.
+        operation: Short label of the calling operation for the log line.
+    """
+    usage: dict[str, Any] = getattr(response, "usage_metadata", None) or {}
+    details: dict[str, Any] = usage.get("input_token_details") or {}
+    logger.debug(
+        "LLM prompt cache usage: op=%s input=%s cache_read=%s cache_creation=%s",
+        operation,
+        usage.get("input_tokens"),
+        details.get("cache_read", 0),
+        details.get("cache_creation", 0),
+    )
+
+
+def prompt_cache_kwargs(cache_key: str) -> dict[str, Any]:
+    """Per-call kwargs that pin a static prompt prefix to a warm provider cache.
+
+    The prefix itself must already be byte-identical between calls; the key
+    only routes such requests to the same cache shard (OpenAI
+    ``prompt_cache_key``). Enabled by ``LLM_PROMPT_CACHE_KEY`` and only for
+    the ``openai`` backend — Ollama reuses the prefix KV on its own.
+
+    Args:
+        cache_key: Stable identifier of the prompt prefix.
+
+    Returns:
+        Keyword arguments for ``invoke`` / ``astream`` (possibly empty).
+    """
+    if not settings.LLM_PROMPT_CACHE_KEY:
+        return {}
+    base_url = _normalize_url(settings.LLM_GENERATIVE_URL)
+    if _detect_backend(base_url, settings.LLM_GENERATIVE_MODEL) != "openai":
+        return {}
+    return {"prompt_cache_key": cache_key}
+
+
 def get_embedding_model() -> Embeddings:
     """Create or return cached embedding model instance from current runtime settings.
 
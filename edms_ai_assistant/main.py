@@ -78,9 +78,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     import redis.asyncio as aioredis
 
     redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-    transport = HttpxTransport(
-        base_url=str(edms_settings.base_url), default_timeout=edms_settings.timeout
-    )
+    transport = HttpxTransport.from_settings(edms_settings)
     llm = get_chat_model()
 
     state: _AppState = _app.state
@@ -110,6 +108,7 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
 
     await redis.close()
     await transport.close()
+    deps.file_processor_service.shutdown()
 
     service = getattr(state, "summarization_service", None)
     if service is not None:
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re as _re
 from dataclasses import dataclass
@@ -24,7 +24,7 @@ from edms_ai_assistant.domain.document import (
 )
 from edms_ai_assistant.domain.enums import DeclarantType, DocCategory
 from edms_ai_assistant.utils.file_utils import extract_text_from_bytes
-from edms_ai_assistant.utils.json_encoder import CustomJSONEncoder
+from edms_ai_assistant.utils.json_encoder import dumps_json_bytes
 
 if TYPE_CHECKING:
     from langchain_core.language_models.chat_models import BaseChatModel
@@ -38,6 +38,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Значение -> член enum: конвертация без ValueError на промахе
+_DECLARANT_TYPES: dict[str, DeclarantType] = {e.value: e for e in DeclarantType}
+
 
 @dataclass(frozen=True)
 class AutofillResult:
@@ -126,19 +129,26 @@ class DocumentOperationExecutor:
         client: DocumentClient,
         token: str,
         document_id: str,
-        operation_type: str,
-        body: dict[str, Any],
+        operations: list[tuple[str, dict[str, Any]]],
     ) -> None:
-        payload = [{"operationType": operation_type, "body": body}]
-        json_safe_payload = json.loads(json.dumps(payload, cls=CustomJSONEncoder))
+        """Отправляет все операции одним POST /execute (порядок сохраняется)."""
+        payload = [
+            {"operationType": operation_type, "body": body}
+            for operation_type, body in operations
+        ]
+        # Сериализуем один раз и отправляем как есть — без loads/dumps по кругу.
+        payload_json = dumps_json_bytes(payload)
+        operation_types = [operation_type for operation_type, _ in operations]
 
         try:
-            await client.execute_document_operations(
-                token, document_id, json_safe_payload
+            await client.execute_document_operations_raw(
+                token, document_id, payload_json
             )
-            logger.info("%s executed successfully", operation_type)
+            logger.info("%s executed successfully", ", ".join(operation_types))
         except Exception as e:
-            logger.error("%s failed: %s", operation_type, e, exc_info=True)
+            logger.error(
+                "%s failed: %s", ", ".join(operation_types), e, exc_info=True
+            )
             raise
 
 
@@ -318,6 +328,28 @@ class GeographyResolver:
 
 
 class AppealFieldsBuilder:
+    # Поля, которые передаются в EDMS даже со значением null (сброс значения)
+    ALLOW_NULL: ClassVar[frozenset[str]] = frozenset(
+        {
+            "correspondentAppeal",
+            "correspondentAppealId",
+            "submissionForm",
+            "organizationName",
+            "signed",
+            "correspondentOrgNumber",
+            "fioApplicant",
+            "fullAddress",
+            "phone",
+            "email",
+            "index",
+            "receiptDate",
+            "dateDocCorrespondentOrg",
+            "collective",
+            "anonymous",
+            "reasonably",
+        }
+    )
+
     def __init__(self, ref_client: ReferenceClient, token: str) -> None:
         self.ref_client = ref_client
         self.token = token
@@ -441,10 +473,9 @@ class AppealFieldsBuilder:
         d: DocumentAppealDto, fields: AppealFields, payload: dict[str, Any]
     ) -> None:
         if fields.declarantType:
-            try:
-                payload["declarantType"] = DeclarantType(fields.declarantType.upper())
-            except (ValueError, AttributeError):
-                payload["declarantType"] = DeclarantType.INDIVIDUAL
+            payload["declarantType"] = _DECLARANT_TYPES.get(
+                str(fields.declarantType).upper(), DeclarantType.INDIVIDUAL
+            )
         elif d.declarant_type:
             payload["declarantType"] = d.declarant_type
         else:
@@ -527,32 +558,27 @@ class AppealFieldsBuilder:
         if d.nomenclature_affair_id:
             payload["nomenclatureAffairId"] = str(d.nomenclature_affair_id)
 
-    @staticmethod
-    def _filter_payload(payload: dict[str, Any]) -> dict[str, Any]:
-        _ALLOW_NULL = {
-            "correspondentAppeal",
-            "correspondentAppealId",
-            "submissionForm",
-            "organizationName",
-            "signed",
-            "correspondentOrgNumber",
-            "fioApplicant",
-            "fullAddress",
-            "phone",
-            "email",
-            "index",
-            "receiptDate",
-            "dateDocCorrespondentOrg",
-            "collective",
-            "anonymous",
-            "reasonably",
-        }
-        filtered = {
-            k: v for k, v in payload.items() if v is not None or k in _ALLOW_NULL
-        }
-        if not filtered.get("declarantType"):
-            filtered["declarantType"] = DeclarantType.INDIVIDUAL
-        return filtered
+    @classmethod
+    def _filter_payload(cls, payload: dict[str, Any]) -> dict[str, Any]:
+        # Фильтруем на месте: без второго словаря того же размера
+        for key in [
+            k for k, v in payload.items() if v is None and k not in cls.ALLOW_NULL
+        ]:
+            del payload[key]
+        if not payload.get("declarantType"):
+            payload["declarantType"] = DeclarantType.INDIVIDUAL
+        return payload
+
+
+_SUMMARY_VARIANTS_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "Сформулируй РОВНО 3 варианта краткого содержания обращения (до 80 симв).",
+        ),
+        ("user", "Текст:\n{text}"),
+    ]
+)
 
 
 class AppealAutofillService:
@@ -571,6 +597,9 @@ class AppealAutofillService:
         self.ref_client = ref_client
         self.extraction_service = extraction_service
         self.chat_model = chat_model
+        self._summary_variants_chain = (
+            _SUMMARY_VARIANTS_PROMPT | chat_model | StrOutputParser()
+        )
 
     async def process_and_fill(
         self,
@@ -627,7 +656,10 @@ class AppealAutofillService:
         )
         if not file_bytes:
             return ""
-        return extract_text_from_bytes(file_bytes, attachment.name or "")
+        # pypdf/docx2txt блокируют — парсим вне event loop
+        return await asyncio.to_thread(
+            extract_text_from_bytes, file_bytes, attachment.name or ""
+        )
 
     async def _update_document(
         self,
@@ -637,10 +669,13 @@ class AppealAutofillService:
         fields: AppealFields,
         extracted_text: str,
     ) -> None:
-        await self._execute_main_fields_update(token, document_id, document, fields)
-
+        # Способ доставки и география — независимые справочники одного
+        # общего ReferenceClient: запрашиваем параллельно.
         geo_resolver = GeographyResolver(self.ref_client, token)
-        geo_data = await geo_resolver.resolve_geography(document, fields)
+        main_payload, geo_data = await asyncio.gather(
+            self._build_main_fields_payload(token, document, fields),
+            geo_resolver.resolve_geography(document, fields),
+        )
         fields_builder = AppealFieldsBuilder(self.ref_client, token)
         appeal_payload = await fields_builder.build(
             document, fields, extracted_text, geo_data
@@ -650,13 +685,15 @@ class AppealAutofillService:
             self.doc_client,
             token,
             document_id,
-            "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE",
-            appeal_payload,
+            [
+                ("DOCUMENT_MAIN_FIELDS_UPDATE", main_payload),
+                ("DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE", appeal_payload),
+            ],
         )
 
-    async def _execute_main_fields_update(
-        self, token: str, document_id: str, document: DocumentDto, fields: AppealFields
-    ) -> None:
+    async def _build_main_fields_payload(
+        self, token: str, document: DocumentDto, fields: AppealFields
+    ) -> dict[str, Any]:
         delivery_id = document.delivery_method_id
         if not delivery_id:
             name = fields.deliveryMethod or "Электронно"
@@ -666,36 +703,20 @@ class AppealAutofillService:
         if raw_summary and len(raw_summary) > 80:
             raw_summary = raw_summary[:80]
 
-        main_payload = {
-            "shortSummary": raw_summary,
-            "deliveryMethodId": delivery_id,
-            "documentTypeId": (
-                str(document.document_type.id) if document.document_type else None
-            ),
-        }
-        await DocumentOperationExecutor.execute(
-            self.doc_client,
-            token,
-            document_id,
-            "DOCUMENT_MAIN_FIELDS_UPDATE",
-            {k: v for k, v in main_payload.items() if v is not None},
-        )
+        main_payload: dict[str, Any] = {}
+        if raw_summary is not None:
+            main_payload["shortSummary"] = raw_summary
+        if delivery_id is not None:
+            main_payload["deliveryMethodId"] = delivery_id
+        if document.document_type:
+            main_payload["documentTypeId"] = str(document.document_type.id)
+        return main_payload
 
     async def generate_summary_variants(
         self, text: str, current_summary: str | None
     ) -> list[str]:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "Сформулируй РОВНО 3 варианта краткого содержания обращения (до 80 симв).",
-                ),
-                ("user", "Текст:\n{text}"),
-            ]
-        )
-        chain = prompt | self.chat_model | StrOutputParser()
         try:
-            result = await chain.ainvoke({"text": text[:2000]})
+            result = await self._summary_variants_chain.ainvoke({"text": text[:2000]})
             return [v.strip() for v in result.strip().split("\n") if v.strip()][:3]
         except Exception:
             return [current_summary] if current_summary else []
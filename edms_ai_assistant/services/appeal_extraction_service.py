@@ -11,6 +11,7 @@ from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import ChatPromptTemplate
 
 from edms_ai_assistant.domain.appeal_fields import AppealFields, SubmissionFormAppeal
+from edms_ai_assistant.llm import log_prompt_cache_usage
 
 if TYPE_CHECKING:
     from langchain_core.language_models import BaseChatModel
@@ -85,16 +86,46 @@ _PHONE_CODE_CITY: dict[str, str] = {
 }
 _MINSK_SHORT_PHONE_FIRST_DIGITS: frozenset[str] = frozenset({"2", "3"})
 
+# Паттерны восстановления организации компилируются один раз при импорте.
+_ORG_QUOTED_RE = re.compile(
+    r'[«»“”„"]([А-ЯЁа-яё][^«»“”„"\n]{5,80})[«»“”„"]',
+    re.MULTILINE,
+)
+_ORG_PREFIX_RE = re.compile(
+    r"(?:республиканское унитарное предприятие|"
+    r"государственное предприятие|"
+    r"открытое акционерное общество|"
+    r"государственное учреждение|"
+    r"\bруп\b|\bгп\b|\bгу\b|\bоао\b)"
+    r'\s+[«»“”„"]([^«»“”„"\n]{5,80})[«»“”„"]',
+    re.IGNORECASE | re.MULTILINE,
+)
+_ORG_ADDRESS_NOISE_RE = re.compile(r"\d{5,}|ул\.|пр\.")
+_CONTACT_LINE_RE = re.compile(
+    r"(?:ул\.|пр\.|пер\.|бул\.|e-mail|тел\.|факс|@|\d{6})",
+    re.IGNORECASE,
+)
+_QUOTED_NAME_RE = re.compile(
+    r'[«»“”„"\']([А-ЯЁа-яё][^«»“”„"\'\n]{4,70})[«»“”„"\']'
+)
+
 
 class AppealExtractionService:
     MIN_TEXT_LENGTH = 30
     MAX_TEXT_LENGTH = 12000
+    # Хвост документа (подпись, адрес, дата) сохраняется при обрезке
+    TAIL_TEXT_LENGTH = 2000
     DEFAULT_MAX_RETRIES = 3
     BASE_RETRY_DELAY = 2
 
     def __init__(self, llm: BaseChatModel):
         """Внедряем LLM через DI вместо вызова глобального get_chat_model()."""
         self.extraction_llm = llm.bind(temperature=0.0)
+        # Парсер, JSON-схема формата и цепочка не зависят от документа —
+        # собираем их один раз на экземпляр, а не на каждый вызов.
+        self._parser = JsonOutputParser(pydantic_object=AppealFields)
+        self._format_instructions = self._parser.get_format_instructions()
+        self._chain = self._build_extraction_prompt() | self.extraction_llm
         logger.info("AppealExtractionService initialized with temperature=0.0")
 
     async def extract_appeal_fields(self, text: str) -> AppealFields:
@@ -102,20 +133,20 @@ class AppealExtractionService:
             return AppealFields()
 
         try:
-            parser = JsonOutputParser(pydantic_object=AppealFields)
-            prompt = self._build_extraction_prompt()
-
-            chain = prompt | self.extraction_llm | parser
-
-            preprocessed_text = self._preprocess_text(text)
+            # Грубая обрезка до препроцессинга: огромный OCR-текст не гоняем
+            # построчно целиком, запас x2 покрывает удалённые бел. строки.
+            clipped_text = self._truncate_text(text, self.MAX_TEXT_LENGTH * 2)
+            preprocessed_text = self._preprocess_text(clipped_text)
             truncated_text = self._truncate_text(preprocessed_text)
 
-            result = await chain.ainvoke(
+            response = await self._chain.ainvoke(
                 {
                     "text": truncated_text,
-                    "format_instructions": parser.get_format_instructions(),
+                    "format_instructions": self._format_instructions,
                 }
             )
+            log_prompt_cache_usage(response, operation="appeal_extraction")
+            result = await self._parser.ainvoke(response)
 
             if isinstance(result, dict):
                 if result.get("shortSummary") and len(str(result["shortSummary"])) > 80:
@@ -390,17 +421,22 @@ class AppealExtractionService:
 
         return True
 
-    @staticmethod
-    def _truncate_text(text: str) -> str:
-        if len(text) <= AppealExtractionService.MAX_TEXT_LENGTH:
+    @classmethod
+    def _truncate_text(cls, text: str, limit: int | None = None) -> str:
+        """Обрезает текст до ``limit`` символов: начало + короткий хвост.
+
+        Реквизиты обращения почти всегда на первых страницах, а подпись
+        и адрес заявителя — в конце, поэтому хвост сохраняется отдельно.
+        """
+        limit = limit or cls.MAX_TEXT_LENGTH
+        if len(text) <= limit:
             return text
 
-        logger.debug(
-            "Truncating text for LLM: %d -> %d chars",
-            len(text),
-            AppealExtractionService.MAX_TEXT_LENGTH,
-        )
-        return text[: AppealExtractionService.MAX_TEXT_LENGTH]
+        logger.debug("Truncating text for LLM: %d -> %d chars", len(text), limit)
+        tail_len = min(cls.TAIL_TEXT_LENGTH, limit // 4)
+        head = text[: limit - tail_len]
+        tail = text[-tail_len:]
+        return f"{head}\n...\n{tail}"
 
     @staticmethod
     def _preprocess_text(text: str) -> str:
@@ -428,28 +464,12 @@ class AppealExtractionService:
 
     @staticmethod
     def _recover_org_name_from_text(text: str) -> str | None:
-        quoted_pattern = re.compile(
-            r'[«»“”„"]([А-ЯЁа-яё][^«»“”„"\n]{5,80})[«»“”„"]',
-            re.MULTILINE,
-        )
-        org_prefix_pattern = re.compile(
-            r"(?:республиканское унитарное предприятие|"
-            r"государственное предприятие|"
-            r"открытое акционерное общество|"
-            r"государственное учреждение|"
-            r"\bруп\b|\bгп\b|\bгу\b|\bоао\b)"
-            r'\s+[«»“”„"]([^«»“”„"\n]{5,80})[«»“”„"]',
-            re.IGNORECASE | re.MULTILINE,
-        )
-
-        for pattern in (org_prefix_pattern, quoted_pattern):
+        for pattern in (_ORG_PREFIX_RE, _ORG_QUOTED_RE):
             for m in pattern.finditer(text):
                 candidate = m.group(1).strip()
                 if any(c in candidate for c in "ўЎіІ"):
                     continue
-                if len(candidate) >= 8 and not re.search(
-                    r"\d{5,}|ул\.|пр\.", candidate
-                ):
+                if len(candidate) >= 8 and not _ORG_ADDRESS_NOISE_RE.search(candidate):
                     return candidate
 
         return None
@@ -457,18 +477,11 @@ class AppealExtractionService:
     @staticmethod
     def _recover_org_from_address_proximity(text: str) -> str | None:
         lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
-        contact_pattern = re.compile(
-            r"(?:ул\.|пр\.|пер\.|бул\.|e-mail|тел\.|факс|@|\d{6})",
-            re.IGNORECASE,
-        )
-        quoted_pattern = re.compile(
-            r'[«»“”„"\']([А-ЯЁа-яё][^«»“”„"\'\n]{4,70})[«»“”„"\']'
-        )
 
         for i, line in enumerate(lines):
-            if contact_pattern.search(line):
+            if _CONTACT_LINE_RE.search(line):
                 for j in range(i - 1, max(i - 5, -1), -1):
-                    m = quoted_pattern.search(lines[j])
+                    m = _QUOTED_NAME_RE.search(lines[j])
                     if m:
                         candidate = m.group(1).strip()
                         if not any(c in candidate for c in "ўЎіІ"):
@@ -505,6 +518,11 @@ class AppealExtractionService:
 
     @staticmethod
     def _build_extraction_prompt() -> ChatPromptTemplate:
+        """Собирает промпт: инвариантные инструкции — в начале, текст — в конце.
+
+        Системное сообщение (правила + формат JSON) не зависит от документа,
+        поэтому провайдер кэширует его как общий префикс запроса.
+        """
         system_message = """Ты — эксперт-аналитик системы электронного документооборота (СЭД).
 Твоя задача: проанализировать текст официального обращения и извлечь факты для заполнения регистрационной карточки.
 
@@ -713,15 +731,15 @@ class AppealExtractionService:
 - "dateDocCorrespondentOrg": "2026-01-01T00:00:00Z" (извлечено из "№ 01-01/26")
 - "correspondentOrgNumber": "№ 01-01/26" (полностью с датой)
 - "submissionForm": "ELECTRONIC" (так как указан email заявителя)
+
+Инструкции по формату JSON-ответа:
+{format_instructions}
 """
 
         user_message = """Текст обращения для анализа:
 ───────────────────────────────────────────────────────────────────────────────
 {text}
 ───────────────────────────────────────────────────────────────────────────────
-
-Инструкции по формату JSON-ответа:
-{format_instructions}
 """
 
         return ChatPromptTemplate.from_messages(
@@ -2,12 +2,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from edms_ai_assistant.core.exceptions import EdmsNotFoundError
 
 if TYPE_CHECKING:
     from edms_ai_assistant.clients.document_client import DocumentClient
+    from edms_ai_assistant.domain.document import DocumentDto
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +19,16 @@ class DocumentEnricher:
     def __init__(self, document_client: DocumentClient):
         self._client = document_client
 
-    async def enrich(self, doc_dict: dict[str, Any], token: str) -> dict[str, Any]:
-        """Enriches the document dictionary with additional info."""
-        doc_id = doc_dict.get("id")
+    async def enrich(self, doc: DocumentDto, token: str) -> DocumentDto:
+        """Enriches the document with additional info.
+
+        Works on the validated DTO directly: a dump -> dict -> re-validate
+        round trip of the full nested model is only worth paying for once
+        the enricher actually adds data.
+        """
+        doc_id = doc.id
         if not doc_id:
-            return doc_dict
+            return doc
 
         # Fetch attachments through the client instead of raw transport
         try:
@@ -31,4 +37,4 @@ class DocumentEnricher:
         except (EdmsNotFoundError, Exception):
             logger.warning("Failed to enrich document %s", doc_id)
 
-        return doc_dict
+        return doc
@@ -5,6 +5,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from pydantic import BaseModel, ConfigDict, Field
 
 from edms_ai_assistant.clients.document_client import (
@@ -70,24 +71,25 @@ class _DocumentCache:
             logger.warning("Redis set_doc error", exc_info=True)
 
     async def get_analysis(self, doc_id: str) -> dict[str, Any] | None:
-        import json
-
         try:
             raw = await self._r.get(f"{_CACHE_PREFIX_ANALYSIS}{doc_id}")
-            if raw:
-                return json.loads(raw)
         except Exception:
             logger.warning("Redis get_analysis error", exc_info=True)
-        return None
+            return None
+        if not raw:
+            return None
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            logger.warning("Corrupted analysis cache entry for %s", doc_id)
+            return None
 
     async def set_analysis(self, doc_id: str, analysis: dict[str, Any]) -> None:
-        import json
-
         try:
             await self._r.setex(
                 f"{_CACHE_PREFIX_ANALYSIS}{doc_id}",
                 self._ttl,
-                json.dumps(analysis, default=str),
+                orjson.dumps(analysis, default=str, option=orjson.OPT_NON_STR_KEYS),
             )
         except Exception:
             logger.warning("Redis set_analysis error", exc_info=True)
@@ -139,9 +141,7 @@ class DocumentService:
             )
 
         if self._enrich_documents:
-            raw_dict = doc.model_dump(by_alias=True)
-            enriched_dict = await self._enricher.enrich(raw_dict, token=token)
-            doc = DocumentDto.model_validate(enriched_dict)
+            doc = await self._enricher.enrich(doc, token=token)
 
         await self._cache.set_doc(document_id, doc)
         return doc
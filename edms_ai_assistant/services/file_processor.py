@@ -11,20 +11,33 @@ from __future__ import annotations
 import asyncio
 import io
 import logging
+import multiprocessing
 import os
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+from contextlib import contextmanager
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from langchain_community.document_loaders import TextLoader
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
 logger = logging.getLogger(__name__)
 
 _MIN_AVG_CHARS_PER_PAGE = 20
 _CACHE_SUFFIX = ".ocr_cache.txt"
+_PDF_NO_TEXT_MESSAGE = (
+    "Не удалось извлечь текст из PDF.\n"
+    "Документ содержит только изображения без текстового слоя.\n\n"
+    "Для распознавания сканов установите Tesseract OCR или переменную TESSERACT_CMD."
+)
 
 
 # ── Lazy Tesseract Discovery ─────────────────────────────────
@@ -132,14 +145,53 @@ def _save_ocr_cache(file_path: str, text: str) -> None:
         logger.warning("Failed to save OCR cache: %s", e)
 
 
+# Префиксы сообщений, которые extract_text* возвращают вместо текста
+EXTRACTION_ERROR_PREFIXES: tuple[str, ...] = (
+    "Ошибка:",
+    "Формат файла",
+    "Формат .",
+    "Произошла техническая ошибка",
+)
+
+
+def is_extraction_error(text: str | None) -> bool:
+    """True, если извлечение не дало текста (пусто или сообщение об ошибке)."""
+    return not text or text.startswith(EXTRACTION_ERROR_PREFIXES)
+
+
+def remove_temp_file(file_path: str) -> None:
+    """Удаляет временный файл вместе с его OCR-кэшем (если он был создан)."""
+    for path in (file_path, file_path + _CACHE_SUFFIX):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not delete temp file %s: %s", path, e)
+
+
+def _join_pdf_pages(page_texts: list[str]) -> str:
+    """Склеивает тексты страниц PDF с заголовками, пропуская пустые."""
+    return "\n\n".join(
+        f"--- Страница {i} ---\n{text}" for i, text in enumerate(page_texts, 1) if text
+    )
+
+
 # ── Extractors ──────────────────────────────────────────────────────────
 
 
-def _extract_doc_via_fitz(file_path: str) -> str:
-    """Extract text from .doc or .docx using PyMuPDF (fitz)."""
+def _open_fitz(source: str | bytes, filetype: str) -> Any:
+    """Open a document with PyMuPDF from a filesystem path or in-memory bytes."""
     import fitz  # type: ignore[import]
 
-    with fitz.open(file_path) as doc:
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype=filetype)
+    return fitz.open(source)
+
+
+def _extract_doc_via_fitz(source: str | bytes, filetype: str = "docx") -> str:
+    """Extract text from .doc or .docx using PyMuPDF (fitz)."""
+    with _open_fitz(source, filetype) as doc:
         pages_text = [
             page.get_text("text").strip()
             for page in doc
@@ -148,20 +200,58 @@ def _extract_doc_via_fitz(file_path: str) -> str:
     return "\n\n".join(pages_text)
 
 
-def _extract_doc_via_mammoth(file_path: str) -> str:
+def _extract_doc_via_mammoth(source: str | bytes) -> str:
     """Extract text from .doc/.docx using mammoth library as fallback."""
     import mammoth  # type: ignore[import]
 
-    with open(file_path, "rb") as f:
+    if isinstance(source, bytes):
+        return mammoth.extract_raw_text(io.BytesIO(source)).value.strip()
+    with open(source, "rb") as f:
         result = mammoth.extract_raw_text(f)
     return result.value.strip()
 
 
-def _extract_docx_via_docx2txt(file_path: str) -> str:
+def _extract_docx_via_docx2txt(source: str | bytes) -> str:
     """Extract text from .docx using docx2txt (ZIP-based format only)."""
     import docx2txt  # type: ignore[import]
 
-    return docx2txt.process(file_path) or ""
+    if isinstance(source, bytes):
+        return docx2txt.process(io.BytesIO(source)) or ""
+    return docx2txt.process(source) or ""
+
+
+@contextmanager
+def _open_workbook(source: str | bytes, ext: str) -> Iterator[Any]:
+    """Open an Excel workbook from a filesystem path or in-memory bytes.
+
+    Workbooks are opened in streaming mode (openpyxl ``read_only``, xlrd
+    ``on_demand``) — rows are read sheet by sheet instead of materialising
+    the whole cell model — and closed on exit.
+    """
+    if ext == ".xlsx":
+        import openpyxl
+
+        wb = openpyxl.load_workbook(
+            io.BytesIO(source) if isinstance(source, bytes) else source,
+            read_only=True,
+            data_only=True,
+        )
+        try:
+            yield wb
+        finally:
+            wb.close()
+        return
+
+    import xlrd
+
+    if isinstance(source, bytes):
+        wb = xlrd.open_workbook(file_contents=source, on_demand=True)
+    else:
+        wb = xlrd.open_workbook(source, on_demand=True)
+    try:
+        yield wb
+    finally:
+        wb.release_resources()
 
 
 # ── Utility: DOC to DOCX conversion ─────────────────────────────────────
@@ -249,8 +339,54 @@ class FileProcessorService:
 
     _default_instance: FileProcessorService | None = None
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        process_workers: int = 0,
+        parse_timeout: float | None = None,
+    ):
+        """
+        Args:
+            max_workers: Размер пула потоков (используется без process-пула).
+            process_workers: Если > 0 — парсинг (PDF/OCR/DOCX/Excel) идёт в
+                пуле процессов этого размера, и GIL не сериализует
+                параллельные вызовы. ``0`` — парсинг в потоках.
+            parse_timeout: Лимит времени на один файл, секунды (None — без лимита).
+        """
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._process_workers = process_workers
+        self._process_pool: ProcessPoolExecutor | None = (
+            self._new_process_pool() if process_workers > 0 else None
+        )
+        self._parse_timeout = parse_timeout
+
+    def _new_process_pool(self) -> ProcessPoolExecutor:
+        # spawn: fork из процесса с потоками и event loop небезопасен
+        return ProcessPoolExecutor(
+            max_workers=self._process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _recycle_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Завершает воркеры ``pool`` и поднимает новый пул процессов.
+
+        ``wait_for`` по таймауту лишь перестаёт ждать результат, а процесс
+        продолжает парсинг и занимает слот пула. Задачи, выполнявшиеся в том же
+        пуле, получат ``BrokenProcessPool`` и будут повторены в
+        :meth:`_run_parser`.
+        """
+        if self._process_pool is not pool:
+            return  # пул уже пересоздан по другому таймауту
+        # Публичного API для остановки воркеров нет до Python 3.14
+        # (ProcessPoolExecutor.terminate_workers).
+        workers = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.terminate()
+        self._process_pool = self._new_process_pool()
+        logger.warning(
+            "Parser process pool recycled (%d workers terminated)", len(workers)
+        )
 
     @classmethod
     def _get_default_instance(cls) -> FileProcessorService:
@@ -259,14 +395,68 @@ class FileProcessorService:
             cls._default_instance = cls()
         return cls._default_instance
 
+    @classmethod
+    def set_default_instance(cls, instance: FileProcessorService) -> None:
+        """Делает ``instance`` (с настроенными пулами) синглтоном для classmethod-API."""
+        cls._default_instance = instance
+
+    def shutdown(self) -> None:
+        """Останавливает пулы парсинга (вызывается при остановке приложения)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    async def _run_parser(
+        cls, func: Callable[..., Any], *args: Any, executor: Executor | None = None
+    ) -> Any:
+        """Run a sync parser in the process pool (or thread pool) with a timeout.
+
+        Зависший парсер в пуле процессов завершается вместе с пулом: иначе
+        несколько таких файлов занимают все слоты и таймаутят остальные.
+        Задача, чей воркер погиб не по её вине (пересоздание пула по чужому
+        таймауту, падение процесса), один раз повторяется в свежем пуле.
+
+        Raises:
+            TimeoutError: Parsing exceeded ``parse_timeout``.
+            BrokenProcessPool: The worker died again on the retry.
+        """
+        instance = cls._get_default_instance()
+        loop = asyncio.get_running_loop()
+
+        async def attempt(pool: Executor) -> Any:
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(pool, func, *args), instance._parse_timeout
+                )
+            except TimeoutError:
+                if pool is instance._process_pool:
+                    instance._recycle_process_pool(pool)
+                raise
+
+        pool = executor or instance._process_pool or instance._executor
+        try:
+            return await attempt(pool)
+        except BrokenProcessPool:
+            if executor is not None or instance._process_pool is None:
+                raise
+            instance._recycle_process_pool(pool)  # no-op, если уже пересоздан
+            logger.warning("Parser worker died, retrying %s once", func.__name__)
+            return await attempt(instance._process_pool)
+
     @classmethod
     async def extract_text_async(
-        cls, file_path: str, executor: ThreadPoolExecutor | None = None
+        cls, file_path: str, executor: Executor | None = None
     ) -> str:
-        """Async text extraction delegating CPU work to thread pool."""
-        loop = asyncio.get_running_loop()
-        exec_pool = executor or cls._get_default_instance()._executor
-        return await loop.run_in_executor(exec_pool, cls.extract_text, file_path)
+        """Async text extraction delegating CPU work to the parser pool."""
+        try:
+            return await cls._run_parser(cls.extract_text, file_path, executor=executor)
+        except TimeoutError:
+            logger.error("Text extraction timed out: %s", file_path)
+            return "Ошибка: превышено время обработки файла."
+        except BrokenProcessPool:
+            logger.error("Text extraction worker crashed: %s", file_path)
+            return "Ошибка: процесс обработки файла аварийно завершился."
 
     @classmethod
     def extract_text(cls, file_path: str) -> str:
@@ -311,8 +501,207 @@ class FileProcessorService:
             )
             return error_msg
 
+    @classmethod
+    async def extract_text_from_bytes_async(
+        cls,
+        data: bytes,
+        suffix: str,
+        executor: Executor | None = None,
+    ) -> str:
+        """Async in-memory text extraction delegating CPU work to the parser pool."""
+        try:
+            return await cls._run_parser(
+                cls.extract_text_from_bytes, data, suffix, executor=executor
+            )
+        except TimeoutError:
+            logger.error("In-memory text extraction timed out (%s)", suffix)
+            return "Ошибка: превышено время обработки файла."
+        except BrokenProcessPool:
+            logger.error("In-memory text extraction worker crashed (%s)", suffix)
+            return "Ошибка: процесс обработки файла аварийно завершился."
+
+    @classmethod
+    def extract_text_from_bytes(cls, data: bytes, suffix: str) -> str:
+        """Synchronous text extraction from an in-memory payload.
+
+        Parses PDF (including OCR), DOCX, TXT and Excel directly from ``data``
+        without a filesystem round-trip. Legacy ``.doc`` is spilled to a
+        temporary file only when its LibreOffice fallback is needed.
+
+        Args:
+            data: Raw file content.
+            suffix: File extension including the dot (e.g. ``".pdf"``).
+
+        Returns:
+            Extracted text or a human-readable error message, same as
+            :meth:`extract_text`.
+        """
+        ext = suffix.lower()
+
+        if ext not in cls.SUPPORTED_EXTENSIONS:
+            logger.warning("Unsupported file format: %s", ext)
+            return f"Формат файла {ext} пока не поддерживается для анализа."
+
+        try:
+            if ext in (".xlsx", ".xls"):
+                return cls._extract_from_excel(data, ext)
+            if ext == ".doc":
+                return cls._extract_doc(data)
+            if ext == ".docx":
+                return cls._extract_docx(data)
+            if ext == ".pdf":
+                return cls._extract_pdf_bytes(data)
+            if ext == ".txt":
+                return data.decode("utf-8", errors="replace").strip()
+
+            return f"Формат {ext} не поддерживается."
+
+        except Exception as e:
+            logger.error("In-memory file parsing error: %s", e, exc_info=True)
+            return f"Произошла техническая ошибка при чтении файла {ext}: {e!s}"
+
+    @classmethod
+    async def extract_text_capped_async(
+        cls, source: str | bytes, ext: str, max_chars: int
+    ) -> tuple[str, int, bool]:
+        """Async :meth:`_extract_text_capped`: ``(text, total_chars, truncated)``."""
+        try:
+            return await cls._run_parser(
+                cls._extract_text_capped, source, ext, max_chars
+            )
+        except TimeoutError:
+            logger.error("Capped text extraction timed out (%s)", ext)
+            return "Ошибка: превышено время обработки файла.", 0, False
+        except BrokenProcessPool:
+            logger.error("Capped text extraction worker crashed (%s)", ext)
+            return "Ошибка: процесс обработки файла аварийно завершился.", 0, False
+
+    @classmethod
+    def _extract_text_capped(
+        cls, source: str | bytes, ext: str, max_chars: int
+    ) -> tuple[str, int, bool]:
+        """Extract at most ``max_chars`` characters inside the parser worker.
+
+        Returns ``(text, total_chars, truncated)``; only the excerpt crosses
+        the process-pool boundary. PDFs with a text layer stop parsing at the
+        page where the cap is hit.
+        """
+        if ext == ".pdf":
+            try:
+                capped = cls._read_pdf_text_layer_capped(source, max_chars)
+            except Exception as e:
+                logger.warning("Capped PDF read failed, using full pipeline: %s", e)
+                capped = None
+            if capped is not None:
+                return capped
+
+        if ext == ".txt" and isinstance(source, str):
+            try:
+                return cls._read_txt_capped(source, max_chars)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning("Capped TXT read failed, using full pipeline: %s", e)
+
+        if isinstance(source, bytes):
+            text = cls.extract_text_from_bytes(source, ext)
+        else:
+            text = cls.extract_text(source)
+        return text[:max_chars], len(text), len(text) > max_chars
+
+    @classmethod
+    def _extract_via_tempfile(
+        cls, data: bytes, ext: str, extractor: Callable[[str], str]
+    ) -> str:
+        """Spill ``data`` to a temporary file for path-only ``extractor``."""
+        fd, tmp_path = tempfile.mkstemp(suffix=ext)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            return extractor(tmp_path)
+        finally:
+            try:
+                os.unlink(tmp_path)
+            except OSError as cleanup_err:
+                logger.warning(
+                    "Failed to remove temp file '%s': %s", tmp_path, cleanup_err
+                )
+
     # ── Format-specific extractors ────────────────────────────────────────────
 
+    @staticmethod
+    def _extract_pdf_text_layer(source: str | bytes) -> tuple[str, list[str]]:
+        """Read the PDF text layer; returns ``(text, per-page texts)``."""
+        with _open_fitz(source, "pdf") as doc:
+            page_texts = [page.get_text("text").strip() for page in doc]
+        return _join_pdf_pages(page_texts), page_texts
+
+    @staticmethod
+    def _read_pdf_text_layer_capped(
+        source: str | bytes, max_chars: int
+    ) -> tuple[str, int, bool] | None:
+        """Read PDF text-layer pages only until ``max_chars`` is reached.
+
+        When reading stops early, ``total_chars`` is estimated as
+        ``page_count * avg_chars_per_page`` of the pages read. Returns
+        ``None`` when the text layer is too thin — the full pipeline
+        (cache / OCR) handles such files.
+        """
+        page_texts: list[str] = []
+        chars = 0
+        with _open_fitz(source, "pdf") as doc:
+            page_count = len(doc)
+            for page in doc:
+                page_text = page.get_text("text").strip()
+                page_texts.append(page_text)
+                chars += len(page_text)
+                if chars >= max_chars:
+                    break
+
+        read = len(page_texts)
+        if not chars or chars / max(read, 1) < _MIN_AVG_CHARS_PER_PAGE:
+            return None
+        text = _join_pdf_pages(page_texts)
+        if read == page_count:
+            return text[:max_chars], len(text), len(text) > max_chars
+        estimated_total = round(len(text) / read * page_count)
+        return text[:max_chars], estimated_total, True
+
+    @staticmethod
+    def _read_txt_capped(file_path: str, max_chars: int) -> tuple[str, int, bool]:
+        """Read at most ``max_chars + 1`` characters of a UTF-8 text file.
+
+        When the file is longer, ``total_chars`` is estimated from the file
+        size and the bytes-per-char ratio of the part that was read.
+        """
+        with open(file_path, encoding="utf-8") as f:
+            chunk = f.read(max_chars + 1)
+        if len(chunk) <= max_chars:
+            text = chunk.strip()
+            return text, len(text), False
+        file_size = os.path.getsize(file_path)
+        estimated_total = round(file_size * len(chunk) / len(chunk.encode("utf-8")))
+        return chunk[:max_chars], estimated_total, True
+
+    @classmethod
+    def _extract_pdf_bytes(cls, data: bytes) -> str:
+        """In-memory PDF pipeline: Text Layer (fitz) -> OCR."""
+        full_text, page_texts = cls._extract_pdf_text_layer(data)
+        page_count = len(page_texts)
+        avg_chars = len(full_text) / max(page_count, 1)
+
+        if full_text and avg_chars >= _MIN_AVG_CHARS_PER_PAGE:
+            logger.info(
+                "PDF extracted via text layer (fitz, in-memory)",
+                extra={"chars": len(full_text), "pages": page_count},
+            )
+            return full_text
+
+        logger.info(
+            "PDF text layer too thin (%d chars / %d pages), switching to OCR",
+            len(full_text),
+            page_count,
+        )
+        return cls._run_pdf_ocr(data, page_texts) or _PDF_NO_TEXT_MESSAGE
+
     @classmethod
     def _extract_pdf(cls, file_path: str) -> str:
         """Unified PDF pipeline: Cache -> Text Layer (fitz) -> OCR."""
@@ -320,18 +709,8 @@ class FileProcessorService:
         if cached:
             return cached
 
-        import fitz  # type: ignore[import]
-
-        with fitz.open(file_path) as doc:
-            pages_text = []
-            page_count = len(doc)
-
-            for i, page in enumerate(doc):
-                text = page.get_text("text").strip()
-                if text:
-                    pages_text.append(f"--- Страница {i + 1} ---\n{text}")
-
-            full_text = "\n\n".join(pages_text)
+        full_text, page_texts = cls._extract_pdf_text_layer(file_path)
+        page_count = len(page_texts)
 
         avg_chars = len(full_text) / max(page_count, 1)
 
@@ -351,10 +730,21 @@ class FileProcessorService:
         )
 
         # Fallback на OCR
+        ocr_text = cls._run_pdf_ocr(file_path, page_texts)
+        if ocr_text:
+            _save_ocr_cache(file_path, ocr_text)
+            return ocr_text
+
+        return _PDF_NO_TEXT_MESSAGE
+
+    @classmethod
+    def _run_pdf_ocr(
+        cls, source: str | bytes, page_texts: list[str] | None = None
+    ) -> str | None:
+        """OCR fallback with error logging; returns ``None`` when nothing was recognised."""
         try:
-            ocr_text = cls._extract_pdf_via_ocr(file_path)
+            ocr_text = cls._extract_pdf_via_ocr(source, page_texts)
             if ocr_text and ocr_text.strip():
-                _save_ocr_cache(file_path, ocr_text)
                 return ocr_text
         except ImportError as ie:
             logger.warning("OCR dependencies missing: %s", ie)
@@ -362,16 +752,17 @@ class FileProcessorService:
             logger.warning("OCR runtime error: %s", re_err)
         except Exception as e:
             logger.error("OCR extraction failed: %s", e, exc_info=True)
-
-        return (
-            "Не удалось извлечь текст из PDF.\n"
-            "Документ содержит только изображения без текстового слоя.\n\n"
-            "Для распознавания сканов установите Tesseract OCR или переменную TESSERACT_CMD."
-        )
+        return None
 
     @classmethod
-    def _extract_pdf_via_ocr(cls, file_path: str) -> str:
-        """Extract text from scanned (image-only) PDF using PyMuPDF + Tesseract OCR."""
+    def _extract_pdf_via_ocr(
+        cls, source: str | bytes, page_texts: list[str] | None = None
+    ) -> str:
+        """Extract text from scanned (image-only) PDF using PyMuPDF + Tesseract OCR.
+
+        ``page_texts`` — уже прочитанный текстовый слой: страницы, где его
+        достаточно (смешанные PDF), не растеризуются и не распознаются.
+        """
         import fitz  # type: ignore[import]
         import pytesseract  # type: ignore[import]
         from PIL import Image  # type: ignore[import]
@@ -408,10 +799,19 @@ class FileProcessorService:
 
         # ── Извлечение текста постранично ────────────────────────────────
         pages_text: list[str] = []
+        ocr_pages = 0
 
-        with fitz.open(file_path) as doc:
+        with _open_fitz(source, "pdf") as doc:
             total_pages = len(doc)
             for page_num in range(total_pages):
+                layer_text = page_texts[page_num] if page_texts else ""
+                if len(layer_text) >= _MIN_AVG_CHARS_PER_PAGE:
+                    pages_text.append(
+                        f"--- Страница {page_num + 1} ---\n{layer_text}"
+                    )
+                    continue
+
+                ocr_pages += 1
                 page = doc[page_num]
 
                 zoom = 300 / 72
@@ -455,67 +855,70 @@ class FileProcessorService:
                     pix = None
 
         logger.info(
-            "PDF OCR completed: %d pages, %d with text",
+            "PDF OCR completed: %d pages, %d OCR'd, %d with text",
             total_pages,
+            ocr_pages,
             len(pages_text),
         )
         return "\n\n".join(pages_text)
 
     @classmethod
-    def _extract_doc(cls, file_path: str) -> str:
-        """Extract text from legacy .doc (Word 97-2003) files."""
+    def _extract_doc(cls, source: str | bytes) -> str:
+        """Extract text from legacy .doc (Word 97-2003) files.
+
+        ``source`` may be a path or raw bytes; bytes are spilled to a temp
+        file only if the LibreOffice fallback is actually reached.
+        """
+        label = source if isinstance(source, str) else "<in-memory>"
         try:
-            text = _extract_doc_via_fitz(file_path)
+            text = _extract_doc_via_fitz(source, "doc")
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOC extracted via fitz",
-                    extra={"file_path": file_path, "chars": len(text)},
+                    extra={"file_path": label, "chars": len(text)},
                 )
                 return text
         except Exception as fitz_err:
             logger.warning(
-                "fitz failed for .doc '%s': %s — trying mammoth", file_path, fitz_err
+                "fitz failed for .doc '%s': %s — trying mammoth", label, fitz_err
             )
 
         try:
-            text = _extract_doc_via_mammoth(file_path)
+            text = _extract_doc_via_mammoth(source)
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOC extracted via mammoth",
-                    extra={"file_path": file_path, "chars": len(text)},
+                    extra={"file_path": label, "chars": len(text)},
                 )
                 return text
         except ImportError:
             logger.warning("mammoth not installed — install with: uv add mammoth")
         except Exception as mammoth_err:
-            logger.warning("mammoth failed for .doc '%s': %s", file_path, mammoth_err)
+            logger.warning("mammoth failed for .doc '%s': %s", label, mammoth_err)
 
         try:
-            logger.info("Attempting LibreOffice conversion for .doc: %s", file_path)
-            docx_path = _convert_doc_to_docx(file_path)
-            text = cls._extract_docx(docx_path)
-            try:
-                Path(docx_path).unlink()
-            except Exception as cleanup_err:
-                logger.warning(
-                    "Failed to remove temp file %s: %s", docx_path, cleanup_err
+            if isinstance(source, bytes):
+                text = cls._extract_via_tempfile(
+                    source, ".doc", cls._extract_doc_via_libreoffice
                 )
+            else:
+                text = cls._extract_doc_via_libreoffice(source)
 
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOC extracted via LibreOffice conversion",
-                    extra={"original": file_path, "chars": len(text)},
+                    extra={"original": label, "chars": len(text)},
                 )
                 return text
 
         except RuntimeError as conv_err:
             logger.warning(
-                "LibreOffice conversion failed for '%s': %s", file_path, conv_err
+                "LibreOffice conversion failed for '%s': %s", label, conv_err
             )
         except Exception as e:
             logger.error(
                 "Unexpected error during DOC extraction for '%s': %s",
-                file_path,
+                label,
                 e,
                 exc_info=True,
             )
@@ -529,10 +932,26 @@ class FileProcessorService:
         )
 
     @classmethod
-    def _extract_docx(cls, file_path: str) -> str:
-        """Extract text from .docx (Office Open XML ZIP) files."""
+    def _extract_doc_via_libreoffice(cls, file_path: str) -> str:
+        """Convert .doc to .docx with LibreOffice and extract its text."""
+        logger.info("Attempting LibreOffice conversion for .doc: %s", file_path)
+        docx_path = _convert_doc_to_docx(file_path)
         try:
-            text = _extract_docx_via_docx2txt(file_path)
+            return cls._extract_docx(docx_path)
+        finally:
+            try:
+                Path(docx_path).unlink()
+            except Exception as cleanup_err:
+                logger.warning(
+                    "Failed to remove temp file %s: %s", docx_path, cleanup_err
+                )
+
+    @classmethod
+    def _extract_docx(cls, source: str | bytes) -> str:
+        """Extract text from .docx (Office Open XML ZIP) files (path or bytes)."""
+        file_path = source if isinstance(source, str) else "<in-memory>"
+        try:
+            text = _extract_docx_via_docx2txt(source)
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOCX extracted via docx2txt",
@@ -545,7 +964,7 @@ class FileProcessorService:
             logger.warning("docx2txt failed for '%s': %s", file_path, e)
 
         try:
-            text = _extract_doc_via_mammoth(file_path)
+            text = _extract_doc_via_mammoth(source)
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOCX extracted via mammoth",
@@ -556,7 +975,7 @@ class FileProcessorService:
             logger.warning("mammoth failed for '%s': %s — trying fitz", file_path, e)
 
         try:
-            text = _extract_doc_via_fitz(file_path)
+            text = _extract_doc_via_fitz(source, "docx")
             if text and len(text.strip()) > 10:
                 logger.info(
                     "DOCX extracted via fitz",
@@ -583,45 +1002,39 @@ class FileProcessorService:
         return full_text
 
     @classmethod
-    def _extract_from_excel(cls, file_path: str, ext: str) -> str:
+    def _extract_from_excel(cls, source: str | bytes, ext: str) -> str:
         """Extract text from Excel files preserving table structure."""
+        file_path = source if isinstance(source, str) else "<in-memory>"
         try:
-            if ext == ".xlsx":
-                import openpyxl
-
-                wb = openpyxl.load_workbook(file_path, data_only=True)
-            else:
-                import xlrd
-
-                wb = xlrd.open_workbook(file_path)
-
             extracted_text = []
 
-            if ext == ".xlsx":
-                for sheet_name in wb.sheetnames:
-                    sheet = wb[sheet_name]
-                    extracted_text.append(
-                        f"\n{'=' * 50}\nЛИСТ: {sheet_name}\n{'=' * 50}\n"
-                    )
-                    for row in sheet.iter_rows(values_only=True):
-                        if any(cell is not None for cell in row):
-                            row_text = " | ".join(
-                                str(cell) if cell is not None else "" for cell in row
-                            )
-                            extracted_text.append(row_text)
-            else:
-                for sheet_idx in range(wb.nsheets):
-                    sheet = wb.sheet_by_index(sheet_idx)
-                    extracted_text.append(
-                        f"\n{'=' * 50}\nЛИСТ: {sheet.name}\n{'=' * 50}\n"
-                    )
-                    for row_idx in range(sheet.nrows):
-                        row = sheet.row_values(row_idx)
-                        if any(cell for cell in row):
-                            row_text = " | ".join(
-                                str(cell) if cell else "" for cell in row
-                            )
-                            extracted_text.append(row_text)
+            with _open_workbook(source, ext) as wb:
+                if ext == ".xlsx":
+                    for sheet_name in wb.sheetnames:
+                        sheet = wb[sheet_name]
+                        extracted_text.append(
+                            f"\n{'=' * 50}\nЛИСТ: {sheet_name}\n{'=' * 50}\n"
+                        )
+                        for row in sheet.iter_rows(values_only=True):
+                            if any(cell is not None for cell in row):
+                                row_text = " | ".join(
+                                    str(cell) if cell is not None else ""
+                                    for cell in row
+                                )
+                                extracted_text.append(row_text)
+                else:
+                    for sheet_idx in range(wb.nsheets):
+                        sheet = wb.sheet_by_index(sheet_idx)
+                        extracted_text.append(
+                            f"\n{'=' * 50}\nЛИСТ: {sheet.name}\n{'=' * 50}\n"
+                        )
+                        for row_idx in range(sheet.nrows):
+                            row = sheet.row_values(row_idx)
+                            if any(cell for cell in row):
+                                row_text = " | ".join(
+                                    str(cell) if cell else "" for cell in row
+                                )
+                                extracted_text.append(row_text)
 
             result = "\n".join(extracted_text).strip()
             logger.info(
@@ -639,93 +1052,154 @@ class FileProcessorService:
 
     # ── Structured data / utility methods ────────────────────────────────
 
-    @classmethod
-    async def extract_structured_data(cls, file_path: str) -> dict[str, Any]:
-        """Extract structured data including text, metadata, and tables."""
-        path = Path(file_path)
-        ext = path.suffix.lower()
-        text = await cls.extract_text_async(file_path)
+    @staticmethod
+    def _build_structured(
+        text: str,
+        name: str,
+        ext: str,
+        size_bytes: int,
+        total_chars: int,
+        truncated: bool,
+    ) -> dict[str, Any]:
+        # Счётчики считаются по возвращаемому тексту; при обрезке это лишь
+        # начало документа (полная длина — в total_chars), что и помечает scope.
         stats = {
+            "scope": "excerpt" if truncated else "full",
             "chars": len(text),
             "words": len(text.split()),
             "lines": text.count("\n"),
             "digits": len([c for c in text if c.isdigit()]),
         }
-        file_stat = path.stat()
         metadata = {
-            "filename": path.name,
+            "filename": name,
             "extension": ext,
-            "size_bytes": file_stat.st_size,
-            "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
+            "size_bytes": size_bytes,
+            "size_mb": round(size_bytes / (1024 * 1024), 2),
         }
-        result: dict[str, Any] = {
+        return {
             "text": text,
             "metadata": metadata,
             "stats": stats,
             "tables": None,
+            "total_chars": total_chars,
+            "is_truncated": truncated,
         }
+
+    @classmethod
+    async def extract_structured_data(
+        cls,
+        file_path: str,
+        file_name: str | None = None,
+        *,
+        max_chars: int | None = None,
+    ) -> dict[str, Any]:
+        """Extract structured data including text, metadata, and tables.
+
+        ``file_name`` overrides the reported filename (e.g. for temp files).
+        With ``max_chars`` the parser stops emitting text at the cap;
+        ``total_chars`` may then be an estimate (see ``is_truncated``).
+        """
+        path = Path(file_path)
+        ext = path.suffix.lower()
+        if max_chars is None:
+            text = await cls.extract_text_async(file_path)
+            total_chars, truncated = len(text), False
+        else:
+            text, total_chars, truncated = await cls.extract_text_capped_async(
+                file_path, ext, max_chars
+            )
+        result = cls._build_structured(
+            text,
+            file_name or path.name,
+            ext,
+            path.stat().st_size,
+            total_chars,
+            truncated,
+        )
         if ext in (".xlsx", ".xls"):
-            result["tables"] = await cls._extract_excel_tables(file_path, ext)
+            result["tables"] = await cls.extract_tables_async(file_path, ext)
         return result
 
     @classmethod
-    async def _extract_excel_tables(
-        cls, file_path: str, ext: str
-    ) -> list[dict[str, Any]]:
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(
-            cls._get_default_instance()._executor,
-            cls._extract_tables_sync,
-            file_path,
-            ext,
+    async def extract_structured_data_from_bytes(
+        cls, data: bytes, file_name: str, *, max_chars: int | None = None
+    ) -> dict[str, Any]:
+        """In-memory counterpart of :meth:`extract_structured_data`."""
+        ext = Path(file_name).suffix.lower()
+        if max_chars is None:
+            text = await cls.extract_text_from_bytes_async(data, ext)
+            total_chars, truncated = len(text), False
+        else:
+            text, total_chars, truncated = await cls.extract_text_capped_async(
+                data, ext, max_chars
+            )
+        result = cls._build_structured(
+            text, file_name, ext, len(data), total_chars, truncated
         )
+        if ext in (".xlsx", ".xls"):
+            result["tables"] = await cls.extract_tables_async(data, ext)
+        return result
 
     @classmethod
-    def _extract_tables_sync(cls, file_path: str, ext: str) -> list[dict[str, Any]]:
-        try:
-            if ext == ".xlsx":
-                import openpyxl
+    async def extract_tables_async(
+        cls, source: str | bytes, ext: str
+    ) -> list[dict[str, Any]]:
+        """Extract only the sheets of an Excel file, skipping text and stats.
 
-                wb = openpyxl.load_workbook(file_path, data_only=True)
-            else:
-                import xlrd
+        ``source`` is a path or raw bytes; non-Excel formats yield ``[]``.
+        """
+        if ext not in (".xlsx", ".xls"):
+            return []
+        try:
+            return await cls._run_parser(cls._extract_tables_sync, source, ext)
+        except TimeoutError:
+            logger.error("Excel table extraction timed out (%s)", ext)
+            return []
+        except BrokenProcessPool:
+            logger.error("Excel table extraction worker crashed (%s)", ext)
+            return []
 
-                wb = xlrd.open_workbook(file_path)
+    @classmethod
+    def _extract_tables_sync(
+        cls, source: str | bytes, ext: str
+    ) -> list[dict[str, Any]]:
+        try:
             tables = []
-            if ext == ".xlsx":
-                for sheet_name in wb.sheetnames:
-                    sheet = wb[sheet_name]
-                    data = [
-                        list(row)
-                        for row in sheet.iter_rows(values_only=True)
-                        if any(c is not None for c in row)
-                    ]
-                    if data:
-                        tables.append(
-                            {
-                                "sheet_name": sheet_name,
-                                "headers": data[0],
-                                "data": data[1:],
-                                "rows_count": len(data) - 1,
-                            }
-                        )
-            else:
-                for i in range(wb.nsheets):
-                    sheet = wb.sheet_by_index(i)
-                    data = [
-                        sheet.row_values(r)
-                        for r in range(sheet.nrows)
-                        if any(sheet.row_values(r))
-                    ]
-                    if data:
-                        tables.append(
-                            {
-                                "sheet_name": sheet.name,
-                                "headers": data[0],
-                                "data": data[1:],
-                                "rows_count": len(data) - 1,
-                            }
-                        )
+            with _open_workbook(source, ext) as wb:
+                if ext == ".xlsx":
+                    for sheet_name in wb.sheetnames:
+                        sheet = wb[sheet_name]
+                        data = [
+                            list(row)
+                            for row in sheet.iter_rows(values_only=True)
+                            if any(c is not None for c in row)
+                        ]
+                        if data:
+                            tables.append(
+                                {
+                                    "sheet_name": sheet_name,
+                                    "headers": data[0],
+                                    "data": data[1:],
+                                    "rows_count": len(data) - 1,
+                                }
+                            )
+                else:
+                    for i in range(wb.nsheets):
+                        sheet = wb.sheet_by_index(i)
+                        data = [
+                            row
+                            for r in range(sheet.nrows)
+                            if any(row := sheet.row_values(r))
+                        ]
+                        if data:
+                            tables.append(
+                                {
+                                    "sheet_name": sheet.name,
+                                    "headers": data[0],
+                                    "data": data[1:],
+                                    "rows_count": len(data) - 1,
+                                }
+                            )
             return tables
         except Exception as e:
             logger.error("Table extraction error: %s", e, exc_info=True)
@@ -735,12 +1209,14 @@ class FileProcessorService:
     def validate_file_path(cls, file_path: str) -> str | None:
         if not file_path or not file_path.strip():
             return "Путь к файлу не может быть пустым"
-        path = Path(file_path)
-        if not path.exists():
+        # Один stat вместо пары exists() + is_file().
+        try:
+            st = os.stat(file_path)
+        except OSError:
             return f"Файл не найден: {file_path}"
-        if not path.is_file():
+        if not S_ISREG(st.st_mode):
             return f"Указанный путь не является файлом: {file_path}"
-        ext = path.suffix.lower()
+        ext = Path(file_path).suffix.lower()
         if ext not in cls.SUPPORTED_EXTENSIONS:
             supported = ", ".join(sorted(cls.SUPPORTED_EXTENSIONS))
             return f"Неподдерживаемый формат {ext}. Поддерживаются: {supported}"
@@ -749,10 +1225,11 @@ class FileProcessorService:
     @classmethod
     def get_file_info(cls, file_path: str) -> dict[str, Any]:
         path = Path(file_path)
-        if not path.exists():
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             return {"exists": False, "error": f"Файл не найден: {file_path}"}
         try:
-            stat = path.stat()
             return {
                 "exists": True,
                 "name": path.name,
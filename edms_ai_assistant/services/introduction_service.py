@@ -1,16 +1,20 @@
 # edms_ai_assistant/services/introduction_service.py
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
     from edms_ai_assistant.clients.document_client import DocumentClient
-    from edms_ai_assistant.services.resolution_service import ResolutionService
+    from edms_ai_assistant.services.resolution_service import (
+        AmbiguousMatch,
+        ResolutionService,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +33,7 @@ class IntroductionResolutionResult:
 
     employee_ids: set[UUID] = field(default_factory=set)
     not_found: list[str] = field(default_factory=list)
-    ambiguous: list[dict[str, Any]] = field(default_factory=list)
+    ambiguous: list[AmbiguousMatch] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -58,16 +62,16 @@ class IntroductionService:
         include_subordinates: bool = False,
     ) -> IntroductionResolutionResult:
         """Резолвит сотрудников по множественным критериям."""
-        result = await self._resolution.resolve_bulk(
-            token=token,
-            department_names=department_names,
-            group_names=group_names,
-            personal_group_names=personal_group_names,
-            include_subordinates=include_subordinates,
-        )
-
-        emp_ids, not_found_names, ambiguous_data = (
-            await self._resolution.resolve_employees(token, last_names)
+        # Поиск по фамилиям и массовый резолвинг независимы — параллельно
+        result, (emp_ids, not_found_names, ambiguous_data) = await asyncio.gather(
+            self._resolution.resolve_bulk(
+                token=token,
+                department_names=department_names,
+                group_names=group_names,
+                personal_group_names=personal_group_names,
+                include_subordinates=include_subordinates,
+            ),
+            self._resolution.resolve_employees(token, last_names),
         )
 
         # Результирующий set и list из resolve_bulk (ResolutionResult)
@@ -81,10 +85,7 @@ class IntroductionService:
         return IntroductionResolutionResult(
             employee_ids=combined_ids,
             not_found=combined_not_found,
-            ambiguous=[
-                {"search_query": am.search_query, "matches": am.matches}
-                for am in ambiguous_data
-            ],
+            ambiguous=ambiguous_data,
         )
 
     async def create_introduction(
@@ -6,7 +6,7 @@ from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
 from edms_ai_assistant.utils.edms_formatter import EdmsFormatter
-from edms_ai_assistant.utils.format_utils import clean_dict
+from edms_ai_assistant.utils.format_utils import put_if_present
 
 if TYPE_CHECKING:
     from edms_ai_assistant.domain.document import DocumentDto
@@ -52,71 +52,98 @@ class EDMSNaturalLanguageService:
             return {}
 
         try:
+            # Секции собираются сразу без пустых значений (put_if_present),
+            # пустые секции в результат не попадают.
+            result: dict[str, Any] = {}
+
             # 1. Базовая информация
-            base_info = {
-                "id": str(doc.id) if doc.id else None,
-                "категория": str(doc.doc_category_constant or ""),
-                "краткое_содержание": doc.short_summary,
-                "вид_документа": (
-                    doc.document_type.type_name if doc.document_type else None
-                ),
-                "способ_создания": str(doc.create_type or ""),
-                "_reg_date_iso": EdmsFormatter.format_date_iso(doc.reg_date),
-                "_create_date_iso": EdmsFormatter.format_date_iso(doc.create_date),
-            }
+            base_info: dict[str, Any] = {}
+            put_if_present(base_info, "id", str(doc.id) if doc.id else None)
+            put_if_present(
+                base_info, "категория", str(doc.doc_category_constant or "")
+            )
+            put_if_present(base_info, "краткое_содержание", doc.short_summary)
+            put_if_present(
+                base_info,
+                "вид_документа",
+                doc.document_type.type_name if doc.document_type else None,
+            )
+            put_if_present(base_info, "способ_создания", str(doc.create_type or ""))
+            put_if_present(
+                base_info, "_reg_date_iso", EdmsFormatter.format_date_iso(doc.reg_date)
+            )
+            put_if_present(
+                base_info,
+                "_create_date_iso",
+                EdmsFormatter.format_date_iso(doc.create_date),
+            )
+            put_if_present(result, "базовая_информация", base_info)
 
             # 2. Регистрация
-            registration = {
-                "рег_номер": doc.reg_number,
-                "дата_регистрации": EdmsFormatter.format_date(doc.reg_date),
-                "дата_создания": EdmsFormatter.format_datetime(doc.create_date),
-                "исходящий_номер": getattr(doc, "out_reg_number", None),
-                "исходящая_дата": EdmsFormatter.format_date(
-                    getattr(doc, "out_reg_date", None)
-                ),
-            }
+            registration: dict[str, Any] = {}
+            put_if_present(registration, "рег_номер", doc.reg_number)
+            put_if_present(
+                registration,
+                "дата_регистрации",
+                EdmsFormatter.format_date(doc.reg_date),
+            )
+            put_if_present(
+                registration,
+                "дата_создания",
+                EdmsFormatter.format_datetime(doc.create_date),
+            )
+            put_if_present(
+                registration, "исходящий_номер", getattr(doc, "out_reg_number", None)
+            )
+            put_if_present(
+                registration,
+                "исходящая_дата",
+                EdmsFormatter.format_date(getattr(doc, "out_reg_date", None)),
+            )
+            put_if_present(result, "регистрация", registration)
 
             # 3. Участники (пример доступа к полям через модель)
-            participants = {
-                "автор": EdmsFormatter.format_user(getattr(doc, "author", None)),
-                "инициатор": EdmsFormatter.format_user(getattr(doc, "initiator", None)),
-                "ответственный_исполнитель": EdmsFormatter.format_user(
-                    getattr(doc, "responsible_executor", None)
-                ),
-            }
+            participants: dict[str, Any] = {}
+            put_if_present(
+                participants,
+                "автор",
+                EdmsFormatter.format_user(getattr(doc, "author", None)),
+            )
+            put_if_present(
+                participants,
+                "инициатор",
+                EdmsFormatter.format_user(getattr(doc, "initiator", None)),
+            )
+            put_if_present(
+                participants,
+                "ответственный_исполнитель",
+                EdmsFormatter.format_user(getattr(doc, "responsible_executor", None)),
+            )
+            put_if_present(result, "участники", participants)
 
             # 4. Жизненный цикл
-            lifecycle = {
-                "текущий_статус": str(doc.status or ""),
-            }
+            lifecycle: dict[str, Any] = {}
+            put_if_present(lifecycle, "текущий_статус", str(doc.status or ""))
+            put_if_present(result, "жизненный_цикл", lifecycle)
 
             # 5. Контроль
-            control_info = {
-                "на_контроле": doc.control,
-            }
-
-            # Собираем все блоки
-            result: dict[str, Any] = {
-                "базовая_информация": clean_dict(base_info),
-                "регистрация": clean_dict(registration),
-                "участники": clean_dict(participants),
-                "жизненный_цикл": clean_dict(lifecycle),
-                "контроль": clean_dict(control_info),
-            }
+            control_info: dict[str, Any] = {}
+            put_if_present(control_info, "на_контроле", doc.control)
+            put_if_present(result, "контроль", control_info)
 
             # Добавляем инфо по обращению если есть
             if doc.document_appeal:
                 appeal = doc.document_appeal
-                result["информация_об_обращении"] = clean_dict(
-                    {
-                        "тип_заявителя": str(appeal.declarant_type or ""),
-                        "фио_заявителя": appeal.fio_applicant,
-                        "организация": appeal.organization_name,
-                        "адрес": appeal.full_address,
-                        "email": appeal.email,
-                        "телефон": appeal.phone,
-                    }
+                appeal_info: dict[str, Any] = {}
+                put_if_present(
+                    appeal_info, "тип_заявителя", str(appeal.declarant_type or "")
                 )
+                put_if_present(appeal_info, "фио_заявителя", appeal.fio_applicant)
+                put_if_present(appeal_info, "организация", appeal.organization_name)
+                put_if_present(appeal_info, "адрес", appeal.full_address)
+                put_if_present(appeal_info, "email", appeal.email)
+                put_if_present(appeal_info, "телефон", appeal.phone)
+                put_if_present(result, "информация_об_обращении", appeal_info)
 
             return result
 
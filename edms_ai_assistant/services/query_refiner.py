@@ -13,6 +13,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _compile_alternation(
+    words: dict[str, str], *, whole_word: bool = False
+) -> re.Pattern[str]:
+    """Компилирует ключи словаря в одну regex-альтернативу (длинные — первыми)."""
+    body = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    if whole_word:
+        body = rf"\b(?:{body})\b"
+    return re.compile(body, flags=re.IGNORECASE)
+
+
 class UserIntent(Enum):
     SUMMARIZE = "summarize"
     COMPARE = "compare"
@@ -126,21 +136,20 @@ class QueryRefiner:
         "оформи": "создай документ из файла",
     }
 
+    # Паттерны собираются один раз при импорте, а не на каждый запрос.
+    _DOMAIN_RE: ClassVar[re.Pattern[str]] = _compile_alternation(EDMS_DOMAIN_SYNONYMS)
+    _DOMAIN_CANONICAL: ClassVar[dict[str, str]] = {
+        jargon.lower(): canonical
+        for jargon, canonical in EDMS_DOMAIN_SYNONYMS.items()
+    }
+    _ACTION_RE: ClassVar[re.Pattern[str]] = _compile_alternation(
+        ACTION_SYNONYMS, whole_word=True
+    )
+
     def normalize_domain_synonyms(self, text: str) -> str:
         text_lower = text.lower()
-        sorted_pairs = sorted(
-            self.EDMS_DOMAIN_SYNONYMS.items(), key=lambda x: -len(x[0])
-        )
-        if not sorted_pairs:
-            return text_lower
-        pattern = re.compile(
-            "|".join(re.escape(jargon) for jargon, _ in sorted_pairs),
-            flags=re.IGNORECASE,
-        )
-        canonical_map = {
-            jargon.lower(): canonical for jargon, canonical in sorted_pairs
-        }
-        return pattern.sub(
+        canonical_map = self._DOMAIN_CANONICAL
+        return self._DOMAIN_RE.sub(
             lambda m: canonical_map.get(m.group(0).lower(), m.group(0)), text_lower
         )
 
@@ -148,10 +157,8 @@ class QueryRefiner:
         return " ".join(self.ABBREVIATIONS.get(w.lower(), w) for w in text.split())
 
     def normalize_actions(self, text: str) -> str:
-        text_lower = text.lower()
-        for synonym, canonical in self.ACTION_SYNONYMS.items():
-            text_lower = re.sub(r"\b" + synonym + r"\b", canonical, text_lower)
-        return text_lower
+        synonyms = self.ACTION_SYNONYMS
+        return self._ACTION_RE.sub(lambda m: synonyms[m.group(0)], text.lower())
 
     @staticmethod
     def add_context(
@@ -1,6 +1,7 @@
 # edms_ai_assistant/services/resolution_service.py
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
@@ -15,6 +16,8 @@ from edms_ai_assistant.services.search_utils import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+
     from edms_ai_assistant.clients.department_client import DepartmentClient
     from edms_ai_assistant.clients.employee_client import EmployeeClient
     from edms_ai_assistant.clients.group_client import GroupClient
@@ -22,6 +25,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Потолок параллельных запросов сервиса (меньше keep-alive пула транспорта)
+_MAX_CONCURRENT_LOOKUPS: int = 20
+
 
 @dataclass(frozen=True)
 class ResolutionResult:
@@ -52,6 +58,19 @@ class ResolutionService:
         self._employee_client = employee_client
         self._department_client = department_client
         self._group_client = group_client
+        # Общий на сервис: параллельные резолвинги делят один потолок запросов
+        self._lookup_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOOKUPS)
+
+    async def _gather_bounded[T, R](
+        self, items: Iterable[T], func: Callable[[T], Awaitable[R]]
+    ) -> list[R]:
+        """``asyncio.gather`` по ``items`` с ограничением параллелизма; порядок сохраняется."""
+
+        async def run(item: T) -> R:
+            async with self._lookup_semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(run(item) for item in items))
 
     async def resolve_employees(
         self,
@@ -63,23 +82,23 @@ class ResolutionService:
         not_found: list[str] = []
         ambiguous: list[AmbiguousMatch] = []
 
-        for name_query in last_names:
-            search_filter = build_employee_filter(name_query=name_query)
-            merged_parts = get_merged_name_parts(name_query=name_query)
-
+        async def search(name_query: str) -> list[EmployeeDto] | None:
             try:
-                employees = await self._employee_client.search_employees_post(
+                return await self._employee_client.search_employees_post(
                     token=token,
-                    employee_filter=search_filter,
+                    employee_filter=build_employee_filter(name_query=name_query),
                     pageable=DEFAULT_PAGEABLE,
                 )
             except Exception:
                 logger.warning(
                     "Employee search failed for '%s'", name_query, exc_info=True
                 )
-                not_found.append(name_query)
-                continue
+                return None
+
+        # Поиски по фамилиям независимы — выполняются параллельно
+        searched = await self._gather_bounded(last_names, search)
 
+        for name_query, employees in zip(last_names, searched, strict=True):
             if not employees:
                 not_found.append(name_query)
             elif len(employees) == 1:
@@ -87,6 +106,7 @@ class ResolutionService:
                     found_ids.add(employees[0].id)
             else:
                 # Пытаемся найти лучший вариант через скоринг
+                merged_parts = get_merged_name_parts(name_query=name_query)
                 best = find_best_employee_match(
                     employees,
                     last_name=merged_parts.last_name,
@@ -114,30 +134,31 @@ class ResolutionService:
         not_found: list[str] = []
         total = 0
 
-        for dept_name in department_names:
-            ns = dept_name.strip()
-            if not ns:
-                continue
+        async def resolve(ns: str) -> list[EmployeeDto] | None:
             try:
                 dept = await self._department_client.find_by_name(token, ns)
                 if not dept or not dept.id:
-                    not_found.append(f"Департамент: {ns}")
-                    continue
-
-                employees = (
-                    await self._department_client.get_employees_by_department_id(
-                        token, dept.id
-                    )
+                    return None
+                return await self._department_client.get_employees_by_department_id(
+                    token, dept.id
                 )
-                for emp in employees:
-                    if emp.id:
-                        found_ids.add(emp.id)
-                total += len(employees)
             except EdmsNotFoundError:
-                not_found.append(f"Департамент: {ns}")
+                return None
             except Exception:
                 logger.warning("Failed to resolve dept '%s'", ns, exc_info=True)
+                return None
+
+        names = [ns for dept_name in department_names if (ns := dept_name.strip())]
+        resolved = await self._gather_bounded(names, resolve)
+
+        for ns, employees in zip(names, resolved, strict=True):
+            if employees is None:
                 not_found.append(f"Департамент: {ns}")
+                continue
+            for emp in employees:
+                if emp.id:
+                    found_ids.add(emp.id)
+            total += len(employees)
 
         return found_ids, not_found, total
 
@@ -150,30 +171,29 @@ class ResolutionService:
         group_ids: list[UUID] = []
         label = "Личная группа" if personal else "Группа"
 
-        for group_name in group_names:
-            ns = group_name.strip()
-            if not ns:
-                continue
+        async def find(ns: str) -> UUID | None:
             try:
                 if personal:
                     group = await self._group_client.find_personal_by_name(token, ns)
                 else:
                     group = await self._group_client.find_by_name(token, ns)
-
-                if not group:
-                    not_found.append(f"{label}: {ns}")
-                    continue
-
-                group_id = group.get("id")
-                if group_id:
-                    group_ids.append(UUID(str(group_id)))
+                group_id = group.get("id") if group else None
+                return UUID(str(group_id)) if group_id else None
             except EdmsNotFoundError:
-                not_found.append(f"{label}: {ns}")
+                return None
             except Exception:
                 logger.warning(
                     "Failed to resolve %s '%s'", label.lower(), ns, exc_info=True
                 )
+                return None
+
+        names = [ns for group_name in group_names if (ns := group_name.strip())]
+        found_groups = await self._gather_bounded(names, find)
+        for ns, group_id in zip(names, found_groups, strict=True):
+            if group_id is None:
                 not_found.append(f"{label}: {ns}")
+            else:
+                group_ids.append(group_id)
 
         total = 0
         if group_ids:
@@ -249,34 +269,40 @@ class ResolutionService:
         not_found: list[str] = []
         summary: list[str] = []
 
-        if department_names:
-            ids, nf, cnt = await self.resolve_departments(token, department_names)
-            found_ids.update(ids)
-            not_found.extend(nf)
-            if cnt:
-                summary.append(f"подразделения: {cnt} сотр.")
-
-        if group_names:
-            ids, nf, cnt = await self.resolve_groups(token, group_names, personal=False)
-            found_ids.update(ids)
-            not_found.extend(nf)
-            if cnt:
-                summary.append(f"группы: {cnt} сотр.")
-
-        if personal_group_names:
-            ids, nf, cnt = await self.resolve_groups(
-                token, personal_group_names, personal=True
-            )
-            found_ids.update(ids)
-            not_found.extend(nf)
-            if cnt:
-                summary.append(f"личные группы: {cnt} сотр.")
+        async def no_match() -> tuple[set[UUID], list[str], int]:
+            return set(), [], 0
 
-        if include_subordinates:
+        async def subordinates() -> tuple[set[UUID], list[str], int]:
+            if not include_subordinates:
+                return set(), [], 0
             ids, cnt = await self.resolve_subordinates(token)
+            return ids, [], cnt
+
+        # Критерии независимы — резолвятся параллельно, итог собирается по порядку
+        parts = await asyncio.gather(
+            (
+                self.resolve_departments(token, department_names)
+                if department_names
+                else no_match()
+            ),
+            (
+                self.resolve_groups(token, group_names, personal=False)
+                if group_names
+                else no_match()
+            ),
+            (
+                self.resolve_groups(token, personal_group_names, personal=True)
+                if personal_group_names
+                else no_match()
+            ),
+            subordinates(),
+        )
+        labels = ("подразделения", "группы", "личные группы", "подчинённые")
+        for label, (ids, nf, cnt) in zip(labels, parts, strict=True):
             found_ids.update(ids)
+            not_found.extend(nf)
             if cnt:
-                summary.append(f"подчинённые: {cnt} сотр.")
+                summary.append(f"{label}: {cnt} сотр.")
 
         return ResolutionResult(
             employee_ids=found_ids, not_found=not_found, resolved_summary=summary
@@ -284,21 +310,16 @@ class ResolutionService:
 
     @staticmethod
     def _format_employee_match(employee: EmployeeDto) -> dict:
-        """Форматирует данные сотрудника для disambiguation response."""
-        post_name = (
-            employee.post.post_name
-            if employee.post and employee.post.post_name
-            else "Не указана"
-        )
-        dept_name = (
-            employee.department.name
-            if employee.department and employee.department.name
-            else "Не указан"
-        )
+        """Форматирует данные сотрудника для disambiguation response.
 
+        Прямой доступ к атрибутам: ``model_dump(include=...)`` с вложенными
+        post/department на этом DTO в разы медленнее.
+        """
+        post, dept = employee.post, employee.department
+        name_parts = (employee.last_name, employee.first_name, employee.middle_name)
         return {
             "id": str(employee.id),
-            "full_name": f"{employee.last_name or ''} {employee.first_name or ''} {employee.middle_name or ''}".strip(),
-            "post": post_name,
-            "department": dept_name,
+            "full_name": " ".join(filter(None, name_parts)),
+            "post": (post.post_name if post else None) or "Не указана",
+            "department": (dept.name if dept else None) or "Не указан",
         }
@@ -43,6 +43,7 @@ def build_employee_filter(
     active: bool | None = None,
     fired: bool | None = None,
     includes: list[str] | None = None,
+    name_parts: NameParts | None = None,
 ) -> dict[str, Any]:
     """Строит EmployeeFilter для POST /api/employee/search.
 
@@ -51,14 +52,21 @@ def build_employee_filter(
     ТОЛЬКО lastName (если задан). Фильтрация по остальным полям
     выполняется scoring engine на стороне Python (AND-логика).
 
+    Если вызывающий код уже получил ``get_merged_name_parts``, их можно
+    передать в ``name_parts`` — тогда ФИО повторно не разбирается.
+
     Returns:
         Dict с camelCase ключами, совместимый с EmployeeFilter.java
     """
-    merged = merge_name_parts(
-        name_query=name_query,
-        last_name=last_name,
-        first_name=first_name,
-        middle_name=middle_name,
+    merged = (
+        name_parts
+        if name_parts is not None
+        else merge_name_parts(
+            name_query=name_query,
+            last_name=last_name,
+            first_name=first_name,
+            middle_name=middle_name,
+        )
     )
 
     result: dict[str, Any] = {}
@@ -70,8 +78,8 @@ def build_employee_filter(
     elif merged.middle_name:
         result["middleName"] = merged.middle_name
 
-    if full_post_name and full_post_name.strip():
-        result["fullPostName"] = full_post_name.strip()
+    if full_post_name and (post_name := full_post_name.strip()):
+        result["fullPostName"] = post_name
     if post_id is not None:
         result["postId"] = post_id
     if active is not None:
@@ -84,6 +92,44 @@ def build_employee_filter(
     return result
 
 
+def _fold(value: str | None) -> str:
+    return value.casefold() if value else ""
+
+
+def _prefix_score(value: str | None, term: str) -> int:
+    """10 — точное совпадение, 5 — совпадение по префиксу (term уже casefold)."""
+    if not term:
+        return 0
+    val = _fold(value)
+    if val == term:
+        return 10
+    return 5 if val.startswith(term) else 0
+
+
+def _score_folded(
+    result: EmployeeDto,
+    last_name: str,
+    first_name: str,
+    middle_name: str,
+    full_post_name: str,
+) -> int:
+    """Скоринг по заранее приведённым (casefold) критериям."""
+    score = (
+        _prefix_score(result.last_name, last_name)
+        + _prefix_score(result.first_name, first_name)
+        + _prefix_score(result.middle_name, middle_name)
+    )
+    if full_post_name:
+        post_name = _fold(result.post.post_name if result.post else None)
+        if post_name == full_post_name:
+            score += 10
+        elif post_name.startswith(full_post_name):
+            score += 7
+        elif full_post_name in post_name:
+            score += 3
+    return score
+
+
 def score_employee_result(
     result: EmployeeDto,
     last_name: str | None,
@@ -92,38 +138,13 @@ def score_employee_result(
     full_post_name: str | None = None,
 ) -> int:
     """Оценивает совпадение сотрудника с заданными критериями."""
-    score = 0
-    if last_name:
-        val = (result.last_name or "").lower()
-        term = last_name.lower()
-        if val == term:
-            score += 10
-        elif val.startswith(term):
-            score += 5
-    if first_name:
-        val = (result.first_name or "").lower()
-        term = first_name.lower()
-        if val == term:
-            score += 10
-        elif val.startswith(term):
-            score += 5
-    if middle_name:
-        val = (result.middle_name or "").lower()
-        term = middle_name.lower()
-        if val == term:
-            score += 10
-        elif val.startswith(term):
-            score += 5
-    if full_post_name:
-        post_name = (result.post.post_name if result.post else "").lower()
-        term = full_post_name.lower()
-        if post_name == term:
-            score += 10
-        elif post_name.startswith(term):
-            score += 7
-        elif term in post_name:
-            score += 3
-    return score
+    return _score_folded(
+        result,
+        _fold(last_name),
+        _fold(first_name),
+        _fold(middle_name),
+        _fold(full_post_name),
+    )
 
 
 def find_best_employee_match(
@@ -137,15 +158,14 @@ def find_best_employee_match(
     has_criteria = any((last_name, first_name, middle_name, full_post_name))
     if not has_criteria:
         return None
-    scored = [
-        (
-            r,
-            score_employee_result(
-                r, last_name, first_name, middle_name, full_post_name
-            ),
-        )
-        for r in results
-    ]
+    # Критерии приводятся к casefold один раз, а не для каждого кандидата
+    terms = (
+        _fold(last_name),
+        _fold(first_name),
+        _fold(middle_name),
+        _fold(full_post_name),
+    )
+    scored = [(r, _score_folded(r, *terms)) for r in results]
     scored.sort(key=lambda x: x[1], reverse=True)
     if not scored:
         return None
@@ -20,6 +20,10 @@ from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+# Верхняя граница символов на токен: префикс такой длины гарантированно
+# покрывает бюджет, поэтому truncate() не кодирует весь документ.
+_MAX_CHARS_PER_TOKEN = 8
+
 _TIKTOKEN_AVAILABLE = False
 try:
     import tiktoken  # type: ignore[import]
@@ -43,6 +47,18 @@ class TokenCounter(ABC):
         """Count tokens for a list of {'role': ..., 'content': ...} messages."""
         ...
 
+    @abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of ``text`` that fits into ``max_tokens``."""
+        ...
+
+    @abstractmethod
+    def truncate_head_tail(
+        self, text: str, head_tokens: int, tail_tokens: int, separator: str
+    ) -> str:
+        """Keep ``head_tokens`` from the start and ``tail_tokens`` from the end."""
+        ...
+
 
 class TiktokenCounter(TokenCounter):
     """Accurate token counter using tiktoken cl100k_base.
@@ -92,6 +108,38 @@ class TiktokenCounter(TokenCounter):
                 total += self.count(str(value))
         return total
 
+    def truncate(self, text: str, max_tokens: int) -> str:
+        # Кодируем только заведомо достаточный префикс, а не весь документ.
+        head = text[: max_tokens * _MAX_CHARS_PER_TOKEN]
+        try:
+            enc = self._get_encoder()
+            tokens = enc.encode(head, disallowed_special=())  # type: ignore[attr-defined]
+        except Exception:
+            return _char_ratio_truncate(text, max_tokens)
+        if len(tokens) <= max_tokens:
+            return head
+        # Граница токена может разрезать многобайтный символ.
+        return enc.decode(tokens[:max_tokens]).rstrip("\ufffd")  # type: ignore[attr-defined]
+
+    def truncate_head_tail(
+        self, text: str, head_tokens: int, tail_tokens: int, separator: str
+    ) -> str:
+        try:
+            enc = self._get_encoder()
+            tokens = enc.encode(text, disallowed_special=())  # type: ignore[attr-defined]
+        except Exception:
+            return _char_ratio_head_tail(text, head_tokens, tail_tokens, separator)
+        if len(tokens) <= head_tokens + tail_tokens:
+            return text
+        head = enc.decode(tokens[:head_tokens]).rstrip("\ufffd")  # type: ignore[attr-defined]
+        # tokens[-0:] — весь список, поэтому нулевой хвост обрабатываем явно
+        tail = (
+            enc.decode(tokens[-tail_tokens:]).lstrip("\ufffd")  # type: ignore[attr-defined]
+            if tail_tokens
+            else ""
+        )
+        return f"{head}{separator}{tail}"
+
 
 class CharRatioTokenCounter(TokenCounter):
     """Fallback counter using character ratio heuristic.
@@ -112,6 +160,35 @@ class CharRatioTokenCounter(TokenCounter):
                 total += self.count(str(value))
         return total
 
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return _char_ratio_truncate(text, max_tokens)
+
+    def truncate_head_tail(
+        self, text: str, head_tokens: int, tail_tokens: int, separator: str
+    ) -> str:
+        return _char_ratio_head_tail(text, head_tokens, tail_tokens, separator)
+
+
+def _char_ratio_truncate(text: str, max_tokens: int) -> str:
+    """Char-ratio approximation of a ``max_tokens`` prefix."""
+    tokens = _char_ratio_count(text)
+    if tokens <= max_tokens:
+        return text
+    return text[: int(max_tokens * len(text) / tokens)]
+
+
+def _char_ratio_head_tail(
+    text: str, head_tokens: int, tail_tokens: int, separator: str
+) -> str:
+    """Char-ratio approximation of a head + tail token window."""
+    tokens = _char_ratio_count(text)
+    if tokens <= head_tokens + tail_tokens:
+        return text
+    chars_per_token = len(text) / tokens
+    head = text[: int(head_tokens * chars_per_token)]
+    tail = text[-int(tail_tokens * chars_per_token) :] if tail_tokens else ""
+    return f"{head}{separator}{tail}"
+
 
 def _char_ratio_count(text: str) -> int:
     """Improved char ratio with Cyrillic detection."""
@@ -145,6 +222,34 @@ def count_message_tokens(messages: list[dict]) -> int:
     return get_token_counter().count_messages(messages)
 
 
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Обрезает текст по бюджету токенов, а не символов.
+
+    Кириллица и таблицы с числами дают очень разное число символов на токен,
+    поэтому фиксированный лимит в символах то переполняет, то недоиспользует
+    контекст модели.
+    """
+    return get_token_counter().truncate(text, max_tokens)
+
+
+def truncate_head_tail_tokens(
+    text: str,
+    max_tokens: int,
+    *,
+    tail_share: float = 1 / 3,
+    separator: str = "\n\n[...]\n\n",
+) -> str:
+    """Оставляет начало и конец текста в пределах ``max_tokens``.
+
+    Реквизиты и подписи документа часто в конце, поэтому ``tail_share``
+    бюджета отдаётся хвосту; текст кодируется один раз.
+    """
+    tail_tokens = int(max_tokens * tail_share)
+    return get_token_counter().truncate_head_tail(
+        text, max_tokens - tail_tokens, tail_tokens, separator
+    )
+
+
 def estimate_cost(
     input_tokens: int,
     output_tokens: int,
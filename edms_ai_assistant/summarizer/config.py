@@ -25,6 +25,7 @@ class SummarizerConfig(BaseModel):
     context_window_tokens: int = Field(default=4096, gt=0)
     max_output_tokens: int = Field(default=4096, gt=0)
     max_concurrent_map: int = Field(default=6, gt=0)
+    max_concurrent_llm: int = Field(default=8, gt=0)
 
     # Telemetry
     otlp_endpoint: str | None = None
@@ -55,6 +56,9 @@ class SummarizerConfig(BaseModel):
             max_concurrent_map=int(
                 getattr(settings, "SUMMARIZER_MAX_CONCURRENT_MAP", 6)
             ),
+            max_concurrent_llm=int(
+                getattr(settings, "SUMMARIZER_MAX_CONCURRENT_LLM", 8)
+            ),
             otlp_endpoint=getattr(settings, "TELEMETRY_ENDPOINT", None),
             quality_model=getattr(settings, "SUMMARIZER_QUALITY_MODEL", None),
         )
@@ -47,6 +47,7 @@ async def build_summarization_service(settings: object) -> SummarizationService:
         api_key=config.resolved_api_key(),
         base_url=base_url,
         timeout=config.llm_timeout_s,
+        max_concurrent_requests=config.max_concurrent_llm,
     )
     logger.info("LLM client: model=%s base_url=%s", config.llm_model, base_url)
 
@@ -137,8 +137,16 @@ class OpenAICompatibleClient(LLMClient):
         timeout: float = 120.0,
         *,
         client: httpx.AsyncClient | None = None,
+        max_concurrent_requests: int | None = None,
     ) -> None:
         self._api_key = api_key
+        # Общий лимит одновременных запросов к LLM: параллельные вызовы тулов
+        # (суммаризация нескольких вложений, map-фазы) делят одни слоты.
+        self._request_slots = (
+            asyncio.Semaphore(max_concurrent_requests)
+            if max_concurrent_requests
+            else None
+        )
         self._base_url = base_url.rstrip("/")
         self._is_ollama = _is_ollama(base_url)
         self._owns_client = client is None
@@ -222,7 +230,7 @@ class OpenAICompatibleClient(LLMClient):
         usage_out: int | None = None
 
         try:
-            async with self._client.stream(
+            async with self._slot(), self._client.stream(
                 "POST", "/chat/completions", json=payload
             ) as response:
                 if response.status_code >= 400:
@@ -274,11 +282,20 @@ class OpenAICompatibleClient(LLMClient):
             finish_reason=finish_reason,
         )
 
+    def _slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Слот глобального лимита; backoff между ретраями слот не держит."""
+        if self._request_slots is None:
+            return contextlib.nullcontext()
+        return self._request_slots
+
     async def _post_with_retry(self, payload: dict) -> tuple[str, int, int]:
         last_exc: Exception | None = None
         for attempt in range(self._MAX_RETRIES):
             try:
-                response = await self._client.post("/chat/completions", json=payload)
+                async with self._slot():
+                    response = await self._client.post(
+                        "/chat/completions", json=payload
+                    )
             except (httpx.TransportError, httpx.TimeoutException) as exc:
                 last_exc = exc
                 if attempt < self._MAX_RETRIES - 1:
@@ -345,6 +362,13 @@ class OpenAICompatibleClient(LLMClient):
                 )
 
             usage = data.get("usage", {})
+            cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+            if cached:
+                logger.debug(
+                    "LLM prompt cache hit: cached_tokens=%s prompt_tokens=%s",
+                    cached,
+                    usage.get("prompt_tokens"),
+                )
             in_t = usage.get("prompt_tokens") or count_tokens(
                 "".join(m.get("content", "") for m in payload.get("messages", []))
             )
@@ -4,6 +4,7 @@ Typed Prompt Registry — version-controlled prompts.
 
 from __future__ import annotations
 
+import functools
 import json
 from typing import ClassVar, Final
 
@@ -17,8 +18,9 @@ from edms_ai_assistant.summarizer.structured.models import (
 PROMPT_REGISTRY_VERSION: Final[str] = "2025.06.002"
 
 
+@functools.cache
 def _schema_hint(mode: SummaryMode) -> str:
-    """Compact JSON Schema hint for the mode's output model."""
+    """Compact JSON Schema hint for the mode's output model (memoized per mode)."""
     model_cls = MODE_OUTPUT_MODEL[mode]
     schema = model_cls.model_json_schema()
     required = schema.get("required", [])
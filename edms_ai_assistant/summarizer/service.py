@@ -16,7 +16,10 @@ from pydantic import BaseModel, Field
 from edms_ai_assistant.config import settings
 from edms_ai_assistant.summarizer.cache.cache import CacheEntry, TwoLevelCache
 from edms_ai_assistant.summarizer.chunking.structural import SmartChunker
-from edms_ai_assistant.summarizer.chunking.token_aware import count_tokens
+from edms_ai_assistant.summarizer.chunking.token_aware import (
+    count_tokens,
+    truncate_to_tokens,
+)
 from edms_ai_assistant.summarizer.errors import PipelineError, TextExtractionError
 from edms_ai_assistant.summarizer.observability.logging_ctx import request_id_var
 from edms_ai_assistant.summarizer.observability.tracing import (
@@ -375,20 +378,21 @@ class SummarizationService:
         if not request.force_refresh:
             async with self._inflight_lock:
                 pending = self._inflight.get(cache_key)
-                if pending is not None:
-                    logger.info(
-                        "In-flight dedup: request_id=%s waits for key=%s",
-                        request.request_id,
-                        cache_key[:12],
+                if pending is None:
+                    future: asyncio.Future[SummarizationResponse] = (
+                        asyncio.get_running_loop().create_future()
                     )
-                    pending_request_id = request.request_id
-                    result = await asyncio.shield(pending)
-                    return result.model_copy(update={"request_id": pending_request_id})
-
-                future: asyncio.Future[SummarizationResponse] = (
-                    asyncio.get_running_loop().create_future()
+                    self._inflight[cache_key] = future
+            # Ждём вне лока: иначе запросы с другими ключами стоят в очереди,
+            # пока не завершится чужая суммаризация.
+            if pending is not None:
+                logger.info(
+                    "In-flight dedup: request_id=%s waits for key=%s",
+                    request.request_id,
+                    cache_key[:12],
                 )
-                self._inflight[cache_key] = future
+                result = await asyncio.shield(pending)
+                return result.model_copy(update={"request_id": request.request_id})
         else:
             future = None  # type: ignore[assignment]
 
@@ -446,7 +450,8 @@ class SummarizationService:
                 request.file_content, request.file_name
             )
 
-        if not text.strip():
+        # isspace() не копирует документ целиком, в отличие от strip().
+        if not text or text.isspace():
             raise TextExtractionError(
                 f"Не удалось извлечь текст из '{request.file_name}'"
             )
@@ -651,7 +656,7 @@ class SummarizationService:
             text = await extract_text_from_bytes(
                 request.file_content, request.file_name
             )
-        if not text.strip():
+        if not text or text.isspace():
             raise TextExtractionError(
                 f"Не удалось извлечь текст из '{request.file_name}'"
             )
@@ -726,7 +731,7 @@ class SummarizationService:
         source_text: str,
         summary_text: str,
         *,
-        max_source_chars: int = 8000,
+        max_source_tokens: int = 3000,
     ) -> QualityScore | None:
         """LLM-as-judge: оценивает качество суммаризации (0.0–1.0).
 
@@ -739,7 +744,7 @@ class SummarizationService:
         template = self._prompts.get_judge()
         system = template.system
         user = template.user_template.format(
-            text=source_text[:max_source_chars],
+            text=truncate_to_tokens(source_text, max_source_tokens),
             summary=summary_text,
         )
 
@@ -7,7 +7,7 @@ EDMS AI Assistant — Acting Officer Tool.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import Annotated, Any
 
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from pydantic import BaseModel, Field
@@ -5,9 +5,10 @@ Universal tool for rendering LLM-driven choices as clickable cards.
 
 from __future__ import annotations
 
-import json
 import logging
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import Annotated, Any
+
+import orjson
 
 from langchain_core.tools import InjectedToolArg, tool
 from pydantic import BaseModel, Field
@@ -105,10 +106,10 @@ async def ask_user_to_select(
                 rich: dict[str, Any] | None = None
                 if stripped.startswith("{") and stripped.endswith("}"):
                     try:
-                        parsed = json.loads(stripped)
+                        parsed = orjson.loads(stripped)
                         if isinstance(parsed, dict) and parsed.get("label"):
                             rich = parsed
-                    except (json.JSONDecodeError, TypeError):
+                    except orjson.JSONDecodeError:
                         rich = None
 
                 if rich is not None:
@@ -7,13 +7,15 @@ EDMS AI Assistant — Attachment Fetch Tool (DI Factory).
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
-import tempfile
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
+import aiofiles.tempfile
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from pydantic import BaseModel, Field, field_validator
 
@@ -27,7 +29,12 @@ from edms_ai_assistant.agent.runnable_utils import (
     get_document_id_from_config,
     get_token_from_config,
 )
-from edms_ai_assistant.domain.document import DocumentDto
+from edms_ai_assistant.services.file_processor import (
+    is_extraction_error,
+    remove_temp_file,
+)
+from edms_ai_assistant.utils.cache_utils import TTLCache
+from edms_ai_assistant.utils.hash_utils import get_token_fingerprint
 from edms_ai_assistant.utils.regex_utils import UUID_RE
 from langchain_core.runnables import RunnableConfig
 if TYPE_CHECKING:
@@ -35,6 +42,7 @@ if TYPE_CHECKING:
 
     from edms_ai_assistant.clients.attachment_client import AttachmentClient
     from edms_ai_assistant.clients.document_client import DocumentClient
+    from edms_ai_assistant.domain.document import AttachmentDocumentDto
     from edms_ai_assistant.core.deps import AppDeps
     from edms_ai_assistant.services.file_processor import FileProcessorService
 
@@ -111,14 +119,12 @@ class AttachmentFetchInput(BaseModel):
 # ─── Private helpers ──────────────────────────────────────────────────────────
 
 
-def _get_attachment_name(attachment: Any) -> str:
-    return (
-        getattr(attachment, "name", None) or getattr(attachment, "fileName", None) or ""
-    )
+def _get_attachment_name(attachment: AttachmentDocumentDto) -> str:
+    return attachment.name or ""
 
 
-def _get_attachment_id(attachment: Any) -> str:
-    return str(getattr(attachment, "id", "") or "")
+def _get_attachment_id(attachment: AttachmentDocumentDto) -> str:
+    return str(attachment.id) if attachment.id else ""
 
 
 def _ensure_uuid(value: Any, *, field: str) -> UUID:
@@ -130,7 +136,9 @@ def _ensure_uuid(value: Any, *, field: str) -> UUID:
         raise ValueError(f"{field} должен быть корректным UUID") from exc
 
 
-def _resolve_attachment(attachments: list[Any], hint: str) -> Any | None:
+def _resolve_attachment(
+    attachments: list[AttachmentDocumentDto], hint: str
+) -> AttachmentDocumentDto | None:
     hint_stripped = hint.strip()
 
     if UUID_RE.match(hint_stripped):
@@ -145,62 +153,225 @@ def _resolve_attachment(attachments: list[Any], hint: str) -> Any | None:
     hint_lower = hint_stripped.lower()
     hint_stem = Path(hint_lower).stem
 
+    # Один проход: имя приводится к нижнему регистру один раз на вложение,
+    # приоритет (точное имя > stem > частичный stem) сохраняется.
+    by_stem: AttachmentDocumentDto | None = None
+    by_partial: tuple[AttachmentDocumentDto, str] | None = None
     for att in attachments:
-        if _get_attachment_name(att).lower() == hint_lower:
+        name_lc = _get_attachment_name(att).lower()
+        if name_lc == hint_lower:
             logger.info("Resolved attachment by exact name: '%s'", hint_stripped)
             return att
-
-    for att in attachments:
-        att_stem = Path(_get_attachment_name(att).lower()).stem
-        if att_stem == hint_stem and hint_stem:
-            logger.info("Resolved attachment by stem: '%s'", hint_stripped)
-            return att
-
-    for att in attachments:
-        att_stem = Path(_get_attachment_name(att).lower()).stem
-        if hint_stem and att_stem and (hint_stem in att_stem or att_stem in hint_stem):
-            logger.info(
-                "Resolved attachment by partial stem: '%s' ~ '%s'",
-                hint_stem,
-                att_stem,
-            )
-            return att
+        if not hint_stem or by_stem is not None:
+            continue
+        att_stem = Path(name_lc).stem
+        if att_stem == hint_stem:
+            by_stem = att
+        elif (
+            by_partial is None
+            and att_stem
+            and (hint_stem in att_stem or att_stem in hint_stem)
+        ):
+            by_partial = (att, att_stem)
+
+    if by_stem is not None:
+        logger.info("Resolved attachment by stem: '%s'", hint_stripped)
+        return by_stem
+
+    if by_partial is not None:
+        att, att_stem = by_partial
+        logger.info(
+            "Resolved attachment by partial stem: '%s' ~ '%s'",
+            hint_stem,
+            att_stem,
+        )
+        return att
 
     return None
 
 
-def _build_attachment_meta(attachment: Any) -> dict[str, Any]:
+def _build_attachment_meta(attachment: AttachmentDocumentDto) -> dict[str, Any]:
     name = _get_attachment_name(attachment) or "unknown"
-    size_bytes: int = getattr(attachment, "size", None) or 0
-    upload_date = getattr(attachment, "uploadDate", None)
-    signs = getattr(attachment, "signs", None) or []
-
-    att_type_obj = getattr(attachment, "attachmentDocumentType", None)
-    att_type: str | None = None
-    if att_type_obj:
-        att_type = getattr(att_type_obj, "name", None) or str(att_type_obj)
+    size_bytes = attachment.size or 0
+    att_type_obj = attachment.attachment_document_type
+    att_type: str | None = att_type_obj.name if att_type_obj else None
 
-    formatted_date: str | None = None
-    if upload_date:
-        try:
-            formatted_date = (
-                upload_date.strftime("%d.%m.%Y %H:%M")
-                if hasattr(upload_date, "strftime")
-                else str(upload_date)[:16]
-            )
-        except Exception:
-            formatted_date = str(upload_date)
+    upload_date = attachment.upload_date
+    formatted_date = upload_date.strftime("%d.%m.%Y %H:%M") if upload_date else None
 
     return {
         "название": name,
         "тип_вложения": att_type,
         "размер_кб": round(size_bytes / 1024, 2) if size_bytes else 0,
         "дата_загрузки": formatted_date,
-        "есть_эцп": bool(signs),
+        "есть_эцп": bool(attachment.signs),
         "id": _get_attachment_id(attachment) or None,
     }
 
 
+# ─── Shared download + extraction ─────────────────────────────────────────────
+
+_TEXT_CACHE: TTLCache[tuple[str, str, str], str] = TTLCache(maxsize=32, ttl=300)
+# Вложения до этого размера остаются в памяти, крупные — пишутся на диск
+# по мере скачивания, не буферизуясь целиком.
+_SPOOL_MEMORY_LIMIT: int = 8 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class SpooledAttachment:
+    """Downloaded attachment body: in memory (``data``) or on disk (``path``)."""
+
+    data: bytes | None = None
+    path: str | None = None
+    size: int = 0
+
+    async def discard(self) -> None:
+        """Remove the temp file (off the event loop), if one was created."""
+        if self.path is not None:
+            await asyncio.to_thread(remove_temp_file, self.path)
+            self.path = None
+
+
+async def spool_attachment(
+    attach_client: AttachmentClient,
+    token: str,
+    document_id: UUID,
+    attachment_id: UUID,
+    suffix: str,
+    *,
+    size_hint: int | None = None,
+) -> SpooledAttachment:
+    """Stream an attachment, keeping it in memory up to ``_SPOOL_MEMORY_LIMIT``.
+
+    Larger bodies roll over to a temp file chunk by chunk, so peak memory
+    stays bounded. When ``size_hint`` (size from document metadata) already
+    exceeds the limit, chunks go to disk from the start. The caller must
+    await :meth:`SpooledAttachment.discard`.
+
+    Raises:
+        Exception: Download errors are propagated to the caller.
+    """
+    buffer = bytearray()
+    path: str | None = None
+    size = 0
+    to_disk = size_hint is not None and size_hint > _SPOOL_MEMORY_LIMIT
+    try:
+        stream = attach_client.stream_attachment_content(
+            token, document_id, attachment_id
+        )
+        async for chunk in stream:
+            size += len(chunk)
+            if not to_disk and size <= _SPOOL_MEMORY_LIMIT:
+                buffer += chunk
+                continue
+            async with aiofiles.tempfile.NamedTemporaryFile(
+                "wb", suffix=suffix, prefix="edms_att_", delete=False
+            ) as out:
+                path = str(out.name)
+                if buffer:
+                    await out.write(buffer)
+                    buffer = bytearray()
+                await out.write(chunk)
+                async for rest in stream:
+                    size += len(rest)
+                    await out.write(rest)
+            break
+    except BaseException:
+        if path is not None:
+            await asyncio.to_thread(remove_temp_file, path)
+        raise
+    if path is not None:
+        return SpooledAttachment(path=path, size=size)
+    return SpooledAttachment(data=bytes(buffer), size=size)
+
+
+async def fetch_attachment_text(
+    attach_client: AttachmentClient,
+    file_processor: FileProcessorService,
+    token: str,
+    document_id: UUID,
+    attachment_id: UUID,
+    suffix: str,
+    *,
+    size_hint: int | None = None,
+) -> str | None:
+    """Download an attachment and extract its full text.
+
+    Successful extractions are memoised for a few minutes per
+    ``(token, document_id, attachment_id)``, so back-to-back tool calls in
+    one agent turn share a single download and parse.
+
+    Args:
+        attach_client: Attachment API client.
+        file_processor: Text extraction service.
+        token: User JWT (only its fingerprint is used as the cache key).
+        document_id: Owning document UUID.
+        attachment_id: Attachment UUID.
+        suffix: File extension including the dot.
+        size_hint: Expected size in bytes (from metadata), if known.
+
+    Returns:
+        Extracted text (or a FileProcessorService error message), ``None``
+        when the attachment is empty.
+
+    Raises:
+        Exception: Download errors are propagated to the caller.
+    """
+    key = (get_token_fingerprint(token), str(document_id), str(attachment_id))
+    cached = _TEXT_CACHE.get(key)
+    if cached is not None:
+        logger.debug("Attachment text cache hit: %s...", str(attachment_id)[:8])
+        return cached
+
+    spooled = await spool_attachment(
+        attach_client,
+        token,
+        document_id,
+        attachment_id,
+        suffix,
+        size_hint=size_hint,
+    )
+    try:
+        if not spooled.size:
+            return None
+        if spooled.path is not None:
+            text = await file_processor.extract_text_async(spooled.path)
+        else:
+            text = await file_processor.extract_text_from_bytes_async(
+                spooled.data, suffix
+            )
+    finally:
+        await spooled.discard()
+
+    if not is_extraction_error(text):
+        _TEXT_CACHE.set(key, text)
+    return text
+
+
+@dataclass(slots=True, frozen=True)
+class _FetchTarget:
+    """Resolved attachment passed to the per-mode handlers of the tool."""
+
+    document_id: UUID
+    attachment_id: UUID
+    file_info: dict[str, Any]
+    file_name: str
+    suffix: str
+    size_hint: int | None
+    summary_type: str | None
+
+    def error(self, message: str) -> dict[str, Any]:
+        return {
+            "status": "error",
+            "message": message,
+            "file_info": self.file_info,
+            "summary_type": self.summary_type,
+        }
+
+
+type _ModeHandler = Callable[[str, _FetchTarget], Awaitable[dict[str, Any]]]
+
+
 # ─── Tool Factory ─────────────────────────────────────────────────────────────
 
 
@@ -211,6 +382,160 @@ def create_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
     attach_client: AttachmentClient = deps.attachment_client
     file_processor: FileProcessorService = deps.file_processor_service
 
+    async def _handle_text(token: str, ctx: _FetchTarget) -> dict[str, Any]:
+        if ctx.suffix not in _ALL_SUPPORTED:
+            return {
+                "status": "warning",
+                "message": (
+                    f"Формат '{ctx.suffix}' не поддерживается для извлечения текста. "
+                    f"Поддерживаемые: {', '.join(sorted(_ALL_SUPPORTED))}. "
+                    "Метаданные файла возвращены."
+                ),
+                "file_info": ctx.file_info,
+                "summary_type": ctx.summary_type,
+            }
+        try:
+            text_content = await fetch_attachment_text(
+                attach_client,
+                file_processor,
+                token,
+                ctx.document_id,
+                ctx.attachment_id,
+                ctx.suffix,
+                size_hint=ctx.size_hint,
+            )
+        except Exception as exc:
+            logger.error(
+                "Failed to fetch attachment '%s': %s",
+                ctx.file_name,
+                exc,
+                exc_info=True,
+            )
+            return ctx.error(f"Ошибка скачивания «{ctx.file_name}»: {exc}")
+
+        if text_content is None:
+            return ctx.error(
+                f"Файл «{ctx.file_name}» пустой или недоступен для скачивания."
+            )
+
+        if is_extraction_error(text_content):
+            return ctx.error(
+                f"Не удалось извлечь текст из «{ctx.file_name}». "
+                "Возможно, файл является сканом или защищён паролем. "
+                f"Подробности: {text_content}"
+            )
+
+        return {
+            "status": "success",
+            "mode": "text",
+            "file_info": ctx.file_info,
+            "content": text_content[:_MAX_TEXT_CHARS],
+            "is_truncated": len(text_content) > _MAX_TEXT_CHARS,
+            "total_chars": len(text_content),
+            "summary_type": ctx.summary_type,
+        }
+
+    async def _download(
+        token: str, ctx: _FetchTarget
+    ) -> SpooledAttachment | dict[str, Any]:
+        """Скачивает вложение для tables/full; при ошибке возвращает error-ответ."""
+        try:
+            spooled = await spool_attachment(
+                attach_client,
+                token,
+                ctx.document_id,
+                ctx.attachment_id,
+                ctx.suffix,
+                size_hint=ctx.size_hint,
+            )
+        except Exception as exc:
+            logger.error(
+                "Failed to download attachment '%s': %s",
+                ctx.file_name,
+                exc,
+                exc_info=True,
+            )
+            return ctx.error(f"Ошибка скачивания «{ctx.file_name}»: {exc}")
+
+        if not spooled.size:
+            return ctx.error(
+                f"Файл «{ctx.file_name}» пустой или недоступен для скачивания."
+            )
+        return spooled
+
+    def _processing_error(ctx: _FetchTarget, exc: Exception) -> dict[str, Any]:
+        logger.error(
+            "File processing error for '%s': %s", ctx.file_name, exc, exc_info=True
+        )
+        return ctx.error(
+            f"Не удалось обработать «{ctx.file_name}»: {exc}. "
+            "Возможно, файл повреждён или защищён паролем."
+        )
+
+    async def _handle_tables(token: str, ctx: _FetchTarget) -> dict[str, Any]:
+        if ctx.suffix not in _SUPPORTED_TABLE_EXTENSIONS:
+            return ctx.error(
+                f"Режим 'tables' поддерживается только для Excel/CSV. "
+                f"Текущий формат: '{ctx.suffix}'. "
+                "Используй режим 'text' для текстовых документов."
+            )
+        spooled = await _download(token, ctx)
+        if isinstance(spooled, dict):
+            return spooled
+        try:
+            # Только таблицы — текст и статистика не извлекаются
+            source = spooled.path if spooled.path is not None else spooled.data
+            tables = await file_processor.extract_tables_async(source, ctx.suffix)
+        except Exception as exc:
+            return _processing_error(ctx, exc)
+        finally:
+            await spooled.discard()
+        return {
+            "status": "success",
+            "mode": "tables",
+            "file_info": ctx.file_info,
+            "tables": tables,
+            "tables_count": len(tables),
+            "summary_type": ctx.summary_type,
+        }
+
+    async def _handle_full(token: str, ctx: _FetchTarget) -> dict[str, Any]:
+        spooled = await _download(token, ctx)
+        if isinstance(spooled, dict):
+            return spooled
+        display_name = ctx.file_name or f"attachment{ctx.suffix}"
+        try:
+            if spooled.path is not None:
+                structured = await file_processor.extract_structured_data(
+                    spooled.path, display_name, max_chars=_MAX_TEXT_CHARS
+                )
+            else:
+                structured = await file_processor.extract_structured_data_from_bytes(
+                    spooled.data, display_name, max_chars=_MAX_TEXT_CHARS
+                )
+        except Exception as exc:
+            return _processing_error(ctx, exc)
+        finally:
+            await spooled.discard()
+        return {
+            "status": "success",
+            "mode": "full",
+            "file_info": ctx.file_info,
+            "content": structured.get("text", ""),
+            "is_truncated": structured["is_truncated"],
+            "total_chars": structured["total_chars"],
+            "metadata": structured.get("metadata"),
+            "stats": structured.get("stats"),
+            "tables": structured.get("tables"),
+            "summary_type": ctx.summary_type,
+        }
+
+    mode_handlers: dict[str, _ModeHandler] = {
+        "text": _handle_text,
+        "tables": _handle_tables,
+        "full": _handle_full,
+    }
+
     async def doc_get_file_content(
         attachment_id: str | None = None,
         analysis_mode: str = "text",
@@ -254,9 +579,10 @@ def create_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
 
         # ── Получение метаданных документа ───────────────────────────────────────
         try:
-            raw_data = await doc_client.get_document_metadata(token, document_id)
-            doc = DocumentDto.model_validate(raw_data)
-            attachments: list[Any] = doc.attachment_document or []
+            found = await doc_client.get_document_attachments(token, document_id)
+            if found is None:
+                raise ValueError(f"документ {document_id} не найден")
+            attachments: list[AttachmentDocumentDto] = found
         except Exception as exc:
             logger.error("Failed to fetch document metadata: %s", exc, exc_info=True)
             return {
@@ -369,7 +695,7 @@ def create_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
         file_name: str = file_info["название"]
         suffix: str = Path(file_name).suffix.lower() if file_name else ".tmp"
 
-        # ── Режим metadata: без скачивания ────────────────────────────────────────
+        # ── Режим metadata: без скачивания и без проверки идентификаторов ────────
         if analysis_mode == "metadata":
             return {
                 "status": "success",
@@ -378,8 +704,8 @@ def create_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
                 "summary_type": summary_type,
             }
 
-        # ── Скачивание вложения ───────────────────────────────────────────────────
-        att_doc_id: str = str(getattr(target, "documentId", None) or document_id)
+        # ── Идентификаторы для скачивания ─────────────────────────────────────────
+        att_doc_id: str = str(target.document_id or document_id)
         try:
             att_doc_uuid = _ensure_uuid(att_doc_id, field="document_id")
             attachment_uuid = _ensure_uuid(resolved_id, field="attachment_id")
@@ -391,135 +717,18 @@ def create_attachment_fetch_tool(deps: AppDeps) -> StructuredTool:
                 "file_info": file_info,
                 "summary_type": summary_type,
             }
-        try:
-            content_bytes = await attach_client.get_attachment_content(
-                token, att_doc_uuid, attachment_uuid
-            )
-        except Exception as exc:
-            logger.error(
-                "Failed to download attachment '%s': %s", file_name, exc, exc_info=True
-            )
-            return {
-                "status": "error",
-                "message": f"Ошибка скачивания «{file_name}»: {exc}",
-                "file_info": file_info,
-                "summary_type": summary_type,
-            }
-
-        if not content_bytes:
-            return {
-                "status": "error",
-                "message": f"Файл «{file_name}» пустой или недоступен для скачивания.",
-                "file_info": file_info,
-                "summary_type": summary_type,
-            }
-
-        # ── Обработка через FileProcessorService ─────────────────────────────────
-        tmp_path: str | None = None
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(content_bytes)
-                tmp_path = tmp.name
-
-            # ── full: текст + таблицы + метаданные ───────────────────────────────
-            if analysis_mode == "full":
-                structured = await file_processor.extract_structured_data(tmp_path)
-                text_content: str = structured.get("text", "")
-                return {
-                    "status": "success",
-                    "mode": "full",
-                    "file_info": file_info,
-                    "content": text_content[:_MAX_TEXT_CHARS],
-                    "is_truncated": len(text_content) > _MAX_TEXT_CHARS,
-                    "total_chars": len(text_content),
-                    "metadata": structured.get("metadata"),
-                    "stats": structured.get("stats"),
-                    "tables": structured.get("tables"),
-                    "summary_type": summary_type,
-                }
-
-            # ── tables: только таблицы (Excel/CSV) ───────────────────────────────
-            if analysis_mode == "tables":
-                if suffix not in _SUPPORTED_TABLE_EXTENSIONS:
-                    return {
-                        "status": "error",
-                        "message": (
-                            f"Режим 'tables' поддерживается только для Excel/CSV. "
-                            f"Текущий формат: '{suffix}'. "
-                            "Используй режим 'text' для текстовых документов."
-                        ),
-                        "file_info": file_info,
-                        "summary_type": summary_type,
-                    }
-                structured = await file_processor.extract_structured_data(tmp_path)
-                tables = structured.get("tables", [])
-                return {
-                    "status": "success",
-                    "mode": "tables",
-                    "file_info": file_info,
-                    "tables": tables,
-                    "tables_count": len(tables) if tables else 0,
-                    "summary_type": summary_type,
-                }
-
-            # ── text: извлечение текста (default) ────────────────────────────────
-            if suffix not in _ALL_SUPPORTED:
-                return {
-                    "status": "warning",
-                    "message": (
-                        f"Формат '{suffix}' не поддерживается для извлечения текста. "
-                        f"Поддерживаемые: {', '.join(sorted(_ALL_SUPPORTED))}. "
-                        "Метаданные файла возвращены."
-                    ),
-                    "file_info": file_info,
-                    "summary_type": summary_type,
-                }
-
-            text_content = await file_processor.extract_text_async(tmp_path)
-
-            if not text_content or text_content.startswith(("Ошибка:", "Формат файла")):
-                return {
-                    "status": "error",
-                    "message": (
-                        f"Не удалось извлечь текст из «{file_name}». "
-                        "Возможно, файл является сканом или защищён паролем. "
-                        f"Подробности: {text_content}"
-                    ),
-                    "file_info": file_info,
-                    "summary_type": summary_type,
-                }
-
-            return {
-                "status": "success",
-                "mode": "text",
-                "file_info": file_info,
-                "content": text_content[:_MAX_TEXT_CHARS],
-                "is_truncated": len(text_content) > _MAX_TEXT_CHARS,
-                "total_chars": len(text_content),
-                "summary_type": summary_type,
-            }
 
-        except Exception as exc:
-            logger.error(
-                "File processing error for '%s': %s", file_name, exc, exc_info=True
-            )
-            return {
-                "status": "error",
-                "message": (
-                    f"Не удалось обработать «{file_name}»: {exc}. "
-                    "Возможно, файл повреждён или защищён паролем."
-                ),
-                "file_info": file_info,
-                "summary_type": summary_type,
-            }
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except OSError as cleanup_err:
-                    logger.warning(
-                        "Failed to remove temp file '%s': %s", tmp_path, cleanup_err
-                    )
+        ctx = _FetchTarget(
+            document_id=att_doc_uuid,
+            attachment_id=attachment_uuid,
+            file_info=file_info,
+            file_name=file_name,
+            suffix=suffix,
+            size_hint=target.size,
+            summary_type=summary_type,
+        )
+        handler = mode_handlers.get(analysis_mode, _handle_text)
+        return await handler(token, ctx)
 
     return StructuredTool.from_function(
         coroutine=doc_get_file_content,
@@ -6,10 +6,7 @@ EDMS AI Assistant — Document Compliance Check Tool (DI Factory).
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import logging
-import os
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
@@ -23,24 +20,30 @@ from edms_ai_assistant.agent.runnable_utils import (
     get_document_id_from_config,
     get_token_from_config,
 )
-from edms_ai_assistant.domain.document import DocumentDto
 from edms_ai_assistant.tools.attachment import (
     _get_attachment_id,
     _get_attachment_name,
     _resolve_attachment,
+    fetch_attachment_text,
 )
+from edms_ai_assistant.services.file_processor import is_extraction_error
+from edms_ai_assistant.summarizer.chunking.token_aware import truncate_to_tokens
 from langchain_core.runnables import RunnableConfig
 
 if TYPE_CHECKING:
     from langchain_core.language_models.chat_models import BaseChatModel
+    from langchain_core.runnables import Runnable
+
     from edms_ai_assistant.clients.attachment_client import AttachmentClient
     from edms_ai_assistant.clients.document_client import DocumentClient
     from edms_ai_assistant.core.deps import AppDeps
+    from edms_ai_assistant.domain.document import DocumentDto
     from edms_ai_assistant.services.file_processor import FileProcessorService
 
 logger = logging.getLogger(__name__)
 
-_MAX_ATTACHMENT_CHARS: int = 12_000
+# Бюджет текста вложения в токенах (~12K символов русского текста).
+_MAX_ATTACHMENT_TOKENS: int = 4_000
 _SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
     {".pdf", ".docx", ".doc", ".txt", ".rtf", ".odt", ".md"}
 )
@@ -537,32 +540,22 @@ async def _extract_text(
         return None
 
     try:
-        content_bytes = await attach_client.get_attachment_content(
-            token, UUID(document_id), UUID(attachment_id)
+        text = await fetch_attachment_text(
+            attach_client,
+            file_processor,
+            token,
+            UUID(document_id),
+            UUID(attachment_id),
+            suffix,
         )
     except Exception as exc:
-        logger.error("Download failed for '%s': %s", attachment_name, exc)
+        logger.error("Extraction failed for '%s': %s", attachment_name, exc)
         return None
 
-    if not content_bytes:
+    if is_extraction_error(text):
         return None
 
-    tmp_path: str | None = None
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-            tmp.write(content_bytes)
-            tmp_path = tmp.name
-        text = await file_processor.extract_text_async(tmp_path)
-        if not text or text.startswith(("Ошибка:", "Формат файла")):
-            return None
-        return text[:_MAX_ATTACHMENT_CHARS]
-    except Exception as exc:
-        logger.error("Extraction failed for '%s': %s", attachment_name, exc)
-        return None
-    finally:
-        if tmp_path and os.path.exists(tmp_path):
-            with contextlib.suppress(OSError):
-                os.unlink(tmp_path)
+    return truncate_to_tokens(text, _MAX_ATTACHMENT_TOKENS)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -601,12 +594,29 @@ _USER_PROMPT = """
 """
 
 
+_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", _SYSTEM_PROMPT),
+        ("user", _USER_PROMPT),
+    ]
+)
+
+
+def _build_llm_chain(llm: BaseChatModel) -> Runnable[dict[str, Any], Any]:
+    """Собирает цепочку prompt | llm без tools | JSON-парсер (один раз на тул)."""
+    try:
+        llm_clean = llm.bind_tools([])
+    except Exception:
+        llm_clean = llm
+    return _PROMPT | llm_clean | JsonOutputParser()
+
+
 async def _run_llm(
     category: str,
     text_fields: list[dict[str, Any]],
     attachment_text: str,
     attachment_name: str,
-    llm: BaseChatModel,
+    chain: Runnable[dict[str, Any], Any],
 ) -> list[dict[str, Any]]:
     """LLM-проверка text-полей. Возвращает список field-объектов."""
     if not text_fields:
@@ -616,21 +626,6 @@ async def _run_llm(
         f"- {f['label']} ({f['field_key']}): {f['card_value']}" for f in text_fields
     )
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", _SYSTEM_PROMPT),
-            ("user", _USER_PROMPT),
-        ]
-    )
-
-    try:
-        llm_clean = llm.bind_tools([])
-    except Exception:
-        llm_clean = llm
-
-    parser = JsonOutputParser()
-    chain = prompt | llm_clean | parser
-
     try:
         result = await chain.ainvoke(
             {
@@ -718,7 +713,7 @@ def create_doc_compliance_check_tool(deps: AppDeps) -> StructuredTool:
     doc_client: DocumentClient = deps.document_client
     attach_client: AttachmentClient = deps.attachment_client
     file_processor: FileProcessorService = deps.file_processor_service
-    llm: BaseChatModel = deps.chat_model
+    llm_chain = _build_llm_chain(deps.chat_model)
 
     async def doc_compliance_check(
         attachment_id: str | None = None,
@@ -774,13 +769,17 @@ def create_doc_compliance_check_tool(deps: AppDeps) -> StructuredTool:
 
         # ── 1. Документ ───────────────────────────────────────────────────────
         try:
-            raw = await doc_client.get_document_metadata(token, document_id)
-            doc = DocumentDto.model_validate(raw)
+            doc = await doc_client.get_document_metadata(token, document_id)
         except Exception as exc:
             return {
                 "status": "error",
                 "message": f"Не удалось получить документ: {exc}",
             }
+        if doc is None:
+            return {
+                "status": "error",
+                "message": f"Документ {document_id} не найден.",
+            }
 
         cat_raw = doc.doc_category_constant or doc.doc_category_const
         category = (
@@ -818,7 +817,7 @@ def create_doc_compliance_check_tool(deps: AppDeps) -> StructuredTool:
                 {
                     "id": _get_attachment_id(a),
                     "name": _get_attachment_name(a) or "без имени",
-                    "size_kb": round((getattr(a, "size", 0) or 0) / 1024, 1),
+                    "size_kb": round((a.size or 0) / 1024, 1),
                 }
                 for a in attachments
                 if _get_attachment_id(a)
@@ -931,7 +930,8 @@ def create_doc_compliance_check_tool(deps: AppDeps) -> StructuredTool:
 
         # ── 6. LLM анализ для каждого вложения ────────────────────────────
         llm_tasks = [
-            _run_llm(category, text_fields, text, name, llm) for name, text in texts
+            _run_llm(category, text_fields, text, name, llm_chain)
+            for name, text in texts
         ]
         llm_raw = await asyncio.gather(*llm_tasks, return_exceptions=True)
 
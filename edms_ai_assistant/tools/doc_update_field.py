@@ -5,7 +5,6 @@ EDMS AI Assistant — Document Field Update Tool.
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING, Annotated, Any
 
@@ -16,7 +15,7 @@ from edms_ai_assistant.agent.runnable_utils import (
     get_document_id_from_config,
     get_token_from_config,
 )
-from edms_ai_assistant.utils.json_encoder import CustomJSONEncoder
+from edms_ai_assistant.utils.json_encoder import dumps_json_bytes
 from langchain_core.runnables import RunnableConfig
 if TYPE_CHECKING:
     from edms_ai_assistant.clients.document_client import DocumentClient
@@ -285,20 +284,15 @@ def create_doc_update_field_tool(
             if not operations:
                 return {"status": "info", "message": "Нет полей для обновления."}
 
-            json_payload = json.loads(json.dumps(operations, cls=CustomJSONEncoder))
-
-            success = await document_client.execute_document_operations(
+            # Тело сериализуется один раз (orjson) и уходит в HTTP без
+            # промежуточного dumps -> loads -> повторного dumps в httpx.
+            # Ошибка API поднимается исключением и обрабатывается ниже.
+            await document_client.execute_document_operations_raw(
                 token=token,
                 document_id=document_id,
-                operations=json_payload,
+                operations_json=dumps_json_bytes(operations),
             )
 
-            if not success:
-                return {
-                    "status": "error",
-                    "message": "❌ Не удалось обновить поля: API вернул ошибку",
-                }
-
             labels = []
             for k in updates:
                 label = _ALLOWED_FIELDS.get(k) or _ALLOWED_APPEAL_FIELDS.get(k) or k
@@ -9,7 +9,7 @@ EDMS AI Assistant — doc_get_details tool (DI Factory).
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Annotated, Any
+from typing import Annotated, Any
 
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from pydantic import BaseModel
@@ -22,19 +22,37 @@ from edms_ai_assistant.services.document_service import (
     DocumentNotFoundError,
     DocumentService,
 )
-from edms_ai_assistant.utils.format_utils import clean_dict
+from edms_ai_assistant.utils.format_utils import put_if_present
 from langchain_core.runnables import RunnableConfig
 
+_EMPTY: tuple[Any, ...] = (None, [], {}, "")
+
+
 def _truncate_analytics(data: Any, max_list_items: int = 5) -> Any:
-    """Рекурсивно обрезает длинные списки в аналитике документа для LLM."""
+    """Один проход для LLM: убирает пустые значения и обрезает длинные списки.
+
+    Хвост списка за пределами ``max_list_items`` не обходится рекурсивно —
+    только подсчитываются непустые элементы.
+    """
     if isinstance(data, dict):
-        return {k: _truncate_analytics(v, max_list_items) for k, v in data.items()}
+        out: dict[str, Any] = {}
+        for k, v in data.items():
+            put_if_present(out, k, _truncate_analytics(v, max_list_items))
+        return out
     if isinstance(data, list):
-        if len(data) > max_list_items:
-            truncated = [_truncate_analytics(i, max_list_items) for i in data[:max_list_items]]
-            truncated.append(f"... и еще {len(data) - max_list_items} элементов")
-            return truncated
-        return [_truncate_analytics(i, max_list_items) for i in data]
+        items: list[Any] = []
+        hidden = 0
+        for item in data:
+            if len(items) >= max_list_items:
+                if item not in _EMPTY:
+                    hidden += 1
+                continue
+            cleaned = _truncate_analytics(item, max_list_items)
+            if cleaned not in _EMPTY:
+                items.append(cleaned)
+        if hidden:
+            items.append(f"... и еще {hidden} элементов")
+        return items
     return data
 
 # if TYPE_CHECKING:
@@ -87,9 +105,8 @@ def create_doc_get_details_tool(doc_service: DocumentService) -> StructuredTool:
                 token=token,
                 document_id=document_id,
             )
-            cleaned = clean_dict(analysis)
-            # Truncate to avoid context window overflow
-            truncated = _truncate_analytics(cleaned)
+            # Clean + truncate in one pass to avoid context window overflow
+            truncated = _truncate_analytics(analysis)
             return {"status": "success", "document_analytics": truncated}
 
         except DocumentNotFoundError:
@@ -1,4 +1,5 @@
 # edms_ai_assistant/tools/document_comparison.py
+import asyncio
 import logging
 from typing import Annotated, Any
 
@@ -10,6 +11,7 @@ from langchain_core.tools import InjectedToolArg, StructuredTool
 from pydantic import BaseModel, Field
 
 from edms_ai_assistant.agent.runnable_utils import get_token_from_config
+from edms_ai_assistant.agent.ui_directive import astream_with_preview
 from edms_ai_assistant.clients.document_client import DocumentClient
 
 logger = logging.getLogger(__name__)
@@ -26,28 +28,38 @@ class DocumentComparisonInput(BaseModel):
     )
 
 
+_METADATA_FIELDS: tuple[str, ...] = (
+    "regNumber",
+    "regDate",
+    "status",
+    "shortSummary",
+    "author",
+    "correspondentName",
+    "outRegNumber",
+    "outRegDate",
+)
+
+
 def _compare_metadata(doc1: dict, doc2: dict) -> dict[str, Any]:
     """Сравнивает метаданные двух документов."""
-    fields_to_compare = [
-        "regNumber",
-        "regDate",
-        "status",
-        "shortSummary",
-        "author",
-        "correspondentName",
-        "outRegNumber",
-        "outRegDate",
-    ]
-
-    differences = {}
-    for field in fields_to_compare:
-        val1 = doc1.get(field)
-        val2 = doc2.get(field)
+    get1, get2 = doc1.get, doc2.get
+    return {
+        field: {"document_1": val1, "document_2": val2}
+        for field in _METADATA_FIELDS
+        if (val1 := get1(field)) != (val2 := get2(field))
+    }
 
-        if val1 != val2:
-            differences[field] = {"document_1": val1, "document_2": val2}
 
-    return differences
+def _get_att_name(a: Any) -> str:
+    if isinstance(a, dict):
+        return a.get("name") or a.get("originalName") or a.get("fileName") or ""
+    # Поддержка Pydantic DTO
+    return (
+        getattr(a, "name", None)
+        or getattr(a, "original_name", None)
+        or getattr(a, "originalName", None)
+        or ""
+    )
 
 
 def _compare_attachments(doc1: dict, doc2: dict) -> dict[str, Any]:
@@ -55,29 +67,46 @@ def _compare_attachments(doc1: dict, doc2: dict) -> dict[str, Any]:
     att1 = doc1.get("attachmentDocument") or []
     att2 = doc2.get("attachmentDocument") or []
 
-    def _get_att_name(a: Any) -> str:
-        if isinstance(a, dict):
-            return a.get("name") or a.get("originalName") or a.get("fileName") or ""
-        # Поддержка Pydantic DTO
-        return (
-            getattr(a, "name", None)
-            or getattr(a, "original_name", None)
-            or getattr(a, "originalName", None)
-            or ""
-        )
-
-    att1_names = {_get_att_name(a) for a in att1 if _get_att_name(a)}
-    att2_names = {_get_att_name(a) for a in att2 if _get_att_name(a)}
+    # Имя извлекается один раз на вложение; пустые имена отбрасываются.
+    att1_names = {name for name in map(_get_att_name, att1) if name}
+    att2_names = {name for name in map(_get_att_name, att2) if name}
+    common = att1_names & att2_names
 
     return {
-        "added_in_doc2": list(att2_names - att1_names),
-        "removed_from_doc1": list(att1_names - att2_names),
-        "common": list(att1_names & att2_names),
+        "added_in_doc2": list(att2_names - common),
+        "removed_from_doc1": list(att1_names - common),
+        "common": list(common),
         "total_count_doc1": len(att1),
         "total_count_doc2": len(att2),
     }
 
 
+def _has_differences(differences: dict[str, Any]) -> bool:
+    """True, если есть различия в метаданных или составе вложений."""
+    attachments = differences.get("attachments") or {}
+    return bool(
+        differences.get("metadata")
+        or attachments.get("added_in_doc2")
+        or attachments.get("removed_from_doc1")
+    )
+
+
+_NO_DIFFERENCES_SUMMARY = "Документы идентичны по выбранным аспектам."
+
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "Ты — аналитик СЭД. Проанализируй различия между двумя документами и составь краткий отчет на русском языке.",
+        ),
+        (
+            "user",
+            "Различия между документами:\n{differences}\n\nСоставь структурированный отчет об основных изменениях:",
+        ),
+    ]
+)
+
+
 # ─── Tool Factory ─────────────────────────────────────────────────────────────
 
 
@@ -94,6 +123,13 @@ def create_doc_compare_documents_tool(
     Returns:
         Настроенный StructuredTool, готовый к регистрации в агенте.
     """
+    summary_chain = _SUMMARY_PROMPT | chat_model | StrOutputParser()
+
+    async def _stream_summary(differences: str) -> str:
+        """Читает отчёт потоком, отдавая частичный текст во фронтенд."""
+        return await astream_with_preview(
+            summary_chain.astream({"differences": differences}), "ComparisonPreview"
+        )
 
     async def doc_compare_documents(
         document_id_1: str,
@@ -132,8 +168,10 @@ def create_doc_compare_documents_tool(
 
         try:
             try:
-                doc1_dto = await document_client.get_document_metadata(token, document_id_1)
-                doc2_dto = await document_client.get_document_metadata(token, document_id_2)
+                doc1_dto, doc2_dto = await asyncio.gather(
+                    document_client.get_document_metadata(token, document_id_1),
+                    document_client.get_document_metadata(token, document_id_2),
+                )
 
                 if not doc1_dto or not doc2_dto:
                     return {
@@ -163,22 +201,13 @@ def create_doc_compare_documents_tool(
                     attachments_diff = _compare_attachments(doc1, doc2)
                     comparison_result["differences"]["attachments"] = attachments_diff
 
-                summary_prompt = ChatPromptTemplate.from_messages(
-                    [
-                        (
-                            "system",
-                            "Ты — аналитик СЭД. Проанализируй различия между двумя документами и составь краткий отчет на русском языке.",
-                        ),
-                        (
-                            "user",
-                            "Различия между документами:\n{differences}\n\nСоставь структурированный отчет об основных изменениях:",
-                        ),
-                    ]
-                )
+                # Нет различий — LLM не вызываем.
+                if not _has_differences(comparison_result["differences"]):
+                    comparison_result["summary"] = _NO_DIFFERENCES_SUMMARY
+                    return comparison_result
 
-                chain = summary_prompt | chat_model | StrOutputParser()
-                summary = await chain.ainvoke(
-                    {"differences": str(comparison_result["differences"])}
+                summary = await _stream_summary(
+                    str(comparison_result["differences"])
                 )
 
                 comparison_result["summary"] = summary.strip()
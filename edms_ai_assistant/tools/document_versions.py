@@ -142,8 +142,8 @@ def create_doc_get_versions_tool(document_client: DocumentClient) -> StructuredT
                     "message": "У документа только одна версия — сравнивать не с чем.",
                 }
 
-            # Сортируем по номеру версии (атрибут DocumentVersionDto)
-            sorted_versions = sorted(versions, key=lambda v: v.version or 0)
+            # Клиент возвращает версии уже отсортированными по номеру
+            sorted_versions = versions
             total = len(sorted_versions)
 
             # ── Сбор метаданных всех версий ─────────────────────────────────
@@ -1,12 +1,13 @@
 # edms_ai_assistant/tools/employee_search.py
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Annotated, Any
 
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from langgraph.errors import GraphInterrupt
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from edms_ai_assistant.agent.hitl_primitives import ToolAborted, ask_human
 from edms_ai_assistant.agent.interrupt_contract import (
@@ -22,6 +23,7 @@ from edms_ai_assistant.services.search_utils import (
     get_merged_name_parts,
     merge_name_parts,
 )
+from edms_ai_assistant.utils.json_encoder import returns_json_str
 from langchain_core.runnables import RunnableConfig
 if TYPE_CHECKING:
     from edms_ai_assistant.clients.department_client import DepartmentClient
@@ -34,12 +36,31 @@ logger = logging.getLogger(__name__)
 
 _MAX_PAGE_SIZE: int = 100
 _SCORE_GAP_THRESHOLD: int = 5
+# Больше карточек пользователь всё равно не просмотрит — пусть уточнит запрос
+_MAX_CHOICE_CARDS: int = 20
 _VALID_INCLUDES: set[str] = {"POST", "DEPARTMENT"}
+# Ключи EmployeeFilter, которые реально сужают выборку (флаги и includes — нет)
+_CRITERIA_FILTER_KEYS: frozenset[str] = frozenset(
+    {
+        "lastName",
+        "firstName",
+        "middleName",
+        "fullPostName",
+        "postId",
+        "departmentId",
+        "ids",
+        "employeeLeaderDepartmentId",
+        "employeeLeaderDepartmentAllId",
+        "orgId",
+    }
+)
 
 
 class EmployeeSearchInput(BaseModel):
     """Полная схема ввода для поиска сотрудников."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     query: str | None = Field(None, description="Универсальная строка поиска.")
     employee_id: str | None = Field(None, description="UUID сотрудника.")
     last_name: str | None = Field(
@@ -177,32 +198,56 @@ class EmployeeSearchInput(BaseModel):
 # ══════════════════════════════════════════════════════════════════════════════
 
 
+def _full_name(emp: EmployeeDto) -> str:
+    return (
+        " ".join(p for p in (emp.last_name, emp.first_name, emp.middle_name) if p)
+        or "—"
+    )
+
+
+def _post_name(emp: EmployeeDto) -> str | None:
+    return emp.post.post_name if emp.post else None
+
+
+def _dept_name(emp: EmployeeDto) -> str | None:
+    return emp.department.name if emp.department else None
+
+
 def _filter_by_post(
     results: list[EmployeeDto], full_post_name: str
 ) -> list[EmployeeDto]:
     term = full_post_name.lower()
-    filtered = []
-    for r in results:
-        post_name = (r.post.post_name if r.post else "").lower()
-        if term in post_name:
-            filtered.append(r)
-    return filtered if filtered else results
+    filtered = [r for r in results if term in (_post_name(r) or "").lower()]
+    return filtered or results
 
 
 def _serialize_employee_dto(emp: EmployeeDto) -> dict[str, Any]:
-    parts = [emp.last_name or "", emp.first_name or "", emp.middle_name or ""]
-    full_name = " ".join(p for p in parts if p).strip() or "—"
     return {
         "id": str(emp.id or ""),
-        "full_name": full_name,
-        "post": emp.post.post_name if emp.post else "—",
-        "department": emp.department.name if emp.department else "—",
+        "full_name": _full_name(emp),
+        "post": _post_name(emp) or "—",
+        "department": _dept_name(emp) or "—",
         "active": emp.active,
         "email": emp.email or "—",
         "phone": emp.phone or "—",
     }
 
 
+def _employee_choice_card(emp: EmployeeDto) -> InterruptCard:
+    """Карточка выбора строится прямо из DTO, без промежуточного dict."""
+    return InterruptCard(
+        id=str(emp.id or ""),
+        label=_full_name(emp),
+        description=_post_name(emp) or "Сотрудник",
+        badges=["Сотрудник"] + (["Активен"] if emp.active else []),
+        primary_attrs={
+            "Подразделение": _dept_name(emp) or "—",
+            "Email": emp.email or "—",
+        },
+        metadata={"active": emp.active, "fired": emp.fired},
+    )
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Async Helper Functions (Receive clients as args)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -260,26 +305,46 @@ async def _build_enriched_card(
         logger.warning("NLP formatting failed", exc_info=True)
         card = _serialize_employee_dto(emp)
 
-    try:
-        roles_raw = await employee_client.get_employee_roles(token, emp_id)
-        card["roles"] = [{"id": r.id, "name": r.name or "—"} for r in (roles_raw or [])]
-    except Exception:
+    # Роли и грифы независимы — запрашиваются параллельно
+    roles_raw, griefs_raw = await asyncio.gather(
+        employee_client.get_employee_roles(token, emp_id),
+        employee_client.get_employee_griefs(token, emp_id),
+        return_exceptions=True,
+    )
+
+    if isinstance(roles_raw, BaseException):
         card["roles"] = []
+    else:
+        card["roles"] = [
+            {"id": r.id, "name": r.name or "—"} for r in roles_raw or []
+        ]
 
     try:
-        griefs_raw = await employee_client.get_employee_griefs(token, emp_id)
-        access_griefs = []
-        for g in griefs_raw or []:
-            access_griefs.append(
+        card["access_griefs"] = (
+            []
+            if isinstance(griefs_raw, BaseException)
+            else [
                 {"id": str(g.id or ""), "name": g.access_grief.name or "—"}
-            )
-        card["access_griefs"] = access_griefs
+                for g in griefs_raw or []
+            ]
+        )
     except Exception:
         card["access_griefs"] = []
 
     return card
 
 
+async def _found_response(
+    token: str,
+    emp: EmployeeDto,
+    nlp_service: EDMSNaturalLanguageService,
+    employee_client: EmployeeClient,
+) -> dict[str, Any]:
+    """Единый ответ ``found`` с обогащённой карточкой сотрудника."""
+    card = await _build_enriched_card(token, emp, nlp_service, employee_client)
+    return {"status": "found", "total": 1, "employee_card": card}
+
+
 async def _get_employee_card(
     token: str,
     employee_id: str,
@@ -290,8 +355,7 @@ async def _get_employee_card(
         emp = await employee_client.get_employee(token, employee_id)
         if not emp:
             return {"status": "not_found", "message": "Сотрудник не найден."}
-        card = await _build_enriched_card(token, emp, nlp_service, employee_client)
-        return {"status": "found", "total": 1, "employee_card": card}
+        return await _found_response(token, emp, nlp_service, employee_client)
     except Exception as exc:
         logger.error("Failed to fetch employee", exc_info=True)
         return {"status": "error", "message": f"Ошибка получения сотрудника: {exc}"}
@@ -300,7 +364,7 @@ async def _get_employee_card(
 async def _resolve_via_ask_human(
     token: str,
     results: list[EmployeeDto],
-    choices: list[dict[str, Any]],
+    choices: list[EmployeeDto],
     merged_last_name: str | None,
     nlp_service: EDMSNaturalLanguageService,
     employee_client: EmployeeClient,
@@ -308,30 +372,19 @@ async def _resolve_via_ask_human(
     """Disambiguate over native ``ask_human`` and return the picked card."""
     index: dict[str, EmployeeDto] = {str(r.id or ""): r for r in results}
 
+    prompt = (
+        f"Уточните «{merged_last_name}»" if merged_last_name else "Уточните сотрудника"
+    )
+    if len(choices) < len(results):
+        prompt += (
+            f" (показаны {len(choices)} из {len(results)} — "
+            "уточните запрос, если нужного нет)"
+        )
+
     resume = ask_human(
         CardSelectInterrupt(
-            prompt=(
-                f"Уточните «{merged_last_name}»"
-                if merged_last_name
-                else "Уточните сотрудника"
-            ),
-            cards=[
-                InterruptCard(
-                    id=brief["id"],
-                    label=brief["full_name"],
-                    description=brief.get("post") or "Сотрудник",
-                    badges=["Сотрудник"] + (["Активен"] if brief.get("active") else []),
-                    primary_attrs={
-                        "Подразделение": brief.get("department") or "—",
-                        "Email": brief.get("email") or "—",
-                    },
-                    metadata={
-                        "active": brief.get("active"),
-                        "fired": brief.get("fired"),
-                    },
-                )
-                for brief in choices
-            ],
+            prompt=prompt,
+            cards=[_employee_choice_card(emp) for emp in choices],
             multiple=False,
         )
     )
@@ -353,8 +406,7 @@ async def _resolve_via_ask_human(
             token, selected_id, nlp_service, employee_client
         )
 
-    card = await _build_enriched_card(token, selected_raw, nlp_service, employee_client)
-    return {"status": "found", "total": 1, "employee_card": card}
+    return await _found_response(token, selected_raw, nlp_service, employee_client)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -445,6 +497,7 @@ def create_employee_search_tool(deps: AppDeps) -> StructuredTool:
             active=active_only,
             fired=fired_only,
             includes=includes,
+            name_parts=merged,
         )
 
         if merged.first_name and "lastName" in employee_filter:
@@ -514,20 +567,7 @@ def create_employee_search_tool(deps: AppDeps) -> StructuredTool:
             logger.warning(
                 "Departments not resolved", extra={"unresolved": unresolved_all}
             )
-            has_other = any(
-                (
-                    last_name,
-                    first_name,
-                    middle_name,
-                    full_post_name,
-                    post_id,
-                    employee_ids,
-                    resolved_leader_id,
-                    resolved_leader_all_id,
-                    org_id,
-                )
-            )
-            if not resolved_dept_ids and not has_other:
+            if _CRITERIA_FILTER_KEYS.isdisjoint(employee_filter.keys()):
                 return {
                     "status": "not_found",
                     "message": f"Отдел(ы) не найдены: {', '.join(unresolved_all)}.",
@@ -558,13 +598,9 @@ def create_employee_search_tool(deps: AppDeps) -> StructuredTool:
                         "message": "Сотрудники по данным критериям не найдены.",
                     }
                 if len(results) == 1:
-                    return {
-                        "status": "found",
-                        "total": 1,
-                        "employee_card": await _build_enriched_card(
-                            token, results[0], nlp_service, employee_client
-                        ),
-                    }
+                    return await _found_response(
+                        token, results[0], nlp_service, employee_client
+                    )
 
                 best = find_best_employee_match(
                     results,
@@ -577,29 +613,19 @@ def create_employee_search_tool(deps: AppDeps) -> StructuredTool:
                     logger.info(
                         "Best match found via scoring", extra={"id": str(best.id or "")[:8]}
                     )
-                    return {
-                        "status": "found",
-                        "total": 1,
-                        "employee_card": await _build_enriched_card(
-                            token, best, nlp_service, employee_client
-                        ),
-                    }
+                    return await _found_response(
+                        token, best, nlp_service, employee_client
+                    )
 
                 display_results = results
                 if full_post_name:
                     display_results = _filter_by_post(results, full_post_name)
                     if len(display_results) == 1:
-                        return {
-                            "status": "found",
-                            "total": 1,
-                            "employee_card": await _build_enriched_card(
-                                token, display_results[0], nlp_service, employee_client
-                            ),
-                        }
-
-                choices = [
-                    _serialize_employee_dto(r) for r in display_results[:effective_size]
-                ]
+                        return await _found_response(
+                            token, display_results[0], nlp_service, employee_client
+                        )
+
+                choices = display_results[: min(effective_size, _MAX_CHOICE_CARDS)]
                 logger.info("Multiple employees found", extra={"count": len(choices)})
                 return await _resolve_via_ask_human(
                     token=token,
@@ -628,7 +654,7 @@ def create_employee_search_tool(deps: AppDeps) -> StructuredTool:
             return {"status": "error", "message": f"❌ Критическая ошибка при поиске сотрудника: {exc!s}"}
 
     return StructuredTool.from_function(
-        coroutine=employee_search_tool,
+        coroutine=returns_json_str(employee_search_tool),
         name="employee_search_tool",
         description="Searches for employees in the EDMS directory by ANY criteria. Токен авторизации передается системой АВТОМАТИЧЕСКИ.",
         args_schema=EmployeeSearchInput,
@@ -7,15 +7,15 @@ EDMS AI Assistant — File Comparison Tool.
 
 from __future__ import annotations
 
+import asyncio
 import difflib
 import logging
-import os
 import re
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
+import aiofiles.tempfile
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from langgraph.errors import GraphInterrupt
 from pydantic import BaseModel, Field, field_validator
@@ -30,12 +30,17 @@ from edms_ai_assistant.agent.runnable_utils import (
     get_document_id_from_config,
     get_token_from_config,
 )
-from edms_ai_assistant.services.file_processor import FileProcessorService
+from edms_ai_assistant.services.file_processor import (
+    FileProcessorService,
+    is_extraction_error,
+    remove_temp_file,
+)
 from edms_ai_assistant.utils.regex_utils import UUID_RE
 from langchain_core.runnables import RunnableConfig
 if TYPE_CHECKING:
     from edms_ai_assistant.clients.attachment_client import AttachmentClient
     from edms_ai_assistant.clients.document_client import DocumentClient
+    from edms_ai_assistant.domain.document import AttachmentDocumentDto
 
 logger = logging.getLogger(__name__)
 
@@ -96,22 +101,17 @@ class FileCompareInput(BaseModel):
         return cleaned
 
 
-def _att_name(attachment: Any) -> str:
-    # Поддержка как dict, так и Pydantic объектов с extra='allow'
-    if isinstance(attachment, dict):
-        return attachment.get("name") or attachment.get("fileName") or ""
-    return (
-        getattr(attachment, "name", None) or getattr(attachment, "fileName", None) or ""
-    )
+def _att_name(attachment: AttachmentDocumentDto) -> str:
+    return attachment.name or ""
 
 
-def _att_id(attachment: Any) -> str:
-    if isinstance(attachment, dict):
-        return str(attachment.get("id", ""))
-    return str(getattr(attachment, "id", "") or "")
+def _att_id(attachment: AttachmentDocumentDto) -> str:
+    return str(attachment.id) if attachment.id else ""
 
 
-def _resolve_attachment(attachments: list[Any], hint: str) -> Any | None:
+def _resolve_attachment(
+    attachments: list[AttachmentDocumentDto], hint: str
+) -> AttachmentDocumentDto | None:
     """Resolve attachment by UUID or filename hint (4-level fallback)."""
     if not hint or not attachments:
         return None
@@ -127,23 +127,36 @@ def _resolve_attachment(attachments: list[Any], hint: str) -> Any | None:
     hint_lower = hint_s.lower()
     hint_stem = Path(hint_lower).stem
 
+    # Single pass; each name is lower-cased once, priority is preserved.
+    by_stem: AttachmentDocumentDto | None = None
+    by_partial: tuple[AttachmentDocumentDto, str] | None = None
     for att in attachments:
-        if _att_name(att).lower() == hint_lower:
+        name_lc = _att_name(att).lower()
+        if name_lc == hint_lower:
             logger.info("Attachment resolved by exact name: '%s'", hint_s)
             return att
-
-    for att in attachments:
-        if Path(_att_name(att).lower()).stem == hint_stem and hint_stem:
-            logger.info("Attachment resolved by stem: '%s'", hint_s)
-            return att
-
-    for att in attachments:
-        att_stem = Path(_att_name(att).lower()).stem
-        if hint_stem and att_stem and (hint_stem in att_stem or att_stem in hint_stem):
-            logger.info(
-                "Attachment resolved by partial stem: '%s' ~ '%s'", hint_stem, att_stem
-            )
-            return att
+        if not hint_stem or by_stem is not None:
+            continue
+        att_stem = Path(name_lc).stem
+        if att_stem == hint_stem:
+            by_stem = att
+        elif (
+            by_partial is None
+            and att_stem
+            and (hint_stem in att_stem or att_stem in hint_stem)
+        ):
+            by_partial = (att, att_stem)
+
+    if by_stem is not None:
+        logger.info("Attachment resolved by stem: '%s'", hint_s)
+        return by_stem
+
+    if by_partial is not None:
+        att, att_stem = by_partial
+        logger.info(
+            "Attachment resolved by partial stem: '%s' ~ '%s'", hint_stem, att_stem
+        )
+        return att
 
     logger.warning(
         "Attachment resolution failed: hint='%s', available=%s",
@@ -154,6 +167,19 @@ def _resolve_attachment(attachments: list[Any], hint: str) -> Any | None:
     return None
 
 
+async def _extract_compared_text(path: str, suffix: str) -> str:
+    """Извлекает не больше ``_MAX_TEXT_CHARS`` символов для сравнения.
+
+    Лимит применяется внутри воркера парсера: из пула возвращается только
+    сравниваемое начало текста, а PDF с текстовым слоем читается до нужной
+    страницы, а не целиком.
+    """
+    text, _, _ = await FileProcessorService.extract_text_capped_async(
+        path, suffix, _MAX_TEXT_CHARS
+    )
+    return text
+
+
 def _normalise(text: str) -> str:
     text = re.sub(r"[ \t]+", " ", text)
     text = re.sub(r"\n{3,}", "\n\n", text)
@@ -299,13 +325,12 @@ def create_file_compare_tool(
 
         # ── 2. Получение метаданных документа и списка вложений ───────────────────
         try:
-            doc_raw = await document_client.get_document_metadata(token, document_id)
-            if not doc_raw:
+            found = await document_client.get_document_attachments(
+                token, document_id
+            )
+            if found is None:
                 return {"status": "error", "message": "Документ не найден."}
-            from edms_ai_assistant.domain.document import DocumentDto
-
-            doc = DocumentDto.model_validate(doc_raw)
-            attachments: list[Any] = doc.attachment_document or []
+            attachments: list[AttachmentDocumentDto] = found
         except Exception as exc:
             logger.error("Document metadata fetch failed: %s", exc, exc_info=True)
             return {
@@ -392,73 +417,93 @@ def create_file_compare_tool(
 
         logger.info("Attachment resolved: '%s' (%s…)", resolved_name, resolved_id[:8])
 
-        # ── 4. Скачивание вложения ────────────────────────────────────────────────
-        try:
-            att_bytes: bytes = await attachment_client.get_attachment_content(
-                token, UUID(att_doc_id), UUID(resolved_id)
-            )
-        except Exception as exc:
-            logger.error("Attachment download failed '%s': %s", resolved_name, exc)
-            return {
-                "status": "error",
-                "message": f"Ошибка скачивания вложения «{resolved_name}»: {exc}",
-            }
-
-        if not att_bytes:
-            return {
-                "status": "error",
-                "message": (
-                    f"Вложение «{resolved_name}» вернуло пустой ответ — "
-                    "файл недоступен или удалён."
-                ),
-            }
-
-        # ── 5. Извлечение текста локального файла ────────────────────────────────
-        local_text_raw: str = await FileProcessorService.extract_text_async(
-            str(local_path)
+        # ── 4. Извлечение текста локального файла ────────────────────────────────
+        # Запускается фоновой задачей: парсинг идёт в process pool параллельно
+        # со скачиванием вложения, результат ожидается после шага 6.
+        local_task = asyncio.create_task(
+            _extract_compared_text(str(local_path), local_path.suffix.lower())
         )
-        if not local_text_raw or local_text_raw.startswith(("Ошибка:", "Формат файла")):
-            return {
-                "status": "error",
-                "message": f"Не удалось извлечь текст из «{display_name}»: {local_text_raw}",
-            }
-
-        # ── 6. Извлечение текста вложения через temp-файл ─────────────────────────
-        att_text_raw: str = ""
 
+        # ── 5. Потоковое скачивание вложения сразу в temp-файл ────────────────────
+        # Файл не буферизуется в памяти целиком: чанки пишутся на диск по мере
+        # получения, парсер затем читает его с диска (PDF/DOCX требуют seek).
+        # Создание и удаление temp-файла также не блокируют event loop.
+        tmp_path: str | None = None
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=resolved_suffix) as tmp_file:
-                tmp_path = tmp_file.name
-                tmp_file.write(att_bytes)
-                tmp_file.flush()
-
+            downloaded = 0
+            try:
+                async with aiofiles.tempfile.NamedTemporaryFile(
+                    "wb", suffix=resolved_suffix, delete=False
+                ) as tmp_file:
+                    tmp_path = str(tmp_file.name)
+                    async for chunk in attachment_client.stream_attachment_content(
+                        token, UUID(att_doc_id), UUID(resolved_id)
+                    ):
+                        downloaded += len(chunk)
+                        await tmp_file.write(chunk)
+            except Exception as exc:
+                logger.error("Attachment download failed '%s': %s", resolved_name, exc)
+                return {
+                    "status": "error",
+                    "message": f"Ошибка скачивания вложения «{resolved_name}»: {exc}",
+                }
+
+            if not downloaded:
+                return {
+                    "status": "error",
+                    "message": (
+                        f"Вложение «{resolved_name}» вернуло пустой ответ — "
+                        "файл недоступен или удалён."
+                    ),
+                }
+
+            # ── 6. Извлечение текста вложения ─────────────────────────────────────
             try:
-                att_text_raw = await FileProcessorService.extract_text_async(tmp_path)
-            finally:
-                if os.path.exists(tmp_path):
-                    try:
-                        os.unlink(tmp_path)
-                    except PermissionError:
-                        logger.warning(
-                            "Could not delete temp file %s, it will be cleaned up later",
-                            tmp_path,
-                        )
+                att_text_raw = await _extract_compared_text(tmp_path, resolved_suffix)
+            except Exception as exc:
+                logger.error(
+                    "Text extraction from attachment '%s' failed: %s",
+                    resolved_name,
+                    exc,
+                    exc_info=True,
+                )
+                return {
+                    "status": "error",
+                    "message": f"Ошибка извлечения текста из «{resolved_name}»: {exc}",
+                }
 
-        except Exception as exc:
-            logger.error(
-                "Text extraction from attachment '%s' failed: %s",
-                resolved_name,
-                exc,
-                exc_info=True,
-            )
+            try:
+                local_text_raw: str = await local_task
+            except Exception as exc:
+                logger.error(
+                    "Text extraction from local file '%s' failed: %s",
+                    display_name,
+                    exc,
+                    exc_info=True,
+                )
+                return {
+                    "status": "error",
+                    "message": f"Ошибка извлечения текста из «{display_name}»: {exc}",
+                }
+        finally:
+            if not local_task.done():
+                local_task.cancel()
+            elif not local_task.cancelled():
+                # При раннем выходе ошибку задачи забираем, иначе asyncio
+                # залогирует "Task exception was never retrieved".
+                local_task.exception()
+            if tmp_path is not None:
+                await asyncio.to_thread(remove_temp_file, tmp_path)
+
+        if is_extraction_error(local_text_raw):
             return {
                 "status": "error",
-                "message": f"Ошибка извлечения текста из «{resolved_name}»: {exc}",
+                "message": f"Не удалось извлечь текст из «{display_name}»: {local_text_raw}",
             }
 
         # ── 7. Нормализация -> сравнение -> diff ───────────────────────────────────
-        local_text = _normalise(local_text_raw[:_MAX_TEXT_CHARS])
-        att_text = _normalise(att_text_raw[:_MAX_TEXT_CHARS])
+        local_text = _normalise(local_text_raw)
+        att_text = _normalise(att_text_raw)
 
         are_identical = local_text == att_text
         similarity = round(
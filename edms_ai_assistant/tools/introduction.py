@@ -9,7 +9,7 @@ from uuid import UUID
 
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from langgraph.errors import GraphInterrupt
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from edms_ai_assistant.agent.hitl_primitives import ToolAborted, ask_human
 from edms_ai_assistant.agent.interrupt_contract import (
@@ -21,6 +21,8 @@ from edms_ai_assistant.agent.runnable_utils import (
     get_document_id_from_config,
     get_token_from_config,
 )
+from edms_ai_assistant.utils.regex_utils import UUID_RE
+from edms_ai_assistant.utils.json_encoder import returns_json_str
 from langchain_core.runnables import RunnableConfig
 if TYPE_CHECKING:
     from edms_ai_assistant.core.deps import AppDeps
@@ -28,10 +30,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_STRING_LIST_FIELDS: tuple[str, ...] = (
+    "last_names",
+    "department_names",
+    "group_names",
+    "personal_group_names",
+)
+
+
+def _is_uuid_str(value: Any) -> bool:
+    return isinstance(value, str) and UUID_RE.match(value) is not None
+
 
 class IntroductionInput(BaseModel):
     """Валидированная схема входных данных для создания ознакомления."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     last_names: list[str] | None = Field(
         None,
         description="Фамилии сотрудников для поиска (например: ['Иванов', 'Петров'])",
@@ -69,7 +84,7 @@ class IntroductionInput(BaseModel):
         description="Комментарий к ознакомлению",
         max_length=500,
     )
-    selected_employee_ids: list[str] | None = Field(
+    selected_employee_ids: list[UUID] | None = Field(
         None,
         description=(
             "UUID выбранных сотрудников. Используйте, если UUID уже известен, "
@@ -78,28 +93,34 @@ class IntroductionInput(BaseModel):
         max_length=100,
     )
 
-    @field_validator(
-        "last_names", "department_names", "group_names", "personal_group_names"
-    )
+    @model_validator(mode="before")
     @classmethod
-    def validate_string_lists(cls, v: list[str] | None) -> list[str] | None:
-        if v is None:
-            return None
-        return [s.strip() for s in v if s and s.strip()]
-
-    @field_validator("selected_employee_ids")
+    def strip_string_lists(cls, data: Any) -> Any:
+        """Одним проходом чистит все списки имён (вместо валидатора на каждое поле)."""
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)  # не меняем аргументы вызова инструмента
+        for key in _STRING_LIST_FIELDS:
+            values = data.get(key)
+            if isinstance(values, list):
+                data[key] = [
+                    s.strip() if isinstance(s, str) else s
+                    for s in values
+                    if not isinstance(s, str) or s.strip()
+                ]
+        return data
+
+    @field_validator("selected_employee_ids", mode="before")
     @classmethod
-    def validate_employee_ids(cls, v: list[str] | None) -> list[str] | None:
-        if v is None:
-            return None
-        validated = []
-        for emp_id in v:
-            try:
-                UUID(emp_id)
-                validated.append(emp_id)
-            except ValueError:
-                logger.warning("Invalid UUID in selected_employee_ids: %s", emp_id)
-        return validated if validated else None
+    def validate_employee_ids(cls, v: Any) -> Any:
+        """Отбрасывает невалидные UUID; в ``UUID`` строки превращает pydantic-core."""
+        if not isinstance(v, list):
+            return v
+        validated = [e for e in v if isinstance(e, UUID) or _is_uuid_str(e)]
+        if len(validated) != len(v):
+            rejected = [e for e in v if not (isinstance(e, UUID) or _is_uuid_str(e))]
+            logger.warning("Invalid UUIDs in selected_employee_ids: %s", rejected)
+        return validated or None
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -111,7 +132,7 @@ async def _handle_direct_addition(
     service: IntroductionService,
     token: str,
     document_id: str,
-    employee_ids: list[str],
+    employee_ids: list[UUID],
     comment: str | None,
 ) -> dict[str, Any]:
     """Обработка прямого добавления сотрудников по UUID."""
@@ -126,7 +147,7 @@ async def _handle_direct_addition(
     result = await service.create_introduction(
         token=token,
         document_id=document_id,
-        employee_ids=[UUID(emp_id) for emp_id in employee_ids],
+        employee_ids=employee_ids,
         comment=comment,
     )
 
@@ -179,26 +200,25 @@ async def _handle_search_and_create(
         logger.info("Found %d ambiguous search terms", len(ambiguous_results))
 
         for amb in ambiguous_results:
-            search_term = amb.get("search_query", "Неизвестно")
-            matches = amb.get("matches", [])
+            matches = amb.matches
             if not matches:
                 continue
 
+            # Ключи гарантирует ResolutionService._format_employee_match
             cards = [
                 InterruptCard(
-                    id=m.get("id", ""),
-                    label=m.get("full_name", "Не указано"),
-                    description=m.get("post", "") or "Сотрудник",
+                    id=m["id"],
+                    label=m["full_name"] or "Не указано",
+                    description=m["post"] or "Сотрудник",
                     badges=["Сотрудник"],
-                    primary_attrs={
-                        "Подразделение": m.get("department", "") or "—",
-                    },
+                    primary_attrs={"Подразделение": m["department"] or "—"},
                 )
                 for m in matches
             ]
 
             prompt_msg = (
-                f"Уточните сотрудника для «{search_term}» ({len(matches)} совпадений)."
+                f"Уточните сотрудника для «{amb.search_query}» "
+                f"({len(matches)} совпадений)."
             )
 
             try:
@@ -283,7 +303,7 @@ def create_introduction_tool(deps: AppDeps) -> StructuredTool:
         personal_group_names: list[str] | None = None,
         include_subordinates: bool | None = None,
         comment: str | None = None,
-        selected_employee_ids: list[str] | None = None,
+        selected_employee_ids: list[UUID] | None = None,
         config: Annotated[RunnableConfig, InjectedToolArg] = None,
     ) -> dict[str, Any]:
         """Создает список ознакомления с документом.
@@ -368,7 +388,7 @@ def create_introduction_tool(deps: AppDeps) -> StructuredTool:
             }
 
     return StructuredTool.from_function(
-        coroutine=introduction_create_tool,
+        coroutine=returns_json_str(introduction_create_tool),
         name="introduction_create_tool",
         description=(
             "Создает список ознакомления с документом.\n"
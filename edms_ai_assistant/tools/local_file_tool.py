@@ -1,14 +1,20 @@
-# edms_ai_assistant/tools/local_file_reader.py
+# edms_ai_assistant/tools/local_file_tool.py
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import re
 from pathlib import Path
+from stat import S_ISREG
 from typing import TYPE_CHECKING, Any
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, field_validator
 
+from edms_ai_assistant.services.file_processor import is_extraction_error
+from edms_ai_assistant.utils.cache_utils import TTLCache
+
 if TYPE_CHECKING:
     from edms_ai_assistant.services.file_processor import FileProcessorService
 
@@ -17,6 +23,11 @@ logger = logging.getLogger(__name__)
 # Лимит для LLM (120k символов ~ 30k-40k токенов — безопасный размер для сохранения внимания модели)
 _MAX_CONTENT_CHARS = 120_000
 _PAGE_MARKER_PATTERN = re.compile(r"--- Страница (\d+) ---")
+# (абсолютный путь, mtime_ns, размер, лимит) -> (текст, всего символов);
+# изменённый файл получает новый ключ, лимит None — полный текст.
+_TEXT_CACHE: TTLCache[tuple[str, int, int, int | None], tuple[str, int]] = TTLCache(
+    maxsize=32, ttl=1800
+)
 
 _ALLOWED_EXTENSIONS = {
     ".pdf",
@@ -61,6 +72,44 @@ class LocalFileInput(BaseModel):
         return cleaned
 
 
+# Сигнатуры контейнеров: файл с чужим содержимым отсекается по первым байтам,
+# не доходя до парсера (битый «PDF» иначе сканируется мегабайтами).
+_SNIFF_BYTES = 1024
+_ZIP_SIGNATURE = b"PK\x03\x04"
+_TEXT_SUFFIXES = frozenset({".txt", ".md", ".csv"})
+_UTF16_BOMS = (b"\xff\xfe", b"\xfe\xff")
+
+
+def _sniff_mismatch(path: Path, suffix: str) -> str | None:
+    """Сверяет первые байты файла с расширением; возвращает текст ошибки.
+
+    Недоступный файл (нет прав, удалён после stat) тоже даёт сообщение
+    «Ошибка: ...», а не исключение — как и у экстрактора.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError as exc:
+        logger.warning("Cannot read local file %s: %s", path, exc)
+        return f"Ошибка: не удалось прочитать файл {path.name}: {exc.strerror or exc}"
+    if not head:
+        return None
+    if suffix == ".pdf":
+        ok = b"%PDF-" in head
+    elif suffix in (".docx", ".xlsx", ".odt"):
+        ok = head.startswith(_ZIP_SIGNATURE)
+    elif suffix == ".rtf":
+        ok = head.lstrip().startswith(b"{\\rtf")
+    elif suffix in _TEXT_SUFFIXES:
+        ok = head.startswith(_UTF16_BOMS) or b"\x00" not in head
+    else:
+        # .doc/.xls нередко оказываются RTF/HTML — их разбирает конвертер.
+        return None
+    if ok:
+        return None
+    return f"Формат файла не соответствует расширению {suffix}: содержимое не распознано."
+
+
 def _split_text_to_pages(text: str) -> dict[int, str]:
     """Разбивает текст с маркерами '--- Страница N ---' в словарь."""
     splits = _PAGE_MARKER_PATTERN.split(text)
@@ -72,6 +121,43 @@ def _split_text_to_pages(text: str) -> dict[int, str]:
     return pages
 
 
+async def _load_text(
+    service: FileProcessorService,
+    path: Path,
+    stat: os.stat_result,
+    max_chars: int | None,
+) -> tuple[str, int]:
+    """Возвращает ``(текст, всего символов)`` с кэшем по версии файла.
+
+    С ``max_chars`` парсер останавливается на лимите (PDF — по страницам,
+    TXT — чтением префикса), и из пула возвращается только начало текста.
+    """
+    # abspath без обращений к ФС (resolve() делает lstat на каждый компонент)
+    file_key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    cached = _TEXT_CACHE.get((*file_key, None))
+    if cached is None and max_chars is not None:
+        cached = _TEXT_CACHE.get((*file_key, max_chars))
+    if cached is not None:
+        logger.debug("Local file text cache hit: %s", path.name)
+        return cached
+
+    suffix = path.suffix.lower()
+    if mismatch := await asyncio.to_thread(_sniff_mismatch, path, suffix):
+        return mismatch, 0
+
+    if max_chars is None:
+        text = await service.extract_text_async(str(path))
+        total_chars = len(text or "")
+    else:
+        text, total_chars, _ = await service.extract_text_capped_async(
+            str(path), suffix, max_chars
+        )
+
+    if not is_extraction_error(text):
+        _TEXT_CACHE.set((*file_key, max_chars), (text, total_chars))
+    return text, total_chars
+
+
 # ─── Tool Factory ─────────────────────────────────────────────────────────────
 
 
@@ -107,11 +193,17 @@ def create_local_file_reader_tool(
         )
 
         path = Path(file_path)
-        if not path.exists():
+        # Один stat на вызов: и проверка, и ключ кэша берутся из него.
+        # Выполняется в потоке — на сетевых дисках stat может подвисать.
+        try:
+            stat = await asyncio.to_thread(path.stat)
+        except OSError:
             return {"status": "error", "message": f"Файл не найден: '{file_path}'."}
+        if not S_ISREG(stat.st_mode):
+            return {"status": "error", "message": f"Это не файл: '{file_path}'."}
 
         suffix = path.suffix.lower()
-        size_mb = round(path.stat().st_size / (1024 * 1024), 2)
+        size_mb = round(stat.st_size / (1024 * 1024), 2)
         meta = {
             "имя_файла": path.name,
             "расширение": suffix,
@@ -126,31 +218,32 @@ def create_local_file_reader_tool(
                 "meta": meta,
             }
 
-        # Используем внедренный сервис вместо прямого вызова статического метода
-        full_text = await file_processor_service.extract_text_async(str(path))
-
-        if (
-            not full_text
-            or full_text.startswith("Ошибка:")
-            or full_text.startswith("Формат файла")
-        ):
+        # Постраничные режимы и «голова + индекс + хвост» (страницы есть
+        # только у PDF) требуют полного текста; иначе достаточно начала.
+        needs_full_text = bool(search_keywords or target_pages) or suffix == ".pdf"
+        full_text, total_chars = await _load_text(
+            file_processor_service,
+            path,
+            stat,
+            None if needs_full_text else _MAX_CONTENT_CHARS,
+        )
+        if is_extraction_error(full_text):
             return {
                 "status": "error",
-                "message": f"Не удалось извлечь текст: {full_text[:300]}",
+                "message": f"Не удалось извлечь текст: {(full_text or '')[:300]}",
                 "meta": meta,
             }
 
-        total_chars = len(full_text)
-
         # ── Режим 1: Поиск по ключевым словам ────────────────────────────────
         if search_keywords:
             pages_dict = _split_text_to_pages(full_text)
+            keywords = [kw.lower() for kw in search_keywords]
             matched_pages = set()
 
             for page_num, page_text in pages_dict.items():
-                for kw in search_keywords:
-                    if kw.lower() in page_text.lower():
-                        matched_pages.add(page_num)
+                page_lower = page_text.lower()
+                if any(kw in page_lower for kw in keywords):
+                    matched_pages.add(page_num)
 
             if not matched_pages:
                 return {
@@ -201,31 +294,38 @@ def create_local_file_reader_tool(
                 tail_size = int(_MAX_CONTENT_CHARS * 0.4)  # 40% под конец
                 # 10% резервируем под Мини-Индекс
 
-                head_text = ""
-                head_pages = []
+                # Части собираются в списки и склеиваются одним join:
+                # повторные += / prepend копировали бы накопленный текст
+                # на каждой странице.
+                head_parts: list[str] = []
+                head_len = 0
                 for p in all_page_nums:
-                    if len(head_text) + len(pages_dict[p]) > head_size:
+                    page_len = len(pages_dict[p])
+                    if head_len + page_len > head_size:
                         break
-                    head_text += pages_dict[p] + "\n\n"
-                    head_pages.append(p)
-
-                tail_text = ""
-                tail_pages = []
-                for p in reversed(all_page_nums):
-                    if p in head_pages:
-                        break
-                    if len(tail_text) + len(pages_dict[p]) > tail_size:
+                    head_parts.append(pages_dict[p])
+                    head_len += page_len + 2
+
+                tail_parts: list[str] = []
+                tail_len = 0
+                for p in reversed(all_page_nums[len(head_parts) :]):
+                    page_len = len(pages_dict[p])
+                    if tail_len + page_len > tail_size:
                         break
-                    tail_text = pages_dict[p] + "\n\n" + tail_text
-                    tail_pages.insert(0, p)
+                    tail_parts.append(pages_dict[p])
+                    tail_len += page_len + 2
+                tail_parts.reverse()
+
+                head_pages = all_page_nums[: len(head_parts)]
+                tail_pages = all_page_nums[len(all_page_nums) - len(tail_parts) :]
 
                 # Формируем Мини-Индекс для пропущенных страниц
-                middle_pages = [
-                    p
-                    for p in all_page_nums
-                    if p not in head_pages and p not in tail_pages
+                middle_pages = all_page_nums[
+                    len(head_parts) : len(all_page_nums) - len(tail_parts)
+                ]
+                index_lines = [
+                    "... [ПРОПУЩЕННЫЕ СТРАНИЦЫ. Краткое содержание пропущенных частей для навигации]:\n"
                 ]
-                index_text = "... [ПРОПУЩЕННЫЕ СТРАНИЦЫ. Краткое содержание пропущенных частей для навигации]:\n"
 
                 for p in middle_pages:
                     # Берем первые 100 символов текста страницы как аннотацию
@@ -233,11 +333,19 @@ def create_local_file_reader_tool(
                         pages_dict[p].replace(f"--- Страница {p} ---", "").strip()
                     )
                     snippet = page_content_clean[:100].replace("\n", " ")
-                    index_text += f"  Стр. {p}: {snippet}...\n"
+                    index_lines.append(f"  Стр. {p}: {snippet}...\n")
 
-                index_text += "\nДля чтения полных пропущенных страниц используй параметры target_pages или search_keywords.\n\n"
+                index_lines.append(
+                    "\nДля чтения полных пропущенных страниц используй параметры target_pages или search_keywords.\n\n"
+                )
 
-                content = head_text + index_text + tail_text
+                parts: list[str] = []
+                for page in head_parts:
+                    parts += (page, "\n\n")
+                parts += index_lines
+                for page in tail_parts:
+                    parts += (page, "\n\n")
+                content = "".join(parts)
                 logger.info(
                     "Smart truncation with Mini-Index applied to %s. Head: %s, Tail: %s, Indexed: %s",
                     path.name,
@@ -5,13 +5,16 @@ EDMS AI Assistant — Document Summarisation Tool.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re as _re
 import uuid
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
+import orjson
+from langchain_core.messages import AIMessageChunk, HumanMessage, SystemMessage
+from langchain_core.messages.ai import add_ai_message_chunks
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field, field_validator
 
@@ -21,8 +24,17 @@ from edms_ai_assistant.agent.interrupt_contract import (
     SelectInterrupt,
     SelectResume,
 )
+from edms_ai_assistant.agent.ui_directive import astream_with_preview
+from edms_ai_assistant.config import settings
+from edms_ai_assistant.llm import log_prompt_cache_usage, prompt_cache_kwargs
+from edms_ai_assistant.summarizer.chunking.token_aware import truncate_head_tail_tokens
+from edms_ai_assistant.utils.cache_utils import TTLCache
+from edms_ai_assistant.utils.hash_utils import get_text_fingerprint
+from edms_ai_assistant.utils.text_rank import rank_sentences
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from langchain_core.language_models.chat_models import BaseChatModel
 
 logger = logging.getLogger(__name__)
@@ -42,6 +54,63 @@ class SummarizeType(StrEnum):
     THESIS = "thesis"
 
 
+# Минимальная длина текста, который имеет смысл суммаризировать.
+_MIN_USEFUL_CHARS: int = 120
+
+# Варианты HITL-выбора формата (общие для всех вызовов).
+_FORMAT_OPTIONS: tuple[InterruptOption, ...] = (
+    InterruptOption(
+        id="extractive",
+        label="Ключевые факты",
+        description="Конкретные данные, даты, суммы, имена — нумерованным списком.",
+    ),
+    InterruptOption(
+        id="abstractive",
+        label="Краткий пересказ",
+        description="Суть документа своими словами в 1–2 абзацах.",
+    ),
+    InterruptOption(
+        id="thesis",
+        label="Тезисный план",
+        description="Структурированный план с разделами и подпунктами.",
+    ),
+)
+
+# Локальный extractive (SUMMARIZER_LOCAL_EXTRACTIVE): предел длины текста
+# и число отбираемых предложений.
+_LOCAL_EXTRACTIVE_MAX_CHARS: int = 6_000
+_LOCAL_EXTRACTIVE_TOP_K: int = 7
+
+# Бюджет документа для LLM-fallback в токенах (2/3 — начало, 1/3 — конец).
+_FALLBACK_MAX_TOKENS: int = 3_000
+
+# Системные промпты LLM-fallback: строятся один раз при импорте модуля.
+_FALLBACK_PROMPTS: dict[SummarizeType, str] = {
+    SummarizeType.EXTRACTIVE: (
+        "Извлеки ключевые факты из документа. "
+        "Формат: список фактов с категориями (ДАТА, ПЕРСОНА, ОРГАНИЗАЦИЯ, СУММА, ТРЕБОВАНИЕ). "
+        "Язык ответа: русский."
+    ),
+    SummarizeType.ABSTRACTIVE: (
+        "Напиши краткое изложение документа своими словами. "
+        "2-4 абзаца, профессиональный стиль. "
+        "Язык ответа: русский."
+    ),
+    SummarizeType.THESIS: (
+        "Составь тезисный план документа. "
+        "Формат: пронумерованные разделы с подпунктами. "
+        "Язык ответа: русский."
+    ),
+}
+
+_FALLBACK_SYSTEM_MESSAGES: dict[SummarizeType, SystemMessage] = {
+    summary_type: SystemMessage(
+        content=f"{prompt}\n\nОтвечай ТОЛЬКО на русском языке."
+    )
+    for summary_type, prompt in _FALLBACK_PROMPTS.items()
+}
+
+
 def _normalise_summary_type(value: Any) -> SummarizeType:
     if isinstance(value, SummarizeType):
         return value
@@ -81,21 +150,47 @@ class SummarizeInput(BaseModel):
 
 
 def _unwrap_json_envelope(text: str) -> str:
-    """Извлекает текст из JSON-обёртки если doc_get_file_content вернул JSON."""
+    """Извлекает текст из JSON-обёртки если doc_get_file_content вернул JSON.
+
+    ``str.strip()`` у уже очищенной строки возвращает тот же объект, так что
+    на основном пути (обычный текст) копий не создаётся; JSON разбирается
+    только если текст обрамлён фигурными скобками.
+    """
     clean = text.strip()
-    if not (clean.startswith("{") and clean.endswith("}")):
+    if not (clean[:1] == "{" and clean[-1:] == "}"):
         return clean
     try:
-        data: dict[str, Any] = json.loads(clean)
+        data: dict[str, Any] = orjson.loads(clean)
         for key in ("content", "text", "document_info", "text_preview"):
             extracted = data.get(key)
             if extracted and isinstance(extracted, str) and len(extracted) > 10:
                 return extracted.strip()
-    except (json.JSONDecodeError, TypeError):
+    except orjson.JSONDecodeError:
         pass
     return clean
 
 
+_DIGIT_GROUP_RE = _re.compile(r"\d+")
+
+# Отпечаток текста -> рекомендованный формат (см. _heuristic_recommendation).
+_RECOMMENDATION_CACHE: TTLCache[str, dict[str, str]] = TTLCache(
+    maxsize=256, ttl=1800.0
+)
+
+
+def _fit_fallback_document(text: str) -> str:
+    """Укладывает документ в токенный бюджет fallback: начало + конец."""
+    return truncate_head_tail_tokens(text, _FALLBACK_MAX_TOKENS)
+
+
+def _local_extractive(text: str) -> str | None:
+    """Markdown-список ключевых предложений или None, если отбор не удался."""
+    sentences = rank_sentences(text, _LOCAL_EXTRACTIVE_TOP_K)
+    if not sentences:
+        return None
+    return "\n".join(f"{i}. {s}" for i, s in enumerate(sentences, 1))
+
+
 def _heuristic_recommendation(text: str) -> dict[str, str]:
     if not text:
         return {
@@ -104,7 +199,7 @@ def _heuristic_recommendation(text: str) -> dict[str, str]:
         }
     chars = len(text)
     lines = text.count("\n")
-    numeric_groups = len(_re.findall(r"\d+", text))
+    numeric_groups = sum(1 for _ in _DIGIT_GROUP_RE.finditer(text))
     if chars > 5_000 or numeric_groups > 20:
         return {
             "recommended": "thesis",
@@ -140,53 +235,102 @@ def create_doc_summarize_text_tool(
     Returns:
         Настроенный StructuredTool, готовый к регистрации в агенте.
     """
+    # (отпечаток документа, формат) -> ответ LLM-fallback: повторный запрос того же
+    # документа в том же формате не ходит в модель. Кэши живут в фабрике, а не
+    # в модуле: инструмент с другой моделью не получит чужих ответов.
+    fallback_cache: TTLCache[tuple[str, SummarizeType], str] = TTLCache(
+        maxsize=128, ttl=1800.0
+    )
+    fallback_inflight: dict[tuple[str, SummarizeType], asyncio.Future[str]] = {}
+
+    async def _stream_summary(document: str, summary_type: SummarizeType) -> str:
+        """Вызывает модель потоком и возвращает итоговый текст ответа."""
+        # Инструкция — в SystemMessage (кэшируемый префикс), документ — в конце.
+        messages = [
+            _FALLBACK_SYSTEM_MESSAGES.get(
+                summary_type, _FALLBACK_SYSTEM_MESSAGES[SummarizeType.ABSTRACTIVE]
+            ),
+            HumanMessage(content=f"Документ:\n\n{document}"),
+        ]
+
+        # Ответ читается потоком: частичный текст уходит во фронтенд через
+        # UIDirective (без паузы графа), не дожидаясь полного ответа модели.
+        chunks: list[AIMessageChunk] = []
+        cache_kwargs = prompt_cache_kwargs(f"edms-summarize-{summary_type.value}")
+
+        async def _pieces() -> AsyncIterator[str]:
+            async for chunk in chat_model.astream(messages, **cache_kwargs):
+                chunks.append(chunk)
+                yield str(chunk.content)
+
+        text = await astream_with_preview(_pieces(), "SummarizationPreview")
+
+        if chunks:
+            log_prompt_cache_usage(
+                add_ai_message_chunks(chunks[0], *chunks[1:]),
+                operation="summarize_llm_fallback",
+            )
+        return text.strip()
 
     async def _llm_fallback(text: str, summary_type: SummarizeType) -> dict[str, Any]:
         """
         Простой LLM fallback без пайплайна суммаризации.
         Используется когда сервис недоступен или упал пайплайн.
         """
-        _prompts = {
-            SummarizeType.EXTRACTIVE: (
-                "Извлеки ключевые факты из документа. "
-                "Формат: список фактов с категориями (ДАТА, ПЕРСОНА, ОРГАНИЗАЦИЯ, СУММА, ТРЕБОВАНИЕ). "
-                "Язык ответа: русский."
-            ),
-            SummarizeType.ABSTRACTIVE: (
-                "Напиши краткое изложение документа своими словами. "
-                "2-4 абзаца, профессиональный стиль. "
-                "Язык ответа: русский."
-            ),
-            SummarizeType.THESIS: (
-                "Составь тезисный план документа. "
-                "Формат: пронумерованные разделы с подпунктами. "
-                "Язык ответа: русский."
-            ),
+        document = await asyncio.to_thread(_fit_fallback_document, text)
+        meta = {
+            "format_used": summary_type.value,
+            "text_length": len(text),
+            "pipeline": "llm_fallback",
+            "chunks_processed": 1,
+            "from_cache": False,
         }
+        cache_key = (get_text_fingerprint(document), summary_type)
+        if (cached := fallback_cache.get(cache_key)) is not None:
+            logger.debug("Summarization fallback cache hit: %s", summary_type.value)
+            return {
+                "status": "success",
+                "content": cached,
+                "meta": {**meta, "from_cache": True},
+            }
 
-        prompt = _prompts.get(summary_type, _prompts[SummarizeType.ABSTRACTIVE])
-
-        from langchain_core.messages import HumanMessage, SystemMessage
-
-        messages = [
-            SystemMessage(content=f"{prompt}\n\nОтвечай ТОЛЬКО на русском языке."),
-            HumanMessage(content=f"Документ:\n\n{text[:8000]}"),
-        ]
-
-        response = await chat_model.ainvoke(messages)
-        content = str(response.content).strip()
+        # Конкурентные запросы того же документа ждут один вызов модели.
+        # Если владельца отменили (клиент отключился), ожидающий не получает
+        # чужую ошибку, а повторяет попытку и сам становится владельцем.
+        while (pending := fallback_inflight.get(cache_key)) is not None:
+            try:
+                content = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if pending.cancelled() and not (task and task.cancelling()):
+                    continue
+                raise
+            return {
+                "status": "success",
+                "content": content,
+                "meta": {**meta, "from_cache": True},
+            }
 
-        return {
-            "status": "success",
-            "content": content,
-            "meta": {
-                "format_used": summary_type.value,
-                "text_length": len(text),
-                "pipeline": "llm_fallback",
-                "chunks_processed": 1,
-                "from_cache": False,
-            },
-        }
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        fallback_inflight[cache_key] = future
+        try:
+            content = await _stream_summary(document, summary_type)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # без ожидающих не логировать "never retrieved"
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(content)
+        finally:
+            fallback_inflight.pop(cache_key, None)
+
+        if content:
+            fallback_cache.set(cache_key, content)
+
+        return {"status": "success", "content": content, "meta": meta}
 
     async def doc_summarize_text(
         text: str,
@@ -215,25 +359,32 @@ def create_doc_summarize_text_tool(
             - success: анализ выполнен, поле content содержит Markdown
             - error: ошибка выполнения
         """
+        raw_len = len(text)
         logger.info(
             "doc_summarize_text: text_length=%d type=%s",
-            len(text),
+            raw_len,
             summary_type.value if summary_type else None,
         )
 
-        clean_text = _unwrap_json_envelope(text)
+        # Обёртка не может быть короче извлечённого из неё текста, поэтому
+        # заведомо короткий ввод отклоняется без попытки разбора JSON.
+        clean_text = (
+            text.strip()
+            if raw_len < _MIN_USEFUL_CHARS
+            else _unwrap_json_envelope(text)
+        )
+        clean_len = len(clean_text)
 
-        _MIN_USEFUL_CHARS: int = 120
-        if len(clean_text) < _MIN_USEFUL_CHARS:
+        if clean_len < _MIN_USEFUL_CHARS:
             logger.warning(
                 "doc_summarize_text rejected: input too short (%d < %d chars)",
-                len(clean_text),
+                clean_len,
                 _MIN_USEFUL_CHARS,
             )
             return {
                 "status": "error",
                 "message": (
-                    f"Передан слишком короткий текст ({len(clean_text)} симв.) — "
+                    f"Передан слишком короткий текст ({clean_len} симв.) — "
                     "вероятно, это заголовок или метаданные, а не содержимое файла. "
                     "Сначала вызови `doc_get_file_content(attachment_id=...)` "
                     "(или `read_local_file_content(file_path=...)` для локального файла), "
@@ -243,30 +394,18 @@ def create_doc_summarize_text_tool(
             }
 
         if summary_type is None:
-            hint = _heuristic_recommendation(clean_text)
+            # Тул перезапускается после выбора формата (resume), поэтому
+            # рекомендация кэшируется по отпечатку текста; сканирование
+            # до 50K символов не должно занимать event loop.
+            fingerprint = get_text_fingerprint(clean_text)
+            hint = _RECOMMENDATION_CACHE.get(fingerprint)
+            if hint is None:
+                hint = await asyncio.to_thread(_heuristic_recommendation, clean_text)
+                _RECOMMENDATION_CACHE.set(fingerprint, hint)
             resume = ask_human(
                 SelectInterrupt(
                     prompt="Выберите формат анализа документа:",
-                    options=[
-                        InterruptOption(
-                            id="extractive",
-                            label="Ключевые факты",
-                            description=(
-                                "Конкретные данные, даты, суммы, имена — "
-                                "нумерованным списком."
-                            ),
-                        ),
-                        InterruptOption(
-                            id="abstractive",
-                            label="Краткий пересказ",
-                            description="Суть документа своими словами в 1–2 абзацах.",
-                        ),
-                        InterruptOption(
-                            id="thesis",
-                            label="Тезисный план",
-                            description="Структурированный план с разделами и подпунктами.",
-                        ),
-                    ],
+                    options=list(_FORMAT_OPTIONS),
                     default=hint["recommended"],
                 )
             )
@@ -280,6 +419,26 @@ def create_doc_summarize_text_tool(
 
         normalised = _normalise_summary_type(summary_type)
 
+        if (
+            normalised is SummarizeType.EXTRACTIVE
+            and settings.SUMMARIZER_LOCAL_EXTRACTIVE
+            and clean_len < _LOCAL_EXTRACTIVE_MAX_CHARS
+        ):
+            # Пустой результат (мало предложений) — идём в LLM как обычно.
+            content = await asyncio.to_thread(_local_extractive, clean_text)
+            if content is not None:
+                return {
+                    "status": "success",
+                    "content": content,
+                    "meta": {
+                        "format_used": normalised.value,
+                        "text_length": clean_len,
+                        "pipeline": "local_extractive",
+                        "chunks_processed": 1,
+                        "from_cache": False,
+                    },
+                }
+
         # Пытаемся использовать переданный сервис или глобальный (установленный через set_summarization_service)
         svc = summarization_service or _summarization_service
 
@@ -293,12 +452,8 @@ def create_doc_summarize_text_tool(
             )
             from edms_ai_assistant.summarizer.structured.models import SummaryMode
 
-            _mode_map = {
-                SummarizeType.EXTRACTIVE: SummaryMode.EXTRACTIVE,
-                SummarizeType.ABSTRACTIVE: SummaryMode.ABSTRACTIVE,
-                SummarizeType.THESIS: SummaryMode.THESIS,
-            }
-            mode = _mode_map.get(normalised, SummaryMode.ABSTRACTIVE)
+            # Значения SummarizeType совпадают с одноимёнными SummaryMode.
+            mode = SummaryMode(normalised.value)
 
             file_bytes = clean_text.encode("utf-8")
 
@@ -319,7 +474,7 @@ def create_doc_summarize_text_tool(
                 "content": content,
                 "meta": {
                     "format_used": resp.mode.value,
-                    "text_length": len(clean_text),
+                    "text_length": clean_len,
                     "pipeline": resp.chunking_strategy,
                     "chunks_processed": resp.chunk_count,
                     "processing_time_ms": resp.latency_ms,
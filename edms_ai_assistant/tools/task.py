@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Annotated, Any
@@ -10,7 +11,7 @@ from uuid import UUID
 
 from langchain_core.tools import InjectedToolArg, StructuredTool
 from langgraph.errors import GraphInterrupt
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 from edms_ai_assistant.agent.hitl_primitives import ToolAborted, ask_human
 from edms_ai_assistant.agent.interrupt_contract import (
@@ -78,17 +79,17 @@ class TaskCreateInput(BaseModel):
             "Подчинённые — сотрудники подразделения, которым руководит пользователь."
         ),
     )
-    responsible_employee_id: str | None = Field(
+    responsible_employee_id: UUID | None = Field(
         None,
         description="UUID ответственного исполнителя, если он уже известен.",
     )
-    planed_date_end: str | None = Field(
+    planed_date_end: datetime | None = Field(
         None, description="Плановая дата окончания в ISO 8601"
     )
     task_type: TaskType | None = Field(
         None, description="Тип поручения (по умолчанию: GENERAL)"
     )
-    selected_employee_ids: list[str] | None = Field(
+    selected_employee_ids: list[UUID] | None = Field(
         None,
         description=(
             "UUID выбранных сотрудников. Используйте, если UUID уже известен, "
@@ -97,6 +98,38 @@ class TaskCreateInput(BaseModel):
         max_length=100,
     )
 
+    @field_validator("planed_date_end", mode="before")
+    @classmethod
+    def _parse_deadline(cls, v: Any) -> Any:
+        # Своё сообщение вместо англоязычного дампа pydantic для модели.
+        if not isinstance(v, str):
+            return v
+        if not v.strip():
+            return None
+        try:
+            return datetime.fromisoformat(v.strip().replace("Z", "+00:00"))
+        except ValueError as e:
+            raise ValueError(f"Неверный формат даты: {e}") from e
+
+    @field_validator("planed_date_end")
+    @classmethod
+    def _assume_utc(cls, v: datetime | None) -> datetime | None:
+        # Наивную дату считаем UTC.
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+        return v
+
+
+def _validation_error_result(exc: ValidationError) -> str:
+    """Ошибка валидации аргументов в контракте инструмента ``{status, message}``."""
+    messages = [
+        str(err["ctx"]["error"]) if "error" in err.get("ctx", {}) else err["msg"]
+        for err in exc.errors()
+    ]
+    return json.dumps(
+        {"status": "error", "message": "; ".join(messages)}, ensure_ascii=False
+    )
+
 
 def create_task_tool(deps: AppDeps) -> StructuredTool:
     """Фабрика инструмента создания поручений с DI."""
@@ -111,9 +144,10 @@ def create_task_tool(deps: AppDeps) -> StructuredTool:
         group_names: list[str] | None = None,
         personal_group_names: list[str] | None = None,
         include_subordinates: bool | None = None,
-        planed_date_end: str | None = None,
+        responsible_employee_id: UUID | None = None,
+        planed_date_end: datetime | None = None,
         task_type: TaskType | None = None,
-        selected_employee_ids: list[str] | None = None,
+        selected_employee_ids: list[UUID] | None = None,
         config: Annotated[RunnableConfig, InjectedToolArg] = None,
     ) -> dict[str, Any]:
         """Создает поручение с поддержкой различных типов исполнителей.
@@ -145,28 +179,14 @@ def create_task_tool(deps: AppDeps) -> StructuredTool:
                 "message": "Текст поручения не может быть пустым.",
             }
 
-        deadline = None
-        if planed_date_end:
-            try:
-                deadline = datetime.fromisoformat(
-                    planed_date_end.replace("Z", "+00:00")
-                )
-                if deadline.tzinfo is None:
-                    deadline = deadline.replace(tzinfo=UTC)
-            except ValueError as e:
-                return {"status": "error", "message": f"Неверный формат даты: {e}"}
-
         effective_task_type = task_type if task_type is not None else TaskType.GENERAL
-        preselected_ids: list[str] = list(selected_employee_ids or [])
 
         try:
             try:
                 # ================================================================
                 # Шаг 0: Подготовка ответственного
                 # ================================================================
-                resp_id: UUID | None = (
-                    UUID(responsible_employee_id) if responsible_employee_id else None
-                )
+                resp_id: UUID | None = responsible_employee_id
 
                 # ================================================================
                 # Шаг 1: Резолвинг массовых исполнителей
@@ -194,7 +214,7 @@ def create_task_tool(deps: AppDeps) -> StructuredTool:
                 # ================================================================
                 # Шаг 2: Резолвинг индивидуальных исполнителей
                 # ================================================================
-                all_uuids: list[UUID] = [UUID(eid) for eid in preselected_ids]
+                all_uuids: list[UUID] = list(selected_employee_ids or [])
                 all_uuids.extend(bulk_ids)
 
                 if executor_last_names:
@@ -282,7 +302,7 @@ def create_task_tool(deps: AppDeps) -> StructuredTool:
                     document_id=document_id,
                     task_text=task_text,
                     employee_ids=unique_uuids,
-                    planed_date_end=deadline,
+                    planed_date_end=planed_date_end,
                     responsible_employee_id=resp_id,
                     task_type=effective_task_type,
                 )
@@ -335,4 +355,5 @@ def create_task_tool(deps: AppDeps) -> StructuredTool:
             "ВАЖНО: Токен авторизации и ID документа передаются системой АВТОМАТИЧЕСКИ."
         ),
         args_schema=TaskCreateInput,
+        handle_validation_error=_validation_error_result,
     )
@@ -1,8 +1,8 @@
 # edms_ai_assistant/utils/api_utils.py
-import json
 import logging
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +18,16 @@ async def handle_api_error(response: httpx.Response, request_info: str):
     Логгирует детали ошибки.
     """
     if response.is_error:
+        raw = response.content
         try:
-            error_details = response.json()
-        except (json.JSONDecodeError, AttributeError):
-            error_details = {"text": response.text[:200]}
-
-        status_code = response.status_code
+            error_details = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            error_details = {"text": raw[:200].decode("utf-8", "replace")}
 
         logger.error(
-            f"API Error [{status_code}] for {request_info}. Details: {error_details}"
+            "API Error [%s] for %s. Details: %s",
+            response.status_code,
+            request_info,
+            error_details,
         )
         response.raise_for_status()
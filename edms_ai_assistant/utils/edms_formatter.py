@@ -4,6 +4,7 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel
@@ -13,12 +14,28 @@ from edms_ai_assistant.utils.datetime_utils import to_local_timezone
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
 def _camel_to_snake(name: str) -> str:
     """Конвертирует camelCase в snake_case для совместимости с Pydantic V2."""
     name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
     return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
 
 
+def _dig(obj: Any, *attrs: str, default: Any = None) -> Any:
+    """Один проход по цепочке атрибутов / ключей dict.
+
+    ``_dig(appeal, "subject", "parent_subject", "name")`` вместо вложенных
+    ``getattr(getattr(...))``. Enum-значение на конце разворачивается в ``.value``.
+    """
+    for attr in attrs:
+        if obj is None:
+            return default
+        obj = obj.get(attr) if isinstance(obj, dict) else getattr(obj, attr, None)
+    if obj is None:
+        return default
+    return getattr(obj, "value", obj)
+
+
 class EdmsFormatter:
     """Утилиты для форматирования и безопасного извлечения атрибутов из доменных DTO."""
 
@@ -27,13 +44,16 @@ class EdmsFormatter:
         if not user:
             return None
         try:
-            ln = getattr(user, "lastName", "") or ""
-            fn = getattr(user, "firstName", "") or ""
-            mn = getattr(user, "middleName", "") or ""
-            post = getattr(user, "authorPost", "") or getattr(
-                getattr(user, "post", None), "name", ""
+            name = " ".join(
+                part
+                for part in (
+                    _dig(user, "last_name"),
+                    _dig(user, "first_name"),
+                    _dig(user, "middle_name"),
+                )
+                if part
             )
-            name = f"{ln} {fn} {mn}".strip()
+            post = _dig(user, "author_post") or _dig(user, "post", "post_name")
             return f"{name} ({post})" if post else name or None
         except Exception:
             return None
@@ -1,6 +1,7 @@
 # utils\file_utils.py
 import io
 import logging
+import zipfile
 
 logger = logging.getLogger(__name__)
 
@@ -13,26 +14,54 @@ except ImportError:
     PdfReader = None
 
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _is_docx_archive(file_bytes: bytes) -> bool:
+    try:
+        with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive:
+            archive.getinfo("word/document.xml")
+    except (zipfile.BadZipFile, KeyError):
+        return False
+    return True
+
+
+def _sniff_format(file_bytes: bytes) -> str | None:
+    """Определяет формат по сигнатуре первых байт (pdf / docx / txt)."""
+    head = file_bytes[:8]
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        # ZIP-контейнер — это и xlsx/odt: docx только при наличии word/document.xml
+        return "docx" if _is_docx_archive(file_bytes) else None
+    if head.startswith(_UTF8_BOM):
+        return "txt"
+    return None
+
+
 def extract_text_from_bytes(file_bytes: bytes, filename: str) -> str | None:
     """
     Извлекает текст из байтов файла (поддержка .docx, .pdf, .txt).
+
+    Формат определяется по сигнатуре содержимого, а расширение имени
+    используется только если сигнатура не распознана.
     """
     try:
         file_stream = io.BytesIO(file_bytes)
-        ext = filename.lower().split(".")[-1] if "." in filename else ""
+        ext = _sniff_format(file_bytes) or (
+            filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
+        )
 
         if ext == "pdf" and PdfReader:
             reader = PdfReader(file_stream)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
+            text = "".join(page.extract_text() or "" for page in reader.pages)
             return text.strip()
 
         elif ext == "docx" and docx2txt:
             return docx2txt.process(file_stream)
 
         elif ext == "txt":
-            return file_bytes.decode("utf-8", errors="ignore").strip()
+            return file_bytes.decode("utf-8-sig", errors="ignore").strip()
 
         else:
             logger.warning(f"Неподдерживаемый формат файла: {ext}")
@@ -3,6 +3,9 @@ import re
 from typing import Any
 
 
+_EMPTY_VALUES: tuple[Any, ...] = (None, [], {}, "")
+
+
 def clean_dict(d: Any) -> Any:
     """Recursively remove None, empty lists, empty dicts and empty strings.
 
@@ -11,15 +14,25 @@ def clean_dict(d: Any) -> Any:
     """
     if isinstance(d, dict):
         cleaned = {k: clean_dict(v) for k, v in d.items()}
-        cleaned = {k: v for k, v in cleaned.items() if v not in (None, [], {}, "")}
+        cleaned = {k: v for k, v in cleaned.items() if v not in _EMPTY_VALUES}
         return cleaned or None
     if isinstance(d, list):
         cleaned_list = [clean_dict(i) for i in d]
-        cleaned_list = [i for i in cleaned_list if i not in (None, [], {}, "")]
+        cleaned_list = [i for i in cleaned_list if i not in _EMPTY_VALUES]
         return cleaned_list or None
     return d
 
 
+def put_if_present(target: dict[str, Any], key: str, value: Any) -> None:
+    """Insert ``value`` unless it is None or an empty str/list/dict.
+
+    Lets callers build already-clean dicts in one pass instead of
+    post-filtering them with :func:`clean_dict`.
+    """
+    if value not in _EMPTY_VALUES:
+        target[key] = value
+
+
 def format_document_response(text_content: str) -> str:
     formatted_content = (
         text_content.replace(r"\n", "\n").replace(r"\t", "    ").replace(r"\"", '"')
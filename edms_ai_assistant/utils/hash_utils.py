@@ -9,3 +9,13 @@ def get_file_hash(file_path: str) -> str:
         for chunk in iter(lambda: f.read(4096), b""):
             hash_sha256.update(chunk)
     return hash_sha256.hexdigest()
+
+
+def get_token_fingerprint(token: str) -> str:
+    """Короткий SHA-256 отпечаток токена для ключей кэша (без хранения токена)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def get_text_fingerprint(text: str) -> str:
+    """Быстрый 128-битный BLAKE2b-отпечаток текста для ключей кэша."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
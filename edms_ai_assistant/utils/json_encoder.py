@@ -1,9 +1,14 @@
 # edms_ai_assistant/utils/json_encoder.py
+import functools
 import json
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 from enum import Enum
+from typing import Any
 from uuid import UUID
 
+import orjson
+
 
 class CustomJSONEncoder(json.JSONEncoder):
     """
@@ -44,3 +49,62 @@ class CustomJSONEncoder(json.JSONEncoder):
 
         # Fallback к стандартному encoder
         return json.JSONEncoder.default(self, obj)
+
+
+# UUID, datetime и Enum orjson сериализует нативно (в Rust); naive datetime
+# трактуется как UTC и, как в CustomJSONEncoder, получает суффикс "Z".
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback для типов, которые orjson не знает (Pydantic-модели)."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json_bytes(obj: Any) -> bytes:
+    """Сериализует ``obj`` в UTF-8 JSON (быстрая замена ``CustomJSONEncoder``).
+
+    Возвращает ``bytes`` — их можно сразу передать в HTTP-тело без decode.
+    """
+    return orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+
+def _orjson_default_str(obj: Any) -> Any:
+    """Как ``_orjson_default``, но неизвестные типы отдаёт через ``str()``."""
+    try:
+        return _orjson_default(obj)
+    except TypeError:
+        return str(obj)
+
+
+def dumps_json_str(obj: Any) -> str:
+    """Сериализует ``obj`` в однострочный JSON-текст через orjson.
+
+    Замена ``json.dumps(obj, ensure_ascii=False, default=str)`` для горячих
+    путей (SSE-кадры): кириллица пишется как есть, без экранирования.
+    """
+    return orjson.dumps(
+        obj, default=_orjson_default_str, option=_ORJSON_OPTIONS
+    ).decode()
+
+
+def returns_json_str[**P](
+    func: Callable[P, Awaitable[Any]],
+) -> Callable[P, Awaitable[str]]:
+    """Оборачивает корутину инструмента: результат сразу сериализуется orjson.
+
+    LangChain превращает dict-результат инструмента в ``ToolMessage`` через
+    встроенный ``json.dumps`` (а при UUID внутри — через ``str()``); готовая
+    строка передаётся как есть. ``functools.wraps`` сохраняет аннотации,
+    поэтому инъекция ``RunnableConfig`` продолжает работать.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
+        return dumps_json_str(await func(*args, **kwargs))
+
+    return wrapper
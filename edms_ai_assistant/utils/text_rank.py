@@ -0,0 +1,85 @@
+# edms_ai_assistant/utils/text_rank.py
+"""Локальный extractive-отбор предложений (TextRank без внешних зависимостей)."""
+
+from __future__ import annotations
+
+import math
+import re
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?;])\s+|\n{2,}")
+_WORD_RE = re.compile(r"\w{3,}")
+
+_DAMPING: float = 0.85
+_MAX_ITERATIONS: int = 50
+_TOLERANCE: float = 1e-6
+# Слишком короткие фрагменты (номера пунктов, «Приложение:») не ранжируем.
+_MIN_SENTENCE_CHARS: int = 20
+
+
+def split_sentences(text: str) -> list[str]:
+    """Грубое разбиение на предложения / абзацы с отбросом обрывков."""
+    sentences: list[str] = []
+    for piece in _SENTENCE_SPLIT_RE.split(text):
+        sentence = " ".join(piece.split())
+        if len(sentence) >= _MIN_SENTENCE_CHARS:
+            sentences.append(sentence)
+    return sentences
+
+
+def rank_sentences(text: str, top_k: int) -> list[str]:
+    """Возвращает ``top_k`` самых «центральных» предложений в порядке текста.
+
+    Граф предложений взвешивается пересечением словарей (метрика из
+    оригинального TextRank), веса вершин — PageRank степенным методом.
+    Пустой список — если текст слишком мал для осмысленного ранжирования.
+
+    Args:
+        text: Исходный текст.
+        top_k: Сколько предложений вернуть.
+
+    Returns:
+        Отобранные предложения в исходном порядке.
+    """
+    sentences = split_sentences(text)
+    n = len(sentences)
+    if n < 3 or top_k <= 0:
+        return []
+    if n <= top_k:
+        return sentences
+
+    words = [frozenset(_WORD_RE.findall(s.lower())) for s in sentences]
+    log_sizes = [math.log(len(w)) if len(w) > 1 else 0.0 for w in words]
+
+    edges: list[list[tuple[int, float]]] = [[] for _ in range(n)]
+    out_weight = [0.0] * n
+    for i in range(n):
+        if not log_sizes[i]:
+            continue
+        for j in range(i + 1, n):
+            if not log_sizes[j]:
+                continue
+            overlap = len(words[i] & words[j])
+            if not overlap:
+                continue
+            weight = overlap / (log_sizes[i] + log_sizes[j])
+            edges[i].append((j, weight))
+            edges[j].append((i, weight))
+            out_weight[i] += weight
+            out_weight[j] += weight
+
+    scores = [1.0] * n
+    base = 1.0 - _DAMPING
+    for _ in range(_MAX_ITERATIONS):
+        updated = [
+            base
+            + _DAMPING
+            * sum(scores[j] * w / out_weight[j] for j, w in edges[i])
+            for i in range(n)
+        ]
+        delta = max(abs(a - b) for a, b in zip(updated, scores, strict=True))
+        scores = updated
+        if delta < _TOLERANCE:
+            break
+
+    best = sorted(range(n), key=scores.__getitem__, reverse=True)[:top_k]
+    return [sentences[i] for i in sorted(best)]
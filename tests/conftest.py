@@ -0,0 +1,25 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from edms_ai_assistant.config import EdmsSettings
+
+
+@pytest.fixture
+def edms_settings():
+    return EdmsSettings(base_url="http://test", timeout=10, long_timeout=30)
+
+
+@pytest.fixture
+def json_response():
+    """Фабрика успешных ответов транспорта с JSON-телом."""
+
+    def _response(payload):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps(payload).encode()
+        response.json.return_value = payload
+        return response
+
+    return _response
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -42,7 +43,7 @@ async def test_appeal_autofill_logic():
         shortSummary="Жалоба на отопление"
     )
     mock_extraction.extract_appeal_fields = AsyncMock(return_value=extraction_result)
-    mock_doc_client.execute_document_operations = AsyncMock()
+    mock_doc_client.execute_document_operations_raw = AsyncMock()
     mock_ref_client.find_delivery_method = AsyncMock(return_value="delivery-id")
     mock_ref_client.find_citizen_type = AsyncMock(return_value="citizen-type-id")
     mock_ref_client.find_best_subject = AsyncMock(return_value="subject-id")
@@ -55,3 +56,11 @@ async def test_appeal_autofill_logic():
     assert result.status == "success"
     mock_doc_client.get_document_metadata.assert_called_once()
     mock_attach_client.get_attachment_content.assert_called_once()
+    mock_doc_client.execute_document_operations_raw.assert_awaited_once()
+    operations = json.loads(
+        mock_doc_client.execute_document_operations_raw.await_args.args[2]
+    )
+    assert [op["operationType"] for op in operations] == [
+        "DOCUMENT_MAIN_FIELDS_UPDATE",
+        "DOCUMENT_MAIN_FIELDS_APPEAL_UPDATE",
+    ]
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from edms_ai_assistant.clients.document_client import DocumentClient
+
+
+@pytest.mark.asyncio
+async def test_document_metadata_cached_until_document_is_modified(
+    json_response, edms_settings
+):
+    doc_id = str(uuid4())
+    transport = MagicMock()
+    transport.request = AsyncMock(return_value=json_response({"id": doc_id}))
+    client = DocumentClient(transport, edms_settings)
+
+    first = await client.get_document_metadata("token", doc_id)
+    second = await client.get_document_metadata("token", doc_id)
+    assert first is second
+    assert transport.request.await_count == 1
+
+    # Другой токен не получает чужой кэш
+    await client.get_document_metadata("other-token", doc_id)
+    assert transport.request.await_count == 2
+
+    await client.execute_document_operations("other-token", doc_id, [])
+    await client.get_document_metadata("other-token", doc_id)
+    assert transport.request.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_document_versions_sorted_and_cached(json_response, edms_settings):
+    doc_id = str(uuid4())
+    transport = MagicMock()
+    transport.request = AsyncMock(
+        return_value=json_response(
+            [
+                {"version": 2, "documentId": str(uuid4())},
+                {"version": 1, "documentId": str(uuid4())},
+            ]
+        )
+    )
+    client = DocumentClient(transport, edms_settings)
+
+    first = await client.get_document_versions("token", doc_id)
+    second = await client.get_document_versions("token", doc_id)
+
+    assert [v.version for v in first] == [1, 2]
+    assert second == first
+    assert transport.request.await_count == 1
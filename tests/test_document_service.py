@@ -31,8 +31,8 @@ async def test_document_service_get_analysis():
     # 6. Save analysis to cache
 
     mock_doc_client.get_document_metadata = AsyncMock(return_value=doc_dto)
-    # Enricher should return a dict that can be validated as DocumentDto
-    mock_enricher.enrich = AsyncMock(return_value=doc_dto.model_dump(by_alias=True))
+    # Enricher works on the DTO directly and returns a DocumentDto
+    mock_enricher.enrich = AsyncMock(return_value=doc_dto)
     # NLP processing returns the final analysis dict
     mock_nlp.process_document = MagicMock(return_value={"nlp_result": "ok"})
     mock_redis.get = AsyncMock(return_value=None)
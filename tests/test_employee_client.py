@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from edms_ai_assistant.clients.employee_client import EmployeeClient
+
+
+@pytest.mark.asyncio
+async def test_search_employees_post_is_cached_until_write(
+    json_response, edms_settings
+):
+    employee = {"id": str(uuid4()), "lastName": "Иванов"}
+    transport = MagicMock()
+    transport.request = AsyncMock(
+        side_effect=[
+            json_response([employee]),
+            json_response({}),
+            json_response([employee]),
+        ]
+    )
+    client = EmployeeClient(transport, edms_settings)
+
+    first = await client.search_employees_post("token", {"lastName": "Иванов"})
+    second = await client.search_employees_post("token", {"lastName": "Иванов"})
+    assert second == first
+    assert transport.request.await_count == 1
+
+    await client.recover_employee("token", employee["id"])
+    await client.search_employees_post("token", {"lastName": "Иванов"})
+    assert transport.request.await_count == 3
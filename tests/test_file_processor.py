@@ -0,0 +1,54 @@
+import asyncio
+import os
+import signal
+import time
+from pathlib import Path
+
+import pytest
+
+from edms_ai_assistant.services.file_processor import FileProcessorService
+
+
+def _touch_after_delay(marker: str) -> None:
+    time.sleep(1.5)
+    Path(marker).touch()
+
+
+@pytest.fixture
+def process_service():
+    service = FileProcessorService(process_workers=1)
+    previous = FileProcessorService._default_instance
+    FileProcessorService.set_default_instance(service)
+    yield service
+    FileProcessorService._default_instance = previous
+    service.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_parser_timeout_terminates_and_replaces_worker(
+    process_service, tmp_path
+):
+    # Прогрев без лимита: запуск spawn-воркера не должен съедать таймаут.
+    first_pid = await FileProcessorService._run_parser(os.getpid)
+    hung_pool = process_service._process_pool
+    process_service._parse_timeout = 0.5
+    marker = tmp_path / "finished"
+
+    with pytest.raises(TimeoutError):
+        await FileProcessorService._run_parser(_touch_after_delay, str(marker))
+
+    # Зависший воркер убит: до записи маркера он не доживает.
+    await asyncio.sleep(2)
+    assert not marker.exists()
+    assert process_service._process_pool is not hung_pool
+
+    process_service._parse_timeout = None
+    assert await FileProcessorService._run_parser(os.getpid) != first_pid
+
+
+@pytest.mark.asyncio
+async def test_run_parser_retries_once_after_worker_crash(process_service):
+    crashed_pid = await FileProcessorService._run_parser(os.getpid)
+    os.kill(crashed_pid, signal.SIGKILL)
+
+    assert await FileProcessorService._run_parser(os.getpid) != crashed_pid
@@ -0,0 +1,28 @@
+import io
+import logging
+import zipfile
+
+from edms_ai_assistant.utils.file_utils import extract_text_from_bytes
+
+
+def test_extract_text_routes_by_signature_not_name():
+    data = "\ufeffОбращение гражданина".encode()
+
+    assert extract_text_from_bytes(data, "scan.pdf") == "Обращение гражданина"
+
+
+def test_extract_text_falls_back_to_extension():
+    assert extract_text_from_bytes(b"plain text", "note.txt") == "plain text"
+    assert extract_text_from_bytes(b"\x00\x01", "image.tiff") is None
+
+
+def test_extract_text_does_not_route_other_zip_containers_to_docx(caplog):
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as archive:
+        archive.writestr("xl/workbook.xml", "<workbook/>")
+
+    with caplog.at_level(logging.WARNING):
+        assert extract_text_from_bytes(payload.getvalue(), "report.xlsx") is None
+
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
+    assert "xlsx" in caplog.text
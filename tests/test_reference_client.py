@@ -0,0 +1,28 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+from edms_ai_assistant.clients.reference_client import ReferenceClient
+
+
+@pytest.mark.asyncio
+async def test_find_entity_with_name_is_cached_by_normalized_name(
+    json_response, edms_settings
+):
+    entity_id = str(uuid4())
+    transport = MagicMock()
+    transport.request = AsyncMock(
+        side_effect=[
+            json_response([{"id": entity_id, "name": "Курьер"}]),
+            json_response({"id": entity_id, "name": "Курьер"}),
+        ]
+    )
+    client = ReferenceClient(transport, edms_settings)
+
+    first = await client.find_entity_with_name("token-a", "delivery-method", "Курьер")
+    second = await client.find_entity_with_name(
+        "token-b", "delivery-method", "  курьер "
+    )
+
+    assert first is not None and str(first.id) == entity_id
+    assert second == first
+    assert transport.request.await_count == 2
@@ -52,3 +52,15 @@ async def test_resolve_departments():
     assert len(found_ids) == 1
     assert total == 1
     mock_dep_client.find_by_name.assert_called_once()
+
+
+def test_format_user_reads_dto_fields():
+    from edms_ai_assistant.domain.employee import PostDto
+    from edms_ai_assistant.utils.edms_formatter import EdmsFormatter
+
+    emp = EmployeeDto(
+        first_name="Иван", last_name="Петров", post=PostDto(post_name="Инженер")
+    )
+
+    assert EdmsFormatter.format_user(emp) == "Петров Иван (Инженер)"
+    assert EdmsFormatter.format_user(EmployeeDto()) is None
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from edms_ai_assistant.tools.summarization import create_doc_summarize_text_tool
+
+DOCUMENT = "Договор поставки оборудования заключён сторонами на один год. " * 5
+
+
+class _ScriptedChatModel:
+    """Первый вызов зависает до отмены, последующие сразу отвечают."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.first_started = asyncio.Event()
+
+    async def astream(self, messages, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            self.first_started.set()
+            await asyncio.Event().wait()
+        yield AIMessageChunk(content="Краткое изложение.")
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_when_fallback_owner_is_cancelled():
+    model = _ScriptedChatModel()
+    tool = create_doc_summarize_text_tool(None, model)
+    args = {"text": DOCUMENT, "summary_type": "abstractive"}
+
+    owner = asyncio.create_task(tool.ainvoke(args))
+    await model.first_started.wait()
+    waiter = asyncio.create_task(tool.ainvoke(args))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    result = await waiter
+
+    assert result["status"] == "success"
+    assert result["content"] == "Краткое изложение."
+    assert model.calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await owner
@@ -0,0 +1,21 @@
+from edms_ai_assistant.utils.text_rank import rank_sentences
+
+
+def test_rank_sentences_keeps_document_order_and_central_sentences():
+    text = (
+        "Договор поставки заключён между ООО Ромашка и ООО Василёк. "
+        "Сумма договора поставки составляет 100 000 рублей. "
+        "Погода в день подписания была солнечной и тёплой. "
+        "Поставка по договору осуществляется до 1 декабря. "
+        "Оплата по договору поставки производится в течение 10 дней."
+    )
+
+    picked = rank_sentences(text, top_k=3)
+
+    assert len(picked) == 3
+    assert all("договор" in s.lower() for s in picked)
+    assert picked == sorted(picked, key=text.index)
+
+
+def test_rank_sentences_returns_empty_for_tiny_text():
+    assert rank_sentences("Одно предложение без соседей.", top_k=3) == []
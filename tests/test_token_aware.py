@@ -0,0 +1,64 @@
+import string
+
+import pytest
+
+from edms_ai_assistant.summarizer.chunking import token_aware
+from edms_ai_assistant.summarizer.chunking.token_aware import (
+    CharRatioTokenCounter,
+    TiktokenCounter,
+    truncate_head_tail_tokens,
+)
+
+TEXT = string.ascii_lowercase * 40  # 1040 символов
+
+
+class _CharEncoder:
+    """Один символ — один токен: границы обрезки проверяются точно."""
+
+    def encode(self, text, disallowed_special=()):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+@pytest.fixture
+def char_tiktoken(monkeypatch):
+    monkeypatch.setattr(TiktokenCounter, "_encoding", _CharEncoder())
+    return TiktokenCounter()
+
+
+def test_tiktoken_head_tail_keeps_both_ends(char_tiktoken):
+    result = char_tiktoken.truncate_head_tail(TEXT, 6, 3, "|")
+    assert result == TEXT[:6] + "|" + TEXT[-3:]
+
+
+def test_tiktoken_head_tail_with_zero_tail_is_head_only(char_tiktoken):
+    result = char_tiktoken.truncate_head_tail(TEXT, 100, 0, "|")
+    assert result == TEXT[:100] + "|"
+
+
+def test_tiktoken_head_tail_returns_short_text_unchanged(char_tiktoken):
+    assert char_tiktoken.truncate_head_tail("abc", 6, 3, "|") == "abc"
+
+
+def test_char_ratio_head_tail_bounds():
+    counter = CharRatioTokenCounter()
+    assert counter.truncate_head_tail("abc", 6, 3, "|") == "abc"
+
+    with_tail = counter.truncate_head_tail(TEXT, 30, 15, "|")
+    head, tail = with_tail.split("|")
+    assert TEXT.startswith(head) and TEXT.endswith(tail)
+    assert len(head) > len(tail) > 0
+
+    head_only = counter.truncate_head_tail(TEXT, 30, 0, "|")
+    assert head_only.endswith("|") and len(head_only) < len(TEXT)
+
+
+def test_truncate_head_tail_tokens_gives_tail_a_third(monkeypatch, char_tiktoken):
+    monkeypatch.setattr(token_aware, "get_token_counter", lambda: char_tiktoken)
+
+    result = truncate_head_tail_tokens(TEXT, 9, separator="|")
+
+    assert result == TEXT[:6] + "|" + TEXT[-3:]
+    assert truncate_head_tail_tokens("short", 9, separator="|") == "short"
@@ -0,0 +1,20 @@
+import pytest
+
+from edms_ai_assistant.agent import ui_directive
+from edms_ai_assistant.agent.ui_directive import astream_with_preview
+
+
+@pytest.mark.asyncio
+async def test_astream_with_preview_emits_accumulated_text(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(ui_directive, "emit_ui", emitted.append)
+
+    async def pieces():
+        for piece in ("ab", "cd", "ef", "g"):
+            yield piece
+
+    text = await astream_with_preview(pieces(), "SummarizationPreview", emit_every=4)
+
+    assert text == "abcdefg"
+    assert [d.props["text"] for d in emitted] == ["abcd"]
+    assert emitted[0].component == "SummarizationPreview"
@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -45,3 +46,20 @@ async def test_doc_process_action_agreement(mock_deps):
     assert result["status"] == "success"
     assert "успешно выполнено" in result["message"]
     mock_deps.document_process_client.agreement.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_task_create_tool_reports_bad_deadline_in_tool_contract(mock_deps):
+    from edms_ai_assistant.tools.task import create_task_tool
+
+    tool = create_task_tool(mock_deps)
+
+    result = json.loads(
+        await tool.ainvoke(
+            {"task_text": "Подготовить отчёт", "planed_date_end": "31.12.2026"}
+        )
+    )
+
+    assert result["status"] == "error"
+    assert result["message"].startswith("Неверный формат даты")
+    mock_deps.task_service.create_task_by_employee_ids.assert_not_called()